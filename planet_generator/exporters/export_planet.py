@@ -4,6 +4,7 @@ import os
 import argparse
 import joblib
 from logger.logger import LoggerFactory
+from planet_generator.io.planet_io import PlanetIO
 
 
 class PlanetExporter:
@@ -59,13 +60,18 @@ class PlanetExporter:
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Export a PlanetMesh to .OBJ format")
-    parser.add_argument("input_mesh", type=str, help="Path to the saved planet mesh file (.mesh)")
+    parser.add_argument("input_mesh", type=str, help="Path to a saved planet folder or planet mesh file (.mesh)")
     parser.add_argument("--output", type=str, default="planet.obj", help="Name of the output .obj file")
     parser.add_argument("--normals", action="store_true", help="Include per-face normals in the export")
     args = parser.parse_args()
 
-    # Load mesh from file using joblib
-    mesh = joblib.load(args.input_mesh)
+    # Load mesh from a planet folder (re-attaching shared topology) or a standalone joblib file
+    if os.path.isdir(args.input_mesh):
+        mesh = PlanetIO.load_mesh(args.input_mesh)
+    elif os.path.basename(args.input_mesh) == "mesh.joblib":
+        mesh = PlanetIO.load_mesh(os.path.dirname(args.input_mesh))
+    else:
+        mesh = joblib.load(args.input_mesh)
 
     # Export to OBJ
     exporter = PlanetExporter(mesh)
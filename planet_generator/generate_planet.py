@@ -1,14 +1,19 @@
 # /planet_generator/generate_planet.py
 
 from planet_generator.planet_config import PLANET_CONFIG
-from planet_generator.geometry.icosphere import IcosphereGenerator
-from planet_generator.geometry.adjacency import build_face_adjacency
-from planet_generator.geometry.face_geometry import compute_face_geometry
-from planet_generator.planet_utils.mesh_tools import validate_vertex_distances, summarize_mesh_geometry
+from planet_generator.geometry.face_geometry import FaceGeometry, compute_face_geometry
+from planet_generator.planet_utils.mesh_tools import validate_mesh, summarize_mesh_geometry
 from planet_generator.planet_mesh import PlanetMesh
 from planet_generator.io.planet_io import Planet, PlanetIO
+from planet_generator.io.topology_store import TopologyStore
+from planet_generator.io.chunk_store import CodecSpec
+from planet_generator.io.mesh_stream import stream_planet_mesh, open_streamed_mesh, DEFAULT_MAX_CHUNK_FACES
 from logger.logger import LoggerFactory
+from planet_generator.planet_utils.resource_planner import (
+    estimate_generation, log_estimate, record_benchmark_run, peak_rss_bytes
+)
 import argparse
+import time
 import os
 
 
@@ -16,15 +21,26 @@ def main():
     """
     Entry point for procedural planet generation.
     Initializes config, logger, and starts mesh generation with debug info.
-    Accepts optional command-line arguments for radius, subdivisions, planet name, and seed.
+    Accepts optional command-line arguments for radius, subdivisions (or geodesic frequency), planet name, and seed.
     If not provided, values from PLANET_CONFIG are used.
     """
     parser = argparse.ArgumentParser(description="TVG Planet Generator")
     parser.add_argument("--radius", type=float, help="Planet radius in kilometers")
     parser.add_argument("--subdivisions", type=int, help="Icosphere subdivision level")
+    parser.add_argument("--frequency", type=int, help="Geodesic frequency; builds the grid directly instead of subdividing")
+    parser.add_argument("--workers", type=int, help="Build a new icosphere topology in parallel with this many processes")
+    parser.add_argument("--stream", action="store_true", help="Stream the mesh into memory-mapped files chunk by chunk (automatic for large subdivision levels)")
+    parser.add_argument("--force", action="store_true", help="Generate even if the resource estimate exceeds the memory budget")
+    parser.add_argument("--codec", type=str, default=PLANET_CONFIG.get("save_codec"),
+                        help="Save codec spec, e.g. zlib-1 or delta+shuffle+lzma-6 (default: raw .npy arrays)")
     parser.add_argument("--name", type=str, default="UnnamedPlanet", help="Planet name")
     parser.add_argument("--seed", type=int, default=42, help="Seed for random generation")
     args = parser.parse_args()
+    if args.codec is not None:
+        try:
+            CodecSpec.parse(args.codec)
+        except ValueError as e:
+            parser.error(str(e))
 
     logger = LoggerFactory("PlanetGen").get_logger()
     logger.info("Starting planet generation...")
@@ -32,45 +48,93 @@ def main():
     # Step 1: Load config values from CLI or fallback to planet_config.py
     radius = args.radius if args.radius is not None else PLANET_CONFIG.get("planet_radius")
     subdivisions = args.subdivisions if args.subdivisions is not None else PLANET_CONFIG.get("subdivisions")
+    frequency = args.frequency
     planet_name = args.name
     seed = args.seed
 
     logger.info(f"Planet name: {planet_name}")
     logger.info(f"Seed: {seed}")
     logger.info(f"Planet radius: {radius:,} km")
-    logger.info(f"Icosphere subdivisions: {subdivisions:,}")
+    if frequency is not None:
+        logger.info(f"Geodesic frequency: {frequency:,}")
+    else:
+        logger.info(f"Icosphere subdivisions: {subdivisions:,}")
 
-    # Step 2: Generate mesh
-    generator = IcosphereGenerator(radius, subdivisions)
-    vertices, faces = generator.generate()
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    planet_folder = os.path.join(root_dir, "gamedata", "planets", planet_name)
+
+    # Large recursive meshes do not fit in memory: stream them to disk one base-face chunk at a time
+    stream = args.stream or (frequency is None and subdivisions >= PLANET_CONFIG.get("stream_subdivisions", 10))
+    if stream and frequency is not None:
+        parser.error("--stream is only available for recursive subdivision")
+
+    # Preflight: predict memory, disk and time before allocating anything
+    estimate = estimate_generation(subdivisions, frequency, stream=stream, output_dir=root_dir)
+    log_estimate(estimate, logger)
+    if estimate.status == "refuse" and not args.force:
+        logger.error("Refusing to generate this planet; use a lower subdivision level, or --force to run anyway.")
+        raise SystemExit(2)
+
+    base_rss = peak_rss_bytes()
+    stage_seconds = {}
+    stage_start = time.perf_counter()
+
+    def end_stage(name):
+        nonlocal stage_start
+        now = time.perf_counter()
+        stage_seconds[name] = now - stage_start
+        stage_start = now
+
+    if stream:
+        logger.info("Streaming mode: mesh arrays are written to memory-mapped files")
+        stream_planet_mesh(planet_folder, radius, subdivisions)
+        mesh = open_streamed_mesh(planet_folder)
+        logger.info(f"Mesh generated with {len(mesh.vertices):,} vertices and {len(mesh.faces):,} faces.")
+        end_stage("stream")
+        planet = Planet(name=planet_name, seed=seed, mesh=mesh)
+        PlanetIO.save(planet, planet_folder, codec=args.codec)
+        end_stage("save")
+        record_benchmark_run("streamed", len(mesh.faces), stage_seconds, peak_rss_bytes(), base_rss,
+                             chunk_faces=min(DEFAULT_MAX_CHUNK_FACES, len(mesh.faces)))
+        logger.info("Planet generation complete.")
+        return
+
+    # Step 2: Generate mesh (topology is shared across planets; only positions scale with radius)
+    topology = TopologyStore().get_or_build(subdivisions, frequency, workers=args.workers)
+    vertices = topology.scaled_vertices(radius)
+    faces = topology.faces
 
     logger.info(f"Mesh generated with {len(vertices):,} vertices and {len(faces):,} faces.")
     v0 = vertices[0]
     logger.debug("Sample vertex: %.3f, %.3f, %.3f" % (float(v0[0]), float(v0[1]), float(v0[2])))
     logger.debug("Sample face: %s" % str(faces[0]))
 
-    # Step 3: Validate distances
+    # Step 3: Validate the mesh (radius, manifold edges, winding, degenerate faces, valence)
     epsilon = 1e-3
-    validate_vertex_distances(vertices, radius, epsilon, logger)
-
-    # Step 4: Build face adjacency map
-    adjacency = build_face_adjacency(faces)
-    logger.info(f"Adjacency map built for {len(adjacency):,} faces.")
-    logger.debug(f"Sample adjacency (face 0): {sorted(adjacency[0])}")
-
-    # Step 5: Compute face geometry
-    face_geometry = compute_face_geometry(vertices, faces)
-    logger.info("Computed face centers, normals, areas, slopes, and coordinates.")
-    logger.debug("Sample center (face 0): %.3f, %.3f, %.3f" % (float(face_geometry.centers[0][0]), float(face_geometry.centers[0][1]), float(face_geometry.centers[0][2])))
-    n0 = face_geometry.normals[0]
+    validate_mesh(vertices, faces, radius, epsilon, logger)
+    end_stage("mesh")
+
+    # Step 4: Face adjacency (neighbor across each edge) from the shared topology
+    adjacency = topology.adjacency
+    logger.info(f"Adjacency array loaded for {len(adjacency):,} faces.")
+    logger.debug(f"Sample adjacency (face 0): {adjacency[0].tolist()}")
+    end_stage("adjacency")
+
+    # Step 5: Face geometry, computed lazily per field (only areas are needed here)
+    face_geometry = FaceGeometry(vertices=vertices, faces=faces)
+    sample = compute_face_geometry(vertices, faces, face_indices=[0])
+    logger.info("Face geometry is computed per field on first use.")
+    logger.debug("Sample center (face 0): %.3f, %.3f, %.3f" % (float(sample.centers[0][0]), float(sample.centers[0][1]), float(sample.centers[0][2])))
+    n0 = sample.normals[0]
     logger.debug("Sample normal (face 0): %.3f, %.3f, %.3f" % (float(n0[0]), float(n0[1]), float(n0[2])))
-    logger.debug("Sample area (face 0): %.6f" % float(face_geometry.areas[0]))
-    logger.debug("Sample slope (face 0): %.2f°" % float(face_geometry.slopes[0]))
-    logger.debug("Sample lat/lon (face 0): %.2f°, %.2f°" % (float(face_geometry.latitudes[0]), float(face_geometry.longitudes[0])))
+    logger.debug("Sample area (face 0): %.6f" % float(sample.areas[0]))
+    logger.debug("Sample slope (face 0): %.2f°" % float(sample.slopes[0]))
+    logger.debug("Sample lat/lon (face 0): %.2f°, %.2f°" % (float(sample.latitudes[0]), float(sample.longitudes[0])))
 
     logger.info("Planet generation complete.")
 
     summarize_mesh_geometry(radius, face_geometry.areas, logger)
+    end_stage("face_geometry")
 
     # Step 6: Construct PlanetMesh
     mesh = PlanetMesh(
@@ -78,7 +142,15 @@ def main():
         vertices=vertices,
         faces=faces,
         face_geometry=face_geometry,
-        face_adjacency=adjacency
+        face_adjacency=adjacency,
+        subdivisions=topology.subdivisions,
+        frequency=topology.frequency,
+        topology_key=topology.key,
+        mesh_indexes={
+            "vertex_faces": topology.vertex_faces,
+            "vertex_vertices": topology.vertex_vertices,
+            "face_ring": topology.face_ring,
+        }
     )
 
     # Step 7: Create Planet wrapper object
@@ -89,9 +161,9 @@ def main():
     )
 
     # Step 8: Save the full planet using PlanetIO
-    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    planet_folder = os.path.join(root_dir, "gamedata", "planets", planet.name)
-    PlanetIO.save(planet, planet_folder)
+    PlanetIO.save(planet, planet_folder, codec=args.codec)
+    end_stage("save")
+    record_benchmark_run("memory", len(faces), stage_seconds, peak_rss_bytes(), base_rss)
 
 
 if __name__ == "__main__":
@@ -1,36 +1,201 @@
 # planet_generator/geometry/adjacency.py
 
-from typing import List, Tuple, Dict, Set
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Dict, Set, Iterator
 import numpy as np
 
 
+def index_dtype(max_index: int) -> type:
+    """
+    Smallest integer dtype that holds indices up to max_index: int32, or int64 past 2^31 - 1.
+    """
+    return np.int32 if max_index < 2 ** 31 else np.int64
+
+
+def build_face_adjacency_array(faces: np.ndarray) -> np.ndarray:
+    """
+    Builds the edge-ordered face adjacency of a triangle mesh with a vectorized edge match.
+
+    Column k of a face holds the neighbor across its edge k, the edge from corner k to corner
+    k+1 (mod 3). Edges are matched by sorting their (low, high) vertex keys: on a manifold mesh
+    each key appears exactly twice, and the two copies end up next to each other.
+    Edges without a partner (open meshes) get -1.
+
+    :param faces: Mx3 array of triangle vertex indices
+    :return: Mx3 array of neighbor face indices, in edge order (int32 unless M exceeds 2^31)
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    m = len(faces)
+    starts = faces.reshape(-1)
+    ends = faces[:, [1, 2, 0]].reshape(-1)
+    keys = np.minimum(starts, ends) * (int(faces.max(initial=0)) + 1) + np.maximum(starts, ends)
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    paired = np.flatnonzero(sorted_keys[1:] == sorted_keys[:-1])
+    if len(paired) > 1 and np.any(np.diff(paired) < 2):
+        raise ValueError("Mesh is not manifold: an edge is shared by more than two faces")
+
+    neighbors = np.full(3 * m, -1, dtype=index_dtype(m - 1))
+    first, second = order[paired], order[paired + 1]
+    neighbors[first] = second // 3
+    neighbors[second] = first // 3
+    return neighbors.reshape(m, 3)
+
+
+def face_adjacency_from_twins(twins: np.ndarray) -> np.ndarray:
+    """
+    Converts a half-edge twin table into the edge-ordered face adjacency array.
+    Half-edge 3 * face + slot is edge `slot` of `face`, so the neighbor across it is twin // 3.
+
+    :param twins: Mx3 array of flat half-edge indices, as produced during subdivision
+                  (or a slice of one, whose entries still index the whole mesh)
+    :return: Mx3 array of neighbor face indices, in edge order (int32 unless a face index exceeds 2^31 - 1)
+    """
+    neighbors = np.asarray(twins).reshape(-1, 3) // 3
+    return neighbors.astype(index_dtype(int(neighbors.max(initial=0))), copy=False)
+
+
 def build_face_adjacency(faces: np.ndarray) -> Dict[int, Set[int]]:
     """
     Constructs a face adjacency map from a list of triangular faces.
 
     Each face is connected to 3 neighboring faces that share an edge with it.
     The resulting adjacency map is a dictionary where each key is a face index
-    and the value is a set of neighboring face indices.
+    and the value is a set of neighboring face indices. Prefer build_face_adjacency_array,
+    which this is built from; the dictionary form is kept for existing callers.
 
     :param faces: List of triangle indices (triplets of vertex indices)
     :return: Dictionary mapping face index to a set of adjacent face indices
     """
-    edge_map: Dict[Tuple[int, int], List[int]] = {}
-    adjacency_map: Dict[int, Set[int]] = {i: set() for i in range(len(faces))}
-
-    for i, (a, b, c) in enumerate(faces):
-        edges = [(a, b), (b, c), (c, a)]
-        for v1, v2 in edges:
-            v_low, v_high = sorted((v1, v2))
-            key: Tuple[int, int] = (v_low, v_high)
-            if key not in edge_map:
-                edge_map[key] = []
-            edge_map[key].append(i)
-
-    for edge, face_list in edge_map.items():
-        if len(face_list) == 2:
-            f1, f2 = face_list
-            adjacency_map[f1].add(f2)
-            adjacency_map[f2].add(f1)
-
-    return adjacency_map
+    return face_adjacency_from_array(build_face_adjacency_array(faces))
+
+
+def face_adjacency_from_array(neighbors: np.ndarray) -> Dict[int, Set[int]]:
+    """
+    Expands an (m, 3) neighbor array back into the dictionary form returned by
+    build_face_adjacency.
+
+    :param neighbors: Mx3 array of neighbor face indices (-1 for none)
+    :return: Dictionary mapping face index to a set of adjacent face indices
+    """
+    return {i: {n for n in row if n >= 0} for i, row in enumerate(np.asarray(neighbors).tolist())}
+
+
+class FaceAdjacencyMap(Mapping):
+    """
+    Read-only dictionary view of an (m, 3) adjacency array, for callers written against the
+    old Dict[int, Set[int]] adjacency: adjacency_map[face] returns the set of neighbors,
+    and .get(), len(), iteration and .items() behave like the dictionary did.
+    Nothing is expanded up front; sets are built per lookup.
+    """
+
+    def __init__(self, neighbors: np.ndarray):
+        self.neighbors = neighbors
+
+    def __getitem__(self, face: int) -> Set[int]:
+        if not 0 <= face < len(self.neighbors):
+            raise KeyError(face)
+        return {int(n) for n in self.neighbors[face] if n >= 0}
+
+    def __len__(self) -> int:
+        return len(self.neighbors)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.neighbors)))
+
+    def __contains__(self, face) -> bool:
+        return isinstance(face, (int, np.integer)) and 0 <= face < len(self.neighbors)
+
+
+@dataclass
+class CSRIndex:
+    """
+    Compressed sparse row index: the entries of row i are indices[offsets[i]:offsets[i + 1]].
+    Used for variable-length relations such as vertex -> faces, where a dict of lists would
+    hold one Python object per entry.
+    """
+    offsets: np.ndarray  # shape (rows + 1,), int64
+    indices: np.ndarray  # shape (offsets[-1],), int32 (int64 for indices past 2^31 - 1)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, i: int) -> np.ndarray:
+        """
+        Returns the entries of row i.
+        """
+        return self.indices[self.offsets[i]:self.offsets[i + 1]]
+
+    def counts(self) -> np.ndarray:
+        """
+        Returns the number of entries of every row.
+        """
+        return np.diff(self.offsets)
+
+
+def _csr_from_pairs(rows: np.ndarray, values: np.ndarray, n_rows: int, unique: bool = False) -> CSRIndex:
+    """
+    Builds a CSR index from (row, value) pairs, with each row's values in ascending order.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    values = np.asarray(values, dtype=np.int64)
+    base = int(values.max(initial=0)) + 1
+    keys = np.sort(rows * base + values)
+    if unique:
+        # Sort-and-mask; np.unique is much slower on large integer arrays
+        keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])]
+    rows, values = np.divmod(keys, base)
+    offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=offsets[1:])
+    return CSRIndex(offsets=offsets, indices=values.astype(index_dtype(base - 1)))
+
+
+def build_vertex_face_index(faces: np.ndarray, n_vertices: int) -> CSRIndex:
+    """
+    Builds the vertex -> faces index: for every vertex, the faces that use it, ascending.
+
+    :param faces: Mx3 array of triangle vertex indices
+    :param n_vertices: Number of vertices
+    """
+    faces = np.asarray(faces)
+    counts = np.bincount(faces.reshape(-1), minlength=n_vertices)
+    offsets = np.zeros(n_vertices + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    # A stable sort of the corner list by vertex keeps each vertex's faces in ascending order
+    indices = (np.argsort(faces.reshape(-1), kind="stable") // 3).astype(index_dtype(len(faces) - 1))
+    return CSRIndex(offsets=offsets, indices=indices)
+
+
+def build_vertex_vertex_index(faces: np.ndarray, n_vertices: int) -> CSRIndex:
+    """
+    Builds the vertex -> vertices index: for every vertex, the vertices it shares an edge with, ascending.
+
+    :param faces: Mx3 array of triangle vertex indices
+    :param n_vertices: Number of vertices
+    """
+    faces = np.asarray(faces)
+    starts = faces.reshape(-1)
+    ends = faces[:, [1, 2, 0]].reshape(-1)
+    # Both directions, so open meshes are handled too; duplicates are merged
+    return _csr_from_pairs(np.concatenate([starts, ends]), np.concatenate([ends, starts]), n_vertices, unique=True)
+
+
+def build_face_ring_index(faces: np.ndarray, vertex_faces: CSRIndex) -> CSRIndex:
+    """
+    Builds the face ring index: for every face, the other faces that share at least one of its
+    vertices (12 around a regular face, fewer next to a pentagon vertex), ascending.
+
+    :param faces: Mx3 array of triangle vertex indices
+    :param vertex_faces: Vertex -> faces index of the same mesh
+    """
+    faces = np.asarray(faces)
+    corners = faces.reshape(-1)
+    counts = vertex_faces.counts()[corners]
+    # Expand each corner into the faces around its vertex
+    owner = np.repeat(np.arange(len(corners)) // 3, counts)
+    starts = np.repeat(vertex_faces.offsets[corners] - np.cumsum(counts) + counts, counts)
+    others = vertex_faces.indices[starts + np.arange(len(owner))]
+    keep = others != owner
+    return _csr_from_pairs(owner[keep], others[keep], len(faces), unique=True)
@@ -1,88 +1,298 @@
 # planet_generator/geometry/face_geometry.py
 
-import math
 import numpy as np
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Union
+
+# Per-face geometry fields, in the order face_geometry_arrays() returns them
+FACE_GEOMETRY_FIELDS = ("centers", "normals", "areas", "latitudes", "longitudes", "slopes")
+
+# Faces per chunk when computing geometry: bounds the float64 temporaries to a few hundred MB
+DEFAULT_CHUNK_FACES = 1 << 20
+
+
+class _LazyField:
+    """
+    Descriptor for one FaceGeometry field: reads go through FaceGeometry.get().
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, geometry, owner=None):
+        return self if geometry is None else geometry.get(self.name)
+
+    def __set__(self, geometry, value):
+        geometry.set(self.name, value)
 
 
-@dataclass
 class FaceGeometry:
-    centers: np.ndarray  # shape (n, 3)
-    normals: np.ndarray  # shape (n, 3)
-    areas: np.ndarray    # shape (n,)
-    latitudes: np.ndarray  # shape (n,)
-    longitudes: np.ndarray  # shape (n,)
-    slopes: np.ndarray     # shape (n,)
+    """
+    Per-face geometry arrays, evaluated lazily.
+
+    A field that was not given is, on first access, memory-mapped from its persisted .npy
+    file or read by its loader (if one is registered in sources) or computed from the bound vertices and faces,
+    then memoized. Fields that can be rebuilt this way can be dropped to free memory and are
+    left out when pickling, so only what a consumer touches is ever computed or stored.
+    Fields replaced with set() are pinned: they are never dropped, trimmed or left out.
+    """
+    centers = _LazyField()      # shape (n, 3)
+    normals = _LazyField()      # shape (n, 3)
+    areas = _LazyField()        # shape (n,)
+    latitudes = _LazyField()    # shape (n,)
+    longitudes = _LazyField()   # shape (n,)
+    slopes = _LazyField()       # shape (n,)
+
+    def __init__(
+        self,
+        centers: Optional[np.ndarray] = None,
+        normals: Optional[np.ndarray] = None,
+        areas: Optional[np.ndarray] = None,
+        latitudes: Optional[np.ndarray] = None,
+        longitudes: Optional[np.ndarray] = None,
+        slopes: Optional[np.ndarray] = None,
+        vertices: Optional[np.ndarray] = None,
+        faces: Optional[np.ndarray] = None,
+        sources: Optional[Dict[str, Union[str, Callable[[], np.ndarray]]]] = None,
+        mmap_mode: Optional[str] = "r"
+    ):
+        """
+        :param centers: Optional precomputed arrays (likewise normals, areas, latitudes, longitudes, slopes)
+        :param vertices: Nx3 vertex positions to compute missing fields from
+        :param faces: Mx3 triangle vertex indices to compute missing fields from
+        :param sources: Field name -> path of a persisted .npy array backing that field, or a
+                        loader returning it (e.g. for a compressed file)
+        :param mmap_mode: numpy memory-map mode for persisted fields (None reads them into memory)
+        """
+        given = dict(centers=centers, normals=normals, areas=areas,
+                     latitudes=latitudes, longitudes=longitudes, slopes=slopes)
+        self._values: Dict[str, np.ndarray] = {name: value for name, value in given.items() if value is not None}
+        self._sources: Dict[str, Union[str, Callable[[], np.ndarray]]] = dict(sources or {})
+        self._pinned: Set[str] = set()
+        self._mmap_mode = mmap_mode
+        self._vertices = vertices
+        self._faces = faces
+
+    def bind(self, vertices: np.ndarray, faces: np.ndarray) -> None:
+        """
+        Sets the mesh that missing fields are computed from.
+        """
+        self._vertices = vertices
+        self._faces = faces
+
+    def get(self, name: str) -> np.ndarray:
+        """
+        Returns a field, loading or computing it on first access.
+        """
+        value = self._values.get(name)
+        if value is None:
+            if name in self._sources:
+                source = self._sources[name]
+                value = source() if callable(source) else np.load(source, mmap_mode=self._mmap_mode)
+            elif self._vertices is not None and self._faces is not None:
+                value = _compute_fields(self._vertices, self._faces, (name,))[0]
+            elif name in FACE_GEOMETRY_FIELDS:
+                raise ValueError(f"Face geometry field '{name}' is not loaded and has no mesh or source to build it from")
+            else:
+                raise AttributeError(name)
+            self._values[name] = value
+        return value
+
+    def set(self, name: str, value: np.ndarray) -> None:
+        """
+        Replaces a field (e.g. after editing it); the value is pinned, so it is kept even if it could be rebuilt.
+        """
+        if name not in FACE_GEOMETRY_FIELDS:
+            raise AttributeError(name)
+        self._values[name] = value
+        self._pinned.add(name)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._values
+
+    def is_persisted(self, name: str) -> bool:
+        return name in self._sources
+
+    def loaded_fields(self) -> Tuple[str, ...]:
+        return tuple(name for name in FACE_GEOMETRY_FIELDS if name in self._values)
+
+    def is_pinned(self, name: str) -> bool:
+        return name in self._pinned
+
+    def can_rebuild(self, name: str) -> bool:
+        """
+        Returns True if a field can be reloaded or recomputed after being dropped (pinned fields cannot).
+        """
+        if name in self._pinned:
+            return False
+        return name in self._sources or (self._vertices is not None and self._faces is not None)
+
+    def drop(self, names: Optional[Iterable[str]] = None) -> int:
+        """
+        Releases loaded fields that can be rebuilt (all of them by default); pinned fields are kept.
+
+        :param names: Fields to drop
+        :return: Bytes released (memory-mapped fields count as zero)
+        """
+        released = 0
+        for name in FACE_GEOMETRY_FIELDS if names is None else names:
+            if name in self._values and self.can_rebuild(name):
+                value = self._values.pop(name)
+                if not isinstance(value, np.memmap):
+                    released += value.nbytes
+        return released
+
+    def trim(self, max_bytes: int) -> int:
+        """
+        Drops rebuildable in-memory fields, largest first, until the rest fit in max_bytes.
+
+        :return: Bytes released
+        """
+        released = 0
+        in_memory = [name for name in self.loaded_fields()
+                     if name not in self._pinned and not isinstance(self._values[name], np.memmap)]
+        for name in sorted(in_memory, key=lambda n: self._values[n].nbytes, reverse=True):
+            if self.memory_bytes() <= max_bytes:
+                break
+            released += self.drop([name])
+        return released
+
+    def memory_bytes(self) -> int:
+        """
+        Returns the bytes held by loaded, in-memory fields.
+        """
+        return sum(value.nbytes for value in self._values.values() if not isinstance(value, np.memmap))
+
+    def __getstate__(self):
+        # Rebuildable fields and the mesh itself are not pickled; the owner rebinds the mesh
+        kept = {name: value for name, value in self._values.items()
+                if name in self._pinned or (name not in self._sources and (self._vertices is None or self._faces is None))}
+        return {"_values": kept, "_sources": self._sources, "_pinned": sorted(self._pinned & set(kept)),
+                "_mmap_mode": self._mmap_mode}
+
+    def __setstate__(self, state):
+        if "_values" not in state:
+            # Pickled by the earlier dataclass version: every field is a plain attribute
+            state = {"_values": {name: state[name] for name in FACE_GEOMETRY_FIELDS if name in state}, "_sources": {}}
+        self._values = dict(state["_values"])
+        self._sources = dict(state["_sources"])
+        self._pinned = set(state.get("_pinned", ()))
+        self._mmap_mode = state.get("_mmap_mode", "r")
+        self._vertices = None
+        self._faces = None
+
+
+def face_geometry_arrays(
+    v1: np.ndarray,
+    v2: np.ndarray,
+    v3: np.ndarray,
+    names: Tuple[str, ...] = FACE_GEOMETRY_FIELDS
+) -> Tuple[np.ndarray, ...]:
+    """
+    Vectorized face geometry for a block of triangles, given as their three corner arrays.
+    Used to fill face geometry chunk by chunk, so only the current chunk is ever held in memory.
+
+    :param v1: Kx3 array of first corners (likewise v2, v3)
+    :param names: Fields to compute; intermediates are only computed when a field needs them
+    :return: float32 arrays for the requested fields, in the order of names
+    """
+    v1 = np.asarray(v1, dtype=np.float64)
+    v2 = np.asarray(v2, dtype=np.float64)
+    v3 = np.asarray(v3, dtype=np.float64)
+    values = {}
+
+    if {"centers", "latitudes", "longitudes", "slopes"} & set(names):
+        centers = (v1 + v2 + v3) / 3
+        r = np.sqrt(np.einsum("ij,ij->i", centers, centers))
+        values["centers"] = centers
+        values["latitudes"] = np.degrees(np.arcsin(centers[:, 2] / r))
+        values["longitudes"] = np.degrees(np.arctan2(centers[:, 1], centers[:, 0]))
+
+    if {"normals", "areas", "slopes"} & set(names):
+        cross = np.cross(v2 - v1, v3 - v1)
+        length = np.sqrt(np.einsum("ij,ij->i", cross, cross))
+        degenerate = length == 0
+        normals = cross / np.where(degenerate, 1.0, length)[:, None]
+        values["normals"] = normals
+        values["areas"] = 0.5 * length
+
+        if "slopes" in names:
+            # Slope: angle between the face normal and the radial direction of its center
+            dot = np.einsum("ij,ij->i", values["centers"], normals) / r
+            slopes = np.degrees(np.arccos(np.clip(dot, -1.0, 1.0)))
+            slopes[degenerate] = 0.0
+            values["slopes"] = slopes
+
+    return tuple(values[name].astype(np.float32) for name in names)
+
+
+def _compute_fields(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    names: Tuple[str, ...],
+    rows: Optional[np.ndarray] = None,
+    out: Optional[Tuple[np.ndarray, ...]] = None,
+    chunk_faces: int = DEFAULT_CHUNK_FACES
+) -> Tuple[np.ndarray, ...]:
+    """
+    Computes the named fields for the given faces (all by default) in chunks.
+    Results go into out[k][rows] when out is given, otherwise into new arrays in rows order.
+    """
+    n = len(faces) if rows is None else len(rows)
+    if out is None:
+        out = tuple(np.empty((n, 3) if name in ("centers", "normals") else n, dtype=np.float32) for name in names)
+        targets = None
+    else:
+        targets = np.arange(len(faces)) if rows is None else rows
+
+    for start in range(0, n, chunk_faces):
+        stop = min(start + chunk_faces, n)
+        chunk = slice(start, stop) if rows is None else rows[start:stop]
+        corners = np.asarray(faces[chunk]) if rows is None else np.take(faces, chunk, axis=0)
+        values = face_geometry_arrays(*(np.take(vertices, corners[:, k], axis=0) for k in range(3)), names=names)
+        where = slice(start, stop) if targets is None else targets[start:stop]
+        for array, value in zip(out, values):
+            array[where] = value
+    return out
 
 
 def compute_face_geometry(
     vertices: np.ndarray,  # shape (n, 3)
-    faces: np.ndarray      # shape (m, 3)
+    faces: np.ndarray,     # shape (m, 3)
+    face_indices: Optional[np.ndarray] = None,
+    geometry: Optional[FaceGeometry] = None,
+    chunk_faces: int = DEFAULT_CHUNK_FACES
 ) -> FaceGeometry:
     """
     Computes the center, normal, area, latitude, longitude, and slope of each triangle face.
 
+    With face_indices, only those faces are computed. With an existing geometry, its rows
+    (all of them, or just face_indices) are overwritten in place, e.g. after an edit has moved
+    some vertices; otherwise a new FaceGeometry is returned, in face_indices order if given.
+    Faces are processed in chunks so the float64 temporaries stay bounded.
+
     :param vertices: Nx3 NumPy array of vertex coordinates
     :param faces: Mx3 NumPy array of triangle vertex indices
-    :return: A FaceGeometry dataclass with centers, normals, areas, lat/lon, and slopes
+    :param face_indices: Optional subset of face indices to compute
+    :param geometry: Optional FaceGeometry of the whole mesh to update in place
+    :param chunk_faces: Faces computed per chunk
+    :return: A FaceGeometry with centers, normals, areas, lat/lon, and slopes
     """
-    centers = []
-    normals = []
-    areas = []
-    latitudes = []
-    longitudes = []
-    slopes = []
-
-    for i1, i2, i3 in faces:
-        v1 = vertices[i1]
-        v2 = vertices[i2]
-        v3 = vertices[i3]
-
-        # Compute center
-        cx = (v1[0] + v2[0] + v3[0]) / 3
-        cy = (v1[1] + v2[1] + v3[1]) / 3
-        cz = (v1[2] + v2[2] + v3[2]) / 3
-        centers.append((cx, cy, cz))
-
-        # Compute normal (unit vector)
-        edge1 = (v2[0] - v1[0], v2[1] - v1[1], v2[2] - v1[2])
-        edge2 = (v3[0] - v1[0], v3[1] - v1[1], v3[2] - v1[2])
-        nx = edge1[1] * edge2[2] - edge1[2] * edge2[1]
-        ny = edge1[2] * edge2[0] - edge1[0] * edge2[2]
-        nz = edge1[0] * edge2[1] - edge1[1] * edge2[0]
-
-        length = math.sqrt(nx * nx + ny * ny + nz * nz)
-        if length == 0:
-            normals.append((0.0, 0.0, 0.0))
-            areas.append(0.0)
-            slopes.append(0.0)
-        else:
-            normals.append((nx / length, ny / length, nz / length))
-            areas.append(0.5 * length)  # triangle area = 0.5 * |cross product|
-
-            # Compute slope in degrees (angle from radial vector from planet center)
-            center_len = math.sqrt(cx**2 + cy**2 + cz**2)
-            center_unit = (cx / center_len, cy / center_len, cz / center_len)
-            normal_unit = (nx / length, ny / length, nz / length)
-            dot = sum(center_unit[i] * normal_unit[i] for i in range(3))
-            dot = max(-1.0, min(1.0, dot))  # Clamp dot product to valid acos range
-            angle_rad = math.acos(dot)
-            slope_deg = math.degrees(angle_rad)
-            slopes.append(slope_deg)
-
-        # Convert center to latitude and longitude
-        r = math.sqrt(cx * cx + cy * cy + cz * cz)
-        lat = math.degrees(math.asin(cz / r))
-        lon = math.degrees(math.atan2(cy, cx))
-        latitudes.append(lat)
-        longitudes.append(lon)
-
-    # TODO: Add support for filtering specific face indices for partial updates
-    return FaceGeometry(
-        centers=np.array(centers, dtype=np.float32),
-        normals=np.array(normals, dtype=np.float32),
-        areas=np.array(areas, dtype=np.float32),
-        latitudes=np.array(latitudes, dtype=np.float32),
-        longitudes=np.array(longitudes, dtype=np.float32),
-        slopes=np.array(slopes, dtype=np.float32)
-    )
+    rows = None if face_indices is None else np.asarray(face_indices, dtype=np.int64).reshape(-1)
+    if geometry is None:
+        values = _compute_fields(vertices, faces, FACE_GEOMETRY_FIELDS, rows, chunk_faces=chunk_faces)
+        return FaceGeometry(**dict(zip(FACE_GEOMETRY_FIELDS, values)))
+
+    # Fields that are neither loaded nor persisted will be computed from the current vertices anyway
+    names = tuple(name for name in FACE_GEOMETRY_FIELDS
+                  if geometry.is_loaded(name) or geometry.is_persisted(name) or not geometry.can_rebuild(name))
+    out = []
+    for name in names:
+        value = geometry.get(name)
+        if geometry.is_persisted(name):
+            # Persisted fields are usually read-only memory maps; the updated copy no longer matches
+            # the file, so it is materialized and pinned rather than reloaded from disk later
+            if not value.flags.writeable:
+                value = np.array(value)
+            geometry.set(name, value)
+        out.append(value)
+    _compute_fields(vertices, faces, names, rows, tuple(out), chunk_faces)
+    return geometry
@@ -0,0 +1,115 @@
+# planet_generator/geometry/goldberg.py
+
+from dataclasses import dataclass
+import numpy as np
+
+from planet_generator.geometry.adjacency import CSRIndex, build_vertex_face_index
+
+
+@dataclass
+class GoldbergTiles:
+    """
+    The Goldberg polyhedron dual to an icosphere: one tile per mesh vertex, 12 pentagons
+    (the icosahedron corners) and hexagons everywhere else.
+
+    Tile t has the polygon whose corners are the centers of the faces around vertex t.
+    Polygons and neighbors share the same CSR offsets: neighbors.row(t)[i] is the tile across
+    the polygon edge from corner i to corner i + 1, so both can be walked together.
+    """
+    polygons: CSRIndex      # tile -> face indices of its corners, counter-clockwise seen from outside
+    neighbors: CSRIndex     # tile -> neighboring tiles, one per polygon edge
+    centers: np.ndarray     # shape (n, 3) - tile centers (the mesh vertices)
+    corners: np.ndarray     # shape (m, 3) - polygon corner positions (face centers on the sphere), by face
+    areas: np.ndarray       # shape (n,) - tile areas (planar fan around the center)
+
+    def __len__(self) -> int:
+        return len(self.centers)
+
+    def sides(self) -> np.ndarray:
+        """
+        Returns the number of sides of every tile (5 or 6).
+        """
+        return self.polygons.counts()
+
+    def polygon(self, tile: int) -> np.ndarray:
+        """
+        Returns the (k, 3) corner positions of one tile.
+        """
+        return self.corners[self.polygons.row(tile)]
+
+
+def build_goldberg_tiles(
+    vertices: np.ndarray,   # shape (n, 3)
+    faces: np.ndarray,      # shape (m, 3)
+    adjacency: np.ndarray,  # shape (m, 3), edge-ordered
+    radius: float
+) -> GoldbergTiles:
+    """
+    Builds the Goldberg dual of a closed, outward-oriented triangle mesh with array operations.
+
+    Corners are ordered by walking the fan of faces around every vertex at once: in a
+    counter-clockwise face, the edge that enters vertex v has the next face counter-clockwise
+    around v on its other side, and the tile across that polygon edge is the edge's start.
+    Every walk takes at most six steps (the largest valence), done for all tiles together.
+
+    :param vertices: Nx3 vertex positions
+    :param faces: Mx3 triangle vertex indices, counter-clockwise seen from outside
+    :param adjacency: Mx3 edge-ordered face adjacency (column k is across corner k -> k+1)
+    :param radius: Sphere radius; polygon corners are projected onto it
+    :return: GoldbergTiles
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    adjacency = np.asarray(adjacency, dtype=np.int64)
+    n_tiles = len(vertices)
+
+    # For every corner (face, slot k): the corner of the same vertex in the next face
+    # counter-clockwise around it, across the edge from corner k-1 to corner k
+    neighbor = adjacency[:, [2, 0, 1]].reshape(-1)
+    vertex = faces.reshape(-1)
+    next_slot = np.argmax(faces[neighbor] == vertex[:, None], axis=1)
+    next_corner = 3 * neighbor + next_slot
+    edge_start = faces[:, [2, 0, 1]].reshape(-1)
+
+    vertex_faces = build_vertex_face_index(faces, n_tiles)
+    offsets = vertex_faces.offsets
+    counts = vertex_faces.counts()
+
+    # Start each walk at the tile's lowest face; corner = 3 * face + slot of the vertex there
+    first_face = vertex_faces.indices[offsets[:-1]].astype(np.int64)
+    first_slot = np.argmax(faces[first_face] == np.arange(n_tiles)[:, None], axis=1)
+    corner = 3 * first_face + first_slot
+
+    max_sides = int(counts.max())
+    walk_faces = np.empty((n_tiles, max_sides), dtype=np.int64)
+    walk_neighbors = np.empty((n_tiles, max_sides), dtype=np.int64)
+    for step in range(max_sides):
+        walk_faces[:, step] = corner // 3
+        walk_neighbors[:, step] = edge_start[corner]
+        corner = next_corner[corner]
+
+    valid = np.arange(max_sides) < counts[:, None]
+    polygon_faces = walk_faces[valid]
+    tile_neighbors = walk_neighbors[valid]
+
+    # Corner positions: face centroids projected onto the sphere
+    v = np.asarray(vertices, dtype=np.float64)
+    centroids = (v[faces[:, 0]] + v[faces[:, 1]] + v[faces[:, 2]]) / 3
+    corners = centroids * (radius / np.linalg.norm(centroids, axis=1))[:, None]
+
+    # Planar area of the fan of triangles from the tile center to each polygon edge
+    padded = np.where(valid, walk_faces, walk_faces[:, :1])
+    following = np.roll(padded, -1, axis=1)
+    following[np.arange(n_tiles), counts - 1] = padded[:, 0]
+    a = corners[padded] - v[:, None, :]
+    b = corners[following] - v[:, None, :]
+    fan_areas = 0.5 * np.linalg.norm(np.cross(a, b), axis=2)
+    areas = np.where(valid, fan_areas, 0.0).sum(axis=1)
+
+    return GoldbergTiles(
+        polygons=CSRIndex(offsets=offsets, indices=polygon_faces.astype(np.int32)),
+        neighbors=CSRIndex(offsets=offsets, indices=tile_neighbors.astype(np.int32)),
+        centers=np.asarray(vertices, dtype=np.float32),
+        corners=corners.astype(np.float32),
+        areas=areas.astype(np.float32),
+    )
+
@@ -0,0 +1,123 @@
+# planet_generator/geometry/hierarchy.py
+
+from typing import Union
+import numpy as np
+
+FaceIndex = Union[int, np.ndarray]
+
+
+class FaceHierarchy:
+    """
+    Parent/child relationships between the levels of a recursively subdivided icosphere.
+
+    Subdivision replaces face f with its four children 4f, 4f+1, 4f+2, 4f+3 (in that order),
+    so nothing has to be stored: the whole hierarchy is index arithmetic.
+      - parent of face f at level L:          f >> 2 (at level L-1)
+      - children of face f at level L:        4f .. 4f+3 (at level L+1)
+      - ancestor of face f at level k <= L:   f >> 2(L-k)
+      - descendants of face f at level k > L: the contiguous range [f * 4^(k-L), (f+1) * 4^(k-L))
+
+    Every query is O(1) and accepts a single face index (returning Python ints) or a sequence
+    or integer array of them (returning arrays).
+    Face indices default to the finest level (the mesh's own faces); for children() they
+    default to the level above it, the finest level that has children.
+    """
+
+    def __init__(self, subdivisions: int):
+        """
+        :param subdivisions: Subdivision level of the finest (stored) mesh
+        """
+        if subdivisions < 0:
+            raise ValueError(f"Subdivision level must be non-negative, got {subdivisions}")
+        self.subdivisions = subdivisions
+
+    def face_count(self, level: int) -> int:
+        """
+        Returns the number of faces at a level.
+        """
+        self._check_level(level)
+        return 20 * 4 ** level
+
+    def parent(self, face: FaceIndex, level: int = None) -> FaceIndex:
+        """
+        Returns the parent face (at level - 1) of a face at the given level.
+        """
+        level = self.subdivisions if level is None else level
+        self._check_level(level)
+        if level == 0:
+            raise ValueError("Faces at level 0 have no parent")
+        return _result(_faces(face) >> 2)
+
+    def children(self, face: FaceIndex, level: int = None) -> np.ndarray:
+        """
+        Returns the four child faces (at level + 1) of a face at the given level
+        (subdivisions - 1 by default). For an array of n faces, returns an (n, 4) array.
+        """
+        level = self.subdivisions - 1 if level is None else level
+        if not 0 <= level < self.subdivisions:
+            raise ValueError(f"Level must be between 0 and {self.subdivisions - 1} to have children, got {level}")
+        return 4 * _faces(face)[..., None] + np.arange(4)
+
+    def ancestor(self, face: FaceIndex, ancestor_level: int, level: int = None) -> FaceIndex:
+        """
+        Returns the ancestor at ancestor_level of a face at the given level.
+        """
+        level = self.subdivisions if level is None else level
+        self._check_level(level)
+        if not 0 <= ancestor_level <= level:
+            raise ValueError(f"Ancestor level must be between 0 and {level}, got {ancestor_level}")
+        shift = 2 * (level - ancestor_level)
+        return _result(_faces(face) >> shift)
+
+    def descendant_range(self, face: FaceIndex, descendant_level: int = None, level: int = 0):
+        """
+        Returns the [start, stop) range of the descendants at descendant_level of a face at the given level.
+        Descendants are contiguous, so a coarse face selects a slice of any finer per-face array.
+        """
+        descendant_level = self.subdivisions if descendant_level is None else descendant_level
+        self._check_level(descendant_level)
+        if not 0 <= level <= descendant_level:
+            raise ValueError(f"Level must be between 0 and {descendant_level}, got {level}")
+        shift = 2 * (descendant_level - level)
+        face = _faces(face)
+        return _result(face << shift), _result((face + 1) << shift)
+
+    def coarse_faces(self, faces: np.ndarray, level: int) -> np.ndarray:
+        """
+        Returns the triangles of the mesh at a coarser level, in terms of the finest mesh's vertices.
+
+        The first corner of a face is always the first corner of its child 0, the second corner
+        is the first corner of child 1, and the third the first corner of child 2, so the coarse
+        corners are read off three descendants of each coarse face. Useful for LOD rendering.
+
+        :param faces: Face array of the finest mesh, shape (20 * 4^subdivisions, 3)
+        :param level: Target level
+        :return: (20 * 4^level, 3) array of vertex indices
+        """
+        self._check_level(level)
+        if level == self.subdivisions:
+            return np.asarray(faces)
+        depth = self.subdivisions - level
+        first = np.arange(self.face_count(level), dtype=np.int64) << (2 * depth)
+        step = 1 << (2 * (depth - 1))
+        corners = np.stack([first, first + step, first + 2 * step], axis=1)
+        # Each corner chain then descends through child 0, which keeps its first corner
+        return np.asarray(faces)[corners, 0]
+
+    def _check_level(self, level: int) -> None:
+        if not 0 <= level <= self.subdivisions:
+            raise ValueError(f"Level must be between 0 and {self.subdivisions}, got {level}")
+
+
+def _faces(face: FaceIndex) -> np.ndarray:
+    """
+    Face index or indices as an int64 array (0-d for a single face).
+    """
+    return np.asarray(face, dtype=np.int64)
+
+
+def _result(faces: np.ndarray) -> FaceIndex:
+    """
+    Returns a single face as a Python int, and arrays unchanged.
+    """
+    return int(faces) if faces.ndim == 0 else faces
@@ -1,109 +1,677 @@
 # planet_generator/geometry/icosphere.py
 
 import math
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Tuple
 import numpy as np
 
+from planet_generator.geometry.adjacency import face_adjacency_from_twins
+
+
+# Golden ratio
+_PHI = (1 + math.sqrt(5)) / 2
+
+# The 12 vertices and 20 triangular faces of the base icosahedron
+_ICOSAHEDRON_POINTS = np.array([
+    (-1,  _PHI,  0), (1,  _PHI,  0), (-1, -_PHI,  0), (1, -_PHI,  0),
+    (0, -1,  _PHI), (0,  1,  _PHI), (0, -1, -_PHI), (0,  1, -_PHI),
+    (_PHI,  0, -1), (_PHI,  0,  1), (-_PHI,  0, -1), (-_PHI,  0,  1),
+], dtype=np.float64)
+
+_ICOSAHEDRON_FACES = np.array([
+    (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+    (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+    (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+    (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)
+], dtype=np.int64)
+
+# The 30 base edges as (low, high) vertex pairs, sorted
+_ICOSAHEDRON_EDGES = np.unique(np.sort(np.stack([
+    _ICOSAHEDRON_FACES, np.roll(_ICOSAHEDRON_FACES, -1, axis=1)
+], axis=2).reshape(-1, 2), axis=1), axis=0)
+
+
+def _base_face_edges() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Looks up the base edge behind each slot of each base face.
+    Slot k of a face runs from its vertex k to vertex k+1.
+
+    :return: (edge_ids, forward) arrays of shape (20, 3); forward is True where the
+             slot runs from the edge's low vertex to its high vertex
+    """
+    starts = _ICOSAHEDRON_FACES
+    ends = np.roll(_ICOSAHEDRON_FACES, -1, axis=1)
+    keys = np.minimum(starts, ends) * 12 + np.maximum(starts, ends)
+    edge_keys = _ICOSAHEDRON_EDGES[:, 0] * 12 + _ICOSAHEDRON_EDGES[:, 1]
+    return np.searchsorted(edge_keys, keys), starts < ends
+
+
+def _lattice_points(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enumerates the barycentric lattice of a frequency-n triangle, row by row.
+    Point (i, j) has weights (n - i - j, i, j) on the triangle corners (A, B, C).
+
+    :return: (i, j) integer arrays of length (n + 1)(n + 2) / 2
+    """
+    j = np.repeat(np.arange(n + 1), np.arange(n + 1, 0, -1))
+    row_start = j * (n + 1) - j * (j - 1) // 2
+    i = np.arange(len(j)) - row_start
+    return i, j
+
+
+def _lattice_triangles(n: int) -> np.ndarray:
+    """
+    Triangulates the frequency-n lattice into n * n triangles, as local lattice point
+    indices. Rows run from corner A towards C; within a row "up" and "down" triangles
+    alternate, all wound the same way as (A, B, C).
+    """
+    def index(i, j):
+        return j * (n + 1) - j * (j - 1) // 2 + i
+
+    up_i, up_j = _lattice_points(n - 1)
+    up = np.stack([index(up_i, up_j), index(up_i + 1, up_j), index(up_i, up_j + 1)], axis=1)
+    if n == 1:
+        return up
+
+    down_i, down_j = _lattice_points(n - 2)
+    down = np.stack([index(down_i + 1, down_j), index(down_i + 1, down_j + 1), index(down_i, down_j + 1)], axis=1)
+
+    # Interleave per row: up triangle k of row j is followed by down triangle k
+    up_order = 2 * np.arange(len(up)) - up_j
+    down_order = 2 * np.arange(len(down)) + down_j + 1
+    triangles = np.empty((n * n, 3), dtype=np.int64)
+    triangles[up_order] = up
+    triangles[down_order] = down
+    return triangles
+
+
+def _lattice_vertex_ids(face_ids: np.ndarray, i: np.ndarray, j: np.ndarray, n: int) -> np.ndarray:
+    """
+    Maps lattice points of base faces to global vertex ids in the shared patch layout:
+    the 12 corners first, then (n - 1) points along each of the 30 base edges (from the
+    low to the high vertex), then the (n - 1)(n - 2) / 2 interior points of each base face.
+    Points on a shared edge or corner get the same id from every face that touches them.
+
+    :param face_ids: Base face index (0-19) of each point
+    :param i: Lattice weight of corner B
+    :param j: Lattice weight of corner C
+    :param n: Lattice frequency
+    :return: int64 array of global vertex ids
+    """
+    face_ids, i, j = np.broadcast_arrays(face_ids, i, j)
+    k = n - i - j
+    corners = _ICOSAHEDRON_FACES[face_ids]
+    edge_ids, forward = _base_face_edges()
+    edge_ids, forward = edge_ids[face_ids], forward[face_ids]
+
+    interior_count = (n - 1) * (n - 2) // 2
+    jj = np.maximum(j - 1, 0)
+    interior = jj * (n - 1) - jj * (jj + 1) // 2 + (i - 1)
+    ids = 12 + 30 * (n - 1) + face_ids * interior_count + interior
+
+    # Edge points: slot 0 (A->B) is j == 0, slot 1 (B->C) is k == 0, slot 2 (C->A) is i == 0;
+    # the step is counted from the slot's start corner.
+    for slot, on_edge, step in ((0, j == 0, i), (1, k == 0, j), (2, i == 0, k)):
+        along = np.where(forward[..., slot], step, n - step)
+        ids = np.where(on_edge, 12 + edge_ids[..., slot] * (n - 1) + along - 1, ids)
+
+    # Corners override the edge rule at both ends
+    ids = np.where((i == 0) & (j == 0), corners[..., 0], ids)
+    ids = np.where(i == n, corners[..., 1], ids)
+    ids = np.where(j == n, corners[..., 2], ids)
+    return ids
+
+
+def _normalize_to_radius(v: np.ndarray, radius: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Normalizes a (3, n) array of vectors to lie on a sphere of the given radius.
+    If given, the result is written (and cast) into out.
+    """
+    x, y, z = v
+    length = x * x
+    length += y * y
+    length += z * z
+    np.sqrt(length, out=length)
+    result = v / length
+    return np.multiply(result, radius, out=out, casting="same_kind")
+
+
+def _seam_owners() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Picks the lowest-numbered base face touching each corner and each base edge.
+    In patch generation only that face writes the shared vertex, so seams are stitched
+    the same way whatever the worker count or scheduling.
+    """
+    corner_owner = np.full(12, 20)
+    np.minimum.at(corner_owner, _ICOSAHEDRON_FACES.reshape(-1), np.repeat(np.arange(20), 3))
+    edge_ids, _ = _base_face_edges()
+    edge_owner = np.full(30, 20)
+    np.minimum.at(edge_owner, edge_ids.reshape(-1), np.repeat(np.arange(20), 3))
+    return corner_owner, edge_owner
+
+
+def _subdivide_patch(corner_lattice: np.ndarray, corner_coords: np.ndarray, levels: int, radius: float):
+    """
+    Recursively subdivides one triangle exactly as IcosphereGenerator._subdivide would,
+    tracking the lattice position of every point instead of a global vertex number.
+
+    A midpoint only depends on the two endpoints of its edge, so the positions computed
+    here are bit-identical to the ones of the whole-sphere construction.
+
+    :param corner_lattice: (3, 2) integer lattice coordinates (i, j) of the triangle corners
+    :param corner_coords: (3, 3) float64 corner positions, one row per corner
+    :param levels: Number of 4-way subdivisions to apply
+    :param radius: Sphere radius
+    :return: (lattice, coords, faces): (p, 2) lattice coordinates and (3, p) positions of the
+             patch points, and (4^levels, 3) faces as local point indices in recursive order
+    """
+    m = 2 ** levels
+    u, v = _lattice_points(m)
+    coords = np.empty((3, len(u)), dtype=np.float64)
+
+    def index(a, b):
+        return b * (m + 1) - b * (b - 1) // 2 + a
+
+    coords[:, index(0, 0)] = corner_coords[0]
+    coords[:, index(m, 0)] = corner_coords[1]
+    coords[:, index(0, m)] = corner_coords[2]
+
+    # Level by level, fill in the midpoints of the previous level's lattice edges
+    step = m // 2
+    while step >= 1:
+        a, b = _lattice_points(m // step)
+        odd_a, odd_b = a % 2 == 1, b % 2 == 1
+        new = odd_a | odd_b
+        a, b, odd_a, odd_b = a[new], b[new], odd_a[new], odd_b[new]
+        # Horizontal edges (odd a), vertical edges (odd b), or diagonal edges (both odd)
+        da = np.where(odd_a, 1, 0)
+        db = np.where(odd_b, 1, 0)
+        da, db = np.where(odd_a & odd_b, 1, da), np.where(odd_a & odd_b, -1, db)
+        start = index((a - da) * step, (b - db) * step)
+        end = index((a + da) * step, (b + db) * step)
+        midpoints = np.take(coords, start, axis=1)
+        midpoints += np.take(coords, end, axis=1)
+        midpoints /= 2
+        coords[:, index(a * step, b * step)] = _normalize_to_radius(midpoints, radius)
+        step //= 2
+
+    # Faces in recursive child order: (p1, a, c), (p2, b, a), (p3, c, b), (a, b, c)
+    triangles = np.array([[[0, 0], [m, 0], [0, m]]], dtype=np.int64)
+    for _ in range(levels):
+        p1, p2, p3 = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        ma, mb, mc = (p1 + p2) // 2, (p2 + p3) // 2, (p3 + p1) // 2
+        triangles = np.stack([
+            np.stack([p1, ma, mc], axis=1),
+            np.stack([p2, mb, ma], axis=1),
+            np.stack([p3, mc, mb], axis=1),
+            np.stack([ma, mb, mc], axis=1),
+        ], axis=1).reshape(-1, 3, 2)
+    faces = index(triangles[..., 0], triangles[..., 1])
+
+    # Local (u, v) to the base face's lattice coordinates
+    origin = corner_lattice[0]
+    step_u = (corner_lattice[1] - origin) // m
+    step_v = (corner_lattice[2] - origin) // m
+    lattice = origin + u[:, None] * step_u + v[:, None] * step_v
+    return lattice, coords, faces
+
+
+def _patch_corners(base_face: int, sub_index: int, patch_level: int, subdivisions: int, radius: float):
+    """
+    Descends from a base face to one of its level-`patch_level` sub-triangles, computing the
+    sub-triangle's corner positions with the same midpoint arithmetic as the full construction.
+
+    :return: (corner_lattice, corner_coords) for _subdivide_patch
+    """
+    n = 2 ** subdivisions
+    corners = _normalize_to_radius(_ICOSAHEDRON_POINTS.T, radius)[:, _ICOSAHEDRON_FACES[base_face]]
+    lattice = np.array([[0, 0], [n, 0], [0, n]], dtype=np.int64)
+    for level in range(patch_level):
+        child = (sub_index >> (2 * (patch_level - 1 - level))) & 3
+        mid_lattice = (lattice + lattice[[1, 2, 0]]) // 2
+        midpoints = (corners + corners[:, [1, 2, 0]]) / 2
+        mid_coords = _normalize_to_radius(midpoints, radius)
+        # Midpoint k sits on edge (k, k+1); children follow (p1, a, c), (p2, b, a), (p3, c, b), (a, b, c)
+        pick = [(0, 3, 5), (1, 4, 3), (2, 5, 4), (3, 4, 5)][child]
+        lattice = np.concatenate([lattice, mid_lattice])[list(pick)]
+        corners = np.concatenate([corners, mid_coords], axis=1)[:, list(pick)]
+    return lattice, corners.T
+
+
+def _build_patch(radius: float, subdivisions: int, patch_level: int, patch: int):
+    """
+    Builds one patch (a level-`patch_level` sub-triangle of a base face) of a recursive mesh.
+
+    :return: (vertex_ids, owned, positions, local_faces): patch-layout ids of the patch points, a mask
+             of the points this patch writes (seam points belong to the lowest touching base face),
+             their (p, 3) float32 positions, and the patch faces as indices into those points
+    """
+    base_face, sub_index = divmod(patch, 4 ** patch_level)
+    n = 2 ** subdivisions
+
+    corner_lattice, corner_coords = _patch_corners(base_face, sub_index, patch_level, subdivisions, radius)
+    lattice, coords, local_faces = _subdivide_patch(corner_lattice, corner_coords, subdivisions - patch_level, radius)
+    ids = _lattice_vertex_ids(base_face, lattice[:, 0], lattice[:, 1], n)
+
+    # Seam vertices are only written by the base face that owns them
+    corner_owner, edge_owner = _seam_owners()
+    owner = np.full(len(ids), base_face)
+    is_corner = ids < 12
+    is_edge = ~is_corner & (ids < 12 + 30 * (n - 1))
+    owner[is_corner] = corner_owner[ids[is_corner]]
+    owner[is_edge] = edge_owner[(ids[is_edge] - 12) // max(n - 1, 1)]
+    owned = owner == base_face
+
+    positions = np.empty((len(ids), 3), dtype=np.float32)
+    _normalize_to_radius(coords, radius, out=positions.T)
+    return ids, owned, positions, local_faces
+
+
+def _generate_patch(task: dict, vertices: Optional[np.ndarray] = None, faces: Optional[np.ndarray] = None) -> int:
+    """
+    Generates one patch and writes it into the shared vertex and face buffers.
+    Runs in a worker process, attaching to the buffers by name, unless the arrays are passed in directly.
+
+    :param task: Patch description built by IcosphereGenerator._generate_patches
+    :return: The patch index, for bookkeeping
+    """
+    patch = task["patch"]
+    ids, owned, positions, local_faces = _build_patch(
+        task["radius"], task["subdivisions"], task["patch_level"], patch
+    )
+
+    buffers = []
+    if vertices is None:
+        for name in ("vertices", "faces"):
+            buffers.append(shared_memory.SharedMemory(name=task[f"{name}_buffer"]))
+        vertices = np.ndarray(task["vertices_shape"], dtype=np.float32, buffer=buffers[0].buf)
+        faces = np.ndarray(task["faces_shape"], dtype=task["faces_dtype"], buffer=buffers[1].buf)
+    try:
+        vertices[ids[owned]] = positions[owned]
+        faces_per_patch = len(local_faces)
+        faces[patch * faces_per_patch:(patch + 1) * faces_per_patch] = ids[local_faces]
+    finally:
+        del vertices, faces
+        for buffer in buffers:
+            buffer.close()
+    return patch
+
 
 class IcosphereGenerator:
     """
     Generates a subdivided icosahedron (icosphere) projected onto a sphere.
     Useful for building a planetary mesh with uniform triangle distribution.
+
+    Two construction modes are available:
+      - recursive (default): the icosahedron is split 4-ways `subdivisions` times
+      - geodesic: with `frequency` set, a class-I geodesic grid of that frequency is laid
+        directly on the 20 base faces in one pass, so any resolution between the
+        power-of-two levels can be built without the intermediate meshes
+
+    Recursive meshes can also be built in parallel by setting `workers`: every base face
+    (split into sub-triangles when there are many workers) becomes an independent patch
+    generated in a process pool, writing straight into shared-memory buffers. Positions
+    and face order are identical to the serial construction, but vertices are numbered
+    in the patch layout (corners, base-edge points, then face interiors) used by the
+    geodesic mode. That numbering does not depend on the worker count.
     """
 
-    def __init__(self, radius: float, subdivisions: int):
+    # Children of (i1, i2, i3) with midpoints (a, b, c), as columns of [i1, i2, i3, a, b, c]
+    _CHILD_FACES = np.array([0, 3, 5, 1, 4, 3, 2, 5, 4, 3, 4, 5])
+
+    # Child twin table layout, as columns of _subdivide_twins' source block plus fixed offsets
+    _CHILD_TWIN_SOURCES = np.array([0, 6, 5, 1, 6, 3, 2, 6, 4, 6, 6, 6])
+    _CHILD_TWIN_OFFSETS = np.array([0, 11, 0, 0, 9, 0, 0, 10, 0, 4, 7, 1])
+
+    def __init__(
+        self,
+        radius: float,
+        subdivisions: int = 0,
+        frequency: Optional[int] = None,
+        workers: Optional[int] = None
+    ):
         """
         :param radius: Radius of the resulting sphere.
         :param subdivisions: Number of recursive triangle subdivisions.
+        :param frequency: Optional geodesic frequency; when set, each base edge is split into
+                          this many segments in one pass and `subdivisions` is ignored.
+        :param workers: Optional process count for parallel per-base-face generation of a
+                        recursive mesh (1 runs the same patch construction in-process).
         """
+        if frequency is not None and frequency < 1:
+            raise ValueError(f"Geodesic frequency must be at least 1, got {frequency}")
+        if workers is not None and workers < 1:
+            raise ValueError(f"Worker count must be at least 1, got {workers}")
+        if workers is not None and frequency is not None:
+            raise ValueError("Parallel generation is only available for recursive subdivision")
         self.radius = radius
         self.subdivisions = subdivisions
-        self.vertices: List[Tuple[float, float, float]] = []
-        self.faces: List[Tuple[int, int, int]] = []
+        self.frequency = frequency
+        self.workers = workers
+        self.vertices: np.ndarray = np.empty((0, 3), dtype=np.float32)
+        self.faces: np.ndarray = np.empty((0, 3), dtype=np.int32)
+
+        # Working state while subdividing: coordinates are kept as rows x, y, z in float64
+        # (preallocated for the final vertex count) so whole-array maths runs on contiguous memory.
+        self._coords: np.ndarray = np.empty((3, 0), dtype=np.float64)
+        self._n_vertices = 0
+        self._faces: np.ndarray = np.empty((0, 3), dtype=np.int32)
+        # Flat index (3 * face + slot) of the opposite half-edge for every face edge. After a
+        # subdivision only the parent table is kept; the child table is derived on demand.
+        self._twins: Optional[np.ndarray] = None
+        self._parent_twins: Optional[np.ndarray] = None
 
     def generate(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Builds the icosphere and returns the final vertices and faces.
         :return: A tuple of (vertices, faces)
         """
+        if self.frequency is not None:
+            return self._build_geodesic_grid()
+        if self.workers is not None:
+            return self._generate_patches()
+
         self._create_icosahedron()
         for _ in range(self.subdivisions):
             self._subdivide()
-        self._normalize_vertices()
-        # Convert internal lists to NumPy arrays before returning for performance and consistency
-        # Internally we use mutable Python lists to support subdivision via append()
-        return np.array(self.vertices, dtype=np.float32), np.array(self.faces, dtype=np.int32)
+        # Positions are computed in float64 so the result does not depend on how many
+        # levels were built; the public arrays keep the compact dtypes.
+        self.vertices = np.empty((self._n_vertices, 3), dtype=np.float32)
+        self._normalize_vertices(out=self.vertices.T)
+        self.faces = self._faces.astype(np.int32, copy=False)
+        return self.vertices, self.faces
 
     def _create_icosahedron(self):
         """
         Creates the initial 12 vertices and 20 triangular faces of an icosahedron.
         """
-        self.vertices.clear()
-        self.faces.clear()
+        self._coords = np.empty((3, 10 * 4 ** self.subdivisions + 2), dtype=np.float64)
+        self._coords[:, :12] = self._normalize(_ICOSAHEDRON_POINTS.T)
+        self._n_vertices = 12
+        self._faces = _ICOSAHEDRON_FACES.astype(self._index_dtype())
+        self._twins = self._match_twins(self._faces)
 
-        # Golden ratio
-        phi = (1 + math.sqrt(5)) / 2
+    def _build_geodesic_grid(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Builds a class-I geodesic grid of the configured frequency in one pass.
 
-        # Create vertices
-        points = [
-            (-1,  phi,  0), (1,  phi,  0), (-1, -phi,  0), (1, -phi,  0),
-            (0, -1,  phi), (0,  1,  phi), (0, -1, -phi), (0,  1, -phi),
-            (phi,  0, -1), (phi,  0,  1), (-phi,  0, -1), (-phi,  0,  1),
-        ]
-        self.vertices = [self._normalize(v) for v in points]
-
-        # Define 20 triangular faces
-        self.faces = [
-            (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
-            (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
-            (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
-            (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)
+        Each base face carries a barycentric lattice of frequency n; corner and edge points
+        are shared between neighbouring faces through the patch layout of
+        `_lattice_vertex_ids`, so the mesh is closed with 10 * n^2 + 2 vertices and
+        20 * n^2 faces. Faces are ordered base face by base face.
+        """
+        n = self.frequency
+        corners = _ICOSAHEDRON_POINTS
+        edges = _ICOSAHEDRON_EDGES
+
+        # Corner, edge and interior points, in patch-layout order, before projection
+        steps = np.arange(1, n)[None, :, None]
+        edge_points = (corners[edges[:, 0]][:, None] * (n - steps) + corners[edges[:, 1]][:, None] * steps) / n
+
+        i, j = _lattice_points(n)
+        interior = (i > 0) & (j > 0) & (i + j < n)
+        i, j = i[interior], j[interior]
+        a, b, c = (corners[_ICOSAHEDRON_FACES[:, k]][:, None] for k in range(3))
+        face_points = (a * (n - i - j)[:, None] + b * i[:, None] + c * j[:, None]) / n
+
+        points = np.concatenate([corners, edge_points.reshape(-1, 3), face_points.reshape(-1, 3)])
+        self.vertices = np.empty((len(points), 3), dtype=np.float32)
+        self._normalize(points.T, out=self.vertices.T)
+
+        # Triangulate every base face's lattice and map it to global ids
+        lattice_i, lattice_j = _lattice_points(n)
+        face_ids = np.arange(20)[:, None]
+        ids = _lattice_vertex_ids(face_ids, lattice_i[None, :], lattice_j[None, :], n)
+        self.faces = np.take_along_axis(
+            ids, _lattice_triangles(n).reshape(1, -1), axis=1
+        ).reshape(-1, 3).astype(np.int32)
+        return self.vertices, self.faces
+
+    def face_adjacency(self) -> np.ndarray:
+        """
+        Returns the edge-ordered face adjacency of the generated mesh, without any edge matching:
+        for recursive meshes the half-edge twin table is carried through every subdivision, and
+        the neighbor across each edge is just the face of its twin (an O(m) array transform).
+        Geodesic grids are built in one pass and fall back to a sort-based edge match.
+        Call generate() first.
+
+        :return: Mx3 array (int32, or int64 past 2^31 faces); column k is the neighbor across edge k (corner k to corner k+1)
+        """
+        if not len(self.faces):
+            raise ValueError("Generate the mesh before asking for its adjacency")
+        if self.frequency is not None:
+            twins = self._match_twins(self.faces)
+        elif self.workers is not None:
+            # Patch generation never builds the intermediate levels; face order (and so the twin
+            # table) is the same as in the serial construction, so propagate it from level 0
+            twins = self._level_twins(self.subdivisions)
+        else:
+            twins = self._face_twins()
+        return face_adjacency_from_twins(twins)
+
+    def patch_level_for(self, max_patch_faces: int) -> int:
+        """
+        Returns the smallest patch level whose patches have at most max_patch_faces faces.
+        """
+        patch_level = 0
+        while patch_level < self.subdivisions and 4 ** (self.subdivisions - patch_level) > max_patch_faces:
+            patch_level += 1
+        return patch_level
+
+    def iter_patches(self, patch_level: int) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Yields the recursive mesh one patch at a time, without ever holding the whole mesh.
+        Vertices use the patch layout numbering (see the class docstring); faces keep the serial order.
+
+        :param patch_level: Each base face is split into 4^patch_level patches
+        :return: Iterator of (first_face, vertex_ids, owned, positions, local_faces) per patch, where
+                 positions[owned] are the vertices this patch is responsible for writing, and
+                 vertex_ids[local_faces] are its faces, rows first_face onward of the full face array
+        """
+        if self.frequency is not None:
+            raise ValueError("Patch iteration is only available for recursive subdivision")
+        faces_per_patch = 4 ** (self.subdivisions - patch_level)
+        for patch in range(20 * 4 ** patch_level):
+            ids, owned, positions, local_faces = _build_patch(self.radius, self.subdivisions, patch_level, patch)
+            yield patch * faces_per_patch, ids, owned, positions, local_faces
+
+    def iter_patch_adjacency(self, patch_level: int) -> Iterator[np.ndarray]:
+        """
+        Yields the face adjacency of the recursive mesh one patch at a time, in the order of
+        iter_patches(), without ever holding the whole table.
+
+        A child's half-edge twins only depend on its parent's (and its own index), so each patch's
+        rows follow from its single row of the patch-level twin table, subdivided down to the full level.
+
+        :param patch_level: Each base face is split into 4^patch_level patches
+        :return: Iterator of (faces_per_patch, 3) arrays, rows first_face onward of face_adjacency()
+        """
+        if self.frequency is not None:
+            raise ValueError("Patch iteration is only available for recursive subdivision")
+        coarse_twins = self._level_twins(patch_level)
+        for patch in range(len(coarse_twins)):
+            twins = coarse_twins[patch:patch + 1]
+            for level in range(self.subdivisions - patch_level):
+                twins = self._subdivide_twins(twins, first_face=patch * 4 ** level)
+            yield face_adjacency_from_twins(twins)
+
+    def _generate_patches(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Builds the recursive mesh patch by patch, in a process pool when workers > 1.
+
+        Each base face is split into 4^c sub-triangles (enough patches to keep every worker
+        busy); patch p covers the contiguous face rows of its descendants, exactly where the
+        serial construction puts them, and writes its vertices by their patch-layout ids.
+        """
+        s = self.subdivisions
+        n = 2 ** s
+        patch_level = 0
+        while patch_level < s and 20 * 4 ** patch_level < 4 * self.workers:
+            patch_level += 1
+        n_patches = 20 * 4 ** patch_level
+
+        vertices_shape = (10 * n * n + 2, 3)
+        faces_shape = (20 * n * n, 3)
+        faces_dtype = np.dtype(self._index_dtype())
+        tasks = [
+            {"radius": self.radius, "subdivisions": s, "patch_level": patch_level, "patch": patch,
+             "vertices_shape": vertices_shape, "faces_shape": faces_shape, "faces_dtype": faces_dtype.str}
+            for patch in range(n_patches)
         ]
 
+        if self.workers == 1:
+            self.vertices = np.empty(vertices_shape, dtype=np.float32)
+            self.faces = np.empty(faces_shape, dtype=faces_dtype)
+            for task in tasks:
+                _generate_patch(task, self.vertices, self.faces)
+        else:
+            vertex_buffer = shared_memory.SharedMemory(create=True, size=int(np.prod(vertices_shape)) * 4)
+            face_buffer = shared_memory.SharedMemory(create=True, size=int(np.prod(faces_shape)) * faces_dtype.itemsize)
+            try:
+                for task in tasks:
+                    task["vertices_buffer"] = vertex_buffer.name
+                    task["faces_buffer"] = face_buffer.name
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    for _ in pool.map(_generate_patch, tasks):
+                        pass
+                self.vertices = np.ndarray(vertices_shape, dtype=np.float32, buffer=vertex_buffer.buf).copy()
+                self.faces = np.ndarray(faces_shape, dtype=faces_dtype, buffer=face_buffer.buf).copy()
+            finally:
+                vertex_buffer.close()
+                vertex_buffer.unlink()
+                face_buffer.close()
+                face_buffer.unlink()
+
+        self.faces = self.faces.astype(np.int32, copy=False)
+        return self.vertices, self.faces
+
     def _subdivide(self):
         """
         Subdivides each triangular face into 4 smaller triangles.
+
+        Every edge is visited in face order as (i1, i2), (i2, i3), (i3, i1); a new
+        midpoint vertex is numbered by the first time its edge is encountered, and
+        each face (i1, i2, i3) is replaced by (i1, a, c), (i2, b, a), (i3, c, b), (a, b, c).
+
+        Unique edges are found in bulk from the half-edge twin table: a half-edge is
+        the first encounter of its edge exactly when it precedes its twin in face order.
+        The twin table of the children follows from the fixed 4-way split pattern, so
+        no level needs a global sort or hash of its edges.
+        """
+        faces = self._faces
+        twins = self._face_twins().reshape(-1)
+        n_vertices = self._n_vertices
+        n_faces = len(faces)
+
+        # Number the midpoints: owners in encounter order, the other half-edge copies its twin
+        half_edges = np.arange(3 * n_faces, dtype=twins.dtype)
+        owner = half_edges < twins
+        midpoint_ids = np.cumsum(owner, dtype=faces.dtype)
+        midpoint_ids += n_vertices - 1
+        midpoint_ids = np.take(midpoint_ids, np.minimum(half_edges, twins)).reshape(n_faces, 3)
+
+        # New vertex positions: midpoints of the owning half-edges, projected onto the sphere.
+        # A half-edge ends where its twin starts.
+        owners = np.flatnonzero(owner)
+        flat_faces = faces.reshape(-1)
+        starts = np.take(flat_faces, owners)
+        ends = np.take(flat_faces, np.take(twins, owners))
+        coords = self._coords[:, :n_vertices]
+        midpoints = np.take(coords, starts, axis=1)
+        midpoints += np.take(coords, ends, axis=1)
+        midpoints /= 2
+        self._n_vertices = n_vertices + len(starts)
+        self._coords[:, n_vertices:self._n_vertices] = self._normalize(midpoints)
+
+        # Child faces by fancy indexing, four per parent in parent order
+        corners_and_midpoints = np.concatenate([faces, midpoint_ids], axis=1)
+        self._faces = np.take(corners_and_midpoints, self._CHILD_FACES, axis=1).reshape(-1, 3)
+        self._parent_twins = twins.reshape(n_faces, 3)
+        self._twins = None
+
+    def _face_twins(self) -> np.ndarray:
+        """
+        Returns the half-edge twin table of the current faces, deriving it from the
+        parent level the first time it is needed.
+        """
+        if self._twins is None:
+            self._twins = self._subdivide_twins(self._parent_twins)
+        return self._twins
+
+    @staticmethod
+    def _match_twins(faces: np.ndarray) -> np.ndarray:
+        """
+        Pairs every half-edge (face, slot) with the opposite half-edge of the same edge.
+        Slot k of a face is the edge from its vertex k to vertex k+1.
+
+        :param faces: Mx3 array of triangle vertex indices of a closed mesh
+        :return: Mx3 array of flat half-edge indices (3 * face + slot) of each twin
         """
-        midpoint_cache = {}
-        new_faces = []
-
-        def midpoint(idx1: int, idx2: int) -> int:
-            key = tuple(sorted((idx1, idx2)))
-            if key not in midpoint_cache:
-                vert1 = self.vertices[idx1]
-                vert2 = self.vertices[idx2]
-                x = (vert1[0] + vert2[0]) / 2
-                y = (vert1[1] + vert2[1]) / 2
-                z = (vert1[2] + vert2[2]) / 2
-                mid = (x, y, z)
-                self.vertices.append(self._normalize(mid))
-                midpoint_cache[key] = len(self.vertices) - 1
-            return midpoint_cache[key]
-
-        for tri in self.faces:
-            i1, i2, i3 = tri
-            a = midpoint(i1, i2)
-            b = midpoint(i2, i3)
-            c = midpoint(i3, i1)
-            new_faces.extend([
-                (i1, a, c),
-                (i2, b, a),
-                (i3, c, b),
-                (a, b, c),
-            ])
-
-        self.faces = new_faces
-
-    def _normalize(self, v: Tuple[float, float, float]) -> Tuple[float, float, float]:
-        """
-        Normalizes a 3D vector to lie on the sphere with the specified radius.
-        """
-        x, y, z = v
-        length = math.sqrt(x * x + y * y + z * z)
-        return (x / length * self.radius, y / length * self.radius, z / length * self.radius)
-
-    def _normalize_vertices(self):
+        starts = faces.reshape(-1).astype(np.int64)
+        ends = faces[:, [1, 2, 0]].reshape(-1).astype(np.int64)
+        n = int(faces.max()) + 1
+        order = np.argsort(np.minimum(starts, ends) * n + np.maximum(starts, ends), kind="stable")
+        twins = np.empty(len(starts), dtype=faces.dtype)
+        twins[order[0::2]] = order[1::2]
+        twins[order[1::2]] = order[0::2]
+        return twins.reshape(-1, 3)
+
+    @classmethod
+    def _subdivide_twins(cls, twins: np.ndarray, first_face: int = 0) -> np.ndarray:
+        """
+        Derives the half-edge twin table of the subdivided mesh from the parent table.
+
+        Parent edge e of face f is split into a first half (child e, slot 0) and a
+        second half (child e+1, slot 2). Across the edge, the neighbour g sees the same
+        edge as slot e' running the other way, so f's first half pairs with g's second
+        half and vice versa. The three inner edges always pair with the centre child.
+
+        :param twins: Mx3 parent twin table of flat half-edge indices
+        :param first_face: Index of the first parent face, when twins holds a slice of the table
+        :return: 4Mx3 child twin table (rows 4 * first_face onward of the full table)
+        """
+        n_faces = len(twins)
+        neighbor = twins // 3
+        slot = twins - 3 * neighbor
+
+        # Columns 0-2: first halves, 3-5: second halves, 6: this face's first child half-edge
+        sources = np.empty((n_faces, 7), dtype=twins.dtype)
+        np.multiply(neighbor, 12, out=sources[:, 3:6])
+        sources[:, 3:6] += 3 * slot
+        np.add(sources[:, 3:6], np.where(slot == 2, -4, 5).astype(twins.dtype), out=sources[:, 0:3])
+        sources[:, 6] = np.arange(12 * first_face, 12 * (first_face + n_faces), 12, dtype=twins.dtype)
+        child_twins = np.take(sources, cls._CHILD_TWIN_SOURCES, axis=1)
+        child_twins += cls._CHILD_TWIN_OFFSETS.astype(twins.dtype)
+        return child_twins.reshape(-1, 3)
+
+    def _level_twins(self, level: int) -> np.ndarray:
+        """
+        Returns the half-edge twin table of the recursive mesh at a level, propagated from level 0
+        (half-edge indices are those of that level, in the serial face order).
+        """
+        twins = self._match_twins(_ICOSAHEDRON_FACES.astype(self._index_dtype()))
+        for _ in range(level):
+            twins = self._subdivide_twins(twins)
+        return twins
+
+    def _index_dtype(self) -> type:
+        """
+        Smallest integer dtype that can address every half-edge of the final mesh.
+        """
+        return np.int32 if 60 * 4 ** self.subdivisions < 2 ** 31 else np.int64
+
+    def _normalize(self, v: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Normalizes a (3, n) array of vectors to lie on the sphere with the specified radius.
+        If given, the result is written (and cast) into out.
+        """
+        return _normalize_to_radius(v, self.radius, out=out)
+
+    def _normalize_vertices(self, out: Optional[np.ndarray] = None):
         """
         Re-normalizes all vertices to correct for numerical drift after subdivision.
+        The result is written into out when given, otherwise back into the working coordinates.
         """
-        self.vertices = [self._normalize(v) for v in self.vertices]
+        coords = self._coords[:, :self._n_vertices]
+        self._normalize(coords, out=coords if out is None else out)
@@ -0,0 +1,190 @@
+# planet_generator/geometry/locate.py
+
+from typing import Optional, Tuple
+import numpy as np
+
+from planet_generator.geometry.hierarchy import FaceHierarchy
+
+# Points located per chunk: small chunks keep a descent's temporaries in the CPU cache
+DEFAULT_LOCATE_CHUNK = 1 << 12
+
+
+def lat_lon_to_unit(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    Converts latitudes / longitudes in degrees (as in FaceGeometry) to unit vectors, shape (n, 3).
+    """
+    lat = np.radians(np.asarray(lat, dtype=np.float64).reshape(-1))
+    lon = np.radians(np.asarray(lon, dtype=np.float64).reshape(-1))
+    if lat.shape != lon.shape:
+        raise ValueError(f"Expected as many latitudes as longitudes, got {len(lat)} and {len(lon)}")
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=1)
+
+
+class FaceLocator:
+    """
+    Point location on a recursively subdivided icosphere: which face contains a direction.
+
+    A child's outer edges run along its parent's edges, and every midpoint is projected onto
+    the sphere, so the spherical triangles of each level exactly tile those of the level above.
+    A point is therefore located by picking one of the 20 base faces and descending one level
+    at a time. Within a parent (A, B, C) with midpoints (a, b, c), the point lies in corner child
+    0, 1 or 2 if it is beyond the midpoint edge (a, c), (b, a) or (c, b), and in the center child
+    3 otherwise. Those three edge planes are precomputed per coarse face, so each level costs
+    one row gather and three dot products per point.
+
+    Barycentric coordinates are those of the point's central projection onto the face's plane
+    (they are non-negative inside the face, sum to 1, and interpolate per-vertex values).
+    """
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        faces: np.ndarray,
+        subdivisions: int,
+        adjacency: Optional[np.ndarray] = None,
+        chunk_points: int = DEFAULT_LOCATE_CHUNK
+    ):
+        """
+        :param vertices: Vertex positions, shape (n, 3)
+        :param faces: Face array of a recursive icosphere, shape (20 * 4^subdivisions, 3)
+        :param subdivisions: Subdivision level of the mesh
+        :param adjacency: Optional (m, 3) edge-ordered face adjacency; points whose located face
+                          puts them just outside (float32 vertex rounding) are then moved to the
+                          neighbor across that edge
+        :param chunk_points: Points located per chunk
+        """
+        self.hierarchy = FaceHierarchy(subdivisions)
+        if len(faces) != self.hierarchy.face_count(subdivisions):
+            raise ValueError(f"Expected {self.hierarchy.face_count(subdivisions)} faces for "
+                             f"subdivision level {subdivisions}, got {len(faces)}")
+        self.vertices = vertices
+        self.faces = faces
+        self.adjacency = adjacency
+        self.chunk_points = chunk_points
+
+        # Edge planes of the 20 base faces: (a x b) . p >= 0 on the inner side of edge a -> b
+        base = np.take(vertices, self.hierarchy.coarse_faces(faces, 0), axis=0).astype(np.float64)
+        self._base_planes = np.cross(base, np.roll(base, -1, axis=1))
+
+    def locate(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locates points given in degrees of latitude / longitude.
+
+        :return: (face indices (n,) int64, barycentric coordinates (n, 3) float64)
+        """
+        return self.locate_points(lat_lon_to_unit(lat, lon))
+
+    def locate_points(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locates points given as 3D directions (any length, e.g. positions on the planet's surface).
+
+        :param points: Shape (n, 3)
+        :return: (face indices (n,) int64, barycentric coordinates (n, 3) float64)
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        n = len(points)
+        located = np.empty(n, dtype=np.int64)
+        barycentric = np.empty((n, 3), dtype=np.float64)
+        for start in range(0, n, self.chunk_points):
+            stop = min(start + self.chunk_points, n)
+            chunk = points[start:stop]
+            face = self._descend(chunk)
+            weights = self._barycentric(chunk, face)
+            if self.adjacency is not None:
+                face, weights = self._step_outside(chunk, face, weights)
+            located[start:stop] = face
+            barycentric[start:stop] = weights
+        return located, barycentric
+
+    def _descend(self, points: np.ndarray) -> np.ndarray:
+        """
+        Returns the finest-level face containing each point.
+        """
+        # Base face: the one whose nearest edge plane the point is furthest inside of
+        sides = points @ self._base_planes[:, 0].T
+        for k in (1, 2):
+            np.minimum(sides, points @ self._base_planes[:, k].T, out=sides)
+        face = np.argmax(sides, axis=1).astype(np.int64)
+
+        px, py, pz = points[:, 0], points[:, 1], points[:, 2]
+        for planes in self._level_planes():
+            # Beyond midpoint edge (a, c) lies child 0, beyond (b, a) child 1, beyond (c, b) child 2
+            g = np.take(planes, face, axis=0)
+            s0 = g[:, 0] * px + g[:, 1] * py + g[:, 2] * pz
+            s1 = g[:, 3] * px + g[:, 4] * py + g[:, 5] * pz
+            s2 = g[:, 6] * px + g[:, 7] * py + g[:, 8] * pz
+            best = np.maximum(np.maximum(s0, s1), s2)
+            child = np.where(s0 == best, 0, np.where(s1 == best, 1, 2))
+            child[best <= 0] = 3
+            face = 4 * face + child
+        return face
+
+    def _level_planes(self):
+        """
+        Per level below the finest, the three midpoint edge planes of every face, shape (faces, 9):
+        the normals a x c, b x a, c x b, where (a, b, c) are the corners of the face's center child.
+        Built on first use; together about 1/3 of a float64 array of 9 values per finest face.
+        """
+        if getattr(self, "_planes", None) is None:
+            planes = []
+            for level in range(self.hierarchy.subdivisions):
+                centers = self.hierarchy.coarse_faces(self.faces, level + 1)[3::4]
+                mid = np.take(self.vertices, centers, axis=0).astype(np.float64)
+                a, b, c = mid[:, 0], mid[:, 1], mid[:, 2]
+                planes.append(np.concatenate([np.cross(a, c), np.cross(b, a), np.cross(c, b)], axis=1))
+            self._planes = planes
+        return self._planes
+
+    def _coordinates(self):
+        """
+        Vertex x, y, z as separate float64 columns (cached), so corners gather from flat arrays.
+        """
+        if getattr(self, "_xyz", None) is None:
+            self._xyz = tuple(np.asarray(self.vertices[:, k], dtype=np.float64) for k in range(3))
+        return self._xyz
+
+    def _barycentric(self, points: np.ndarray, face: np.ndarray) -> np.ndarray:
+        """
+        Barycentric coordinates of each point's central projection onto its face's plane.
+        """
+        x, y, z = self._coordinates()
+        px, py, pz = (np.ascontiguousarray(points[:, k]) for k in range(3))
+        corners = np.take(self.faces, face, axis=0)
+        v0, v1, v2 = ((np.take(x, corners[:, k]), np.take(y, corners[:, k]), np.take(z, corners[:, k]))
+                      for k in range(3))
+        weights = np.stack([_side(v1, v2, px, py, pz), _side(v2, v0, px, py, pz), _side(v0, v1, px, py, pz)], axis=1)
+        weights /= weights.sum(axis=1, keepdims=True)
+        return weights
+
+    def _step_outside(self, points: np.ndarray, face: np.ndarray, weights: np.ndarray):
+        """
+        Moves points that landed just outside their face to the neighbor across the violated edge,
+        where that neighbor contains them better.
+        """
+        outside = np.flatnonzero(weights.min(axis=1) < 0)
+        if len(outside) == 0:
+            return face, weights
+        # A negative weight at corner k points across the opposite edge, corner k+1 -> k+2
+        corner = np.argmin(weights[outside], axis=1)
+        neighbor = np.asarray(self.adjacency)[face[outside], (corner + 1) % 3].astype(np.int64)
+        valid = neighbor >= 0
+        outside, neighbor = outside[valid], neighbor[valid]
+        moved = self._barycentric(points[outside], neighbor)
+        better = moved.min(axis=1) > weights[outside].min(axis=1)
+        face[outside[better]] = neighbor[better]
+        weights[outside[better]] = moved[better]
+        return face, weights
+
+
+def _side(a, b, px, py, pz) -> np.ndarray:
+    """
+    (a x b) . p for component tuples a, b and point components px, py, pz:
+    positive when p is on the left of the great circle from a to b.
+    """
+    ax, ay, az = a
+    bx, by, bz = b
+    result = (ay * bz - az * by) * px
+    result += (az * bx - ax * bz) * py
+    result += (ax * by - ay * bx) * pz
+    return result
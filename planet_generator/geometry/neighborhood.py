@@ -0,0 +1,310 @@
+# planet_generator/geometry/neighborhood.py
+
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+import numpy as np
+
+from planet_generator.geometry.adjacency import CSRIndex
+
+# Either an (m, w) neighbor array (negative entries = no neighbor) or a CSR neighbor index
+Neighbors = Union[np.ndarray, CSRIndex]
+
+
+def k_disks(
+    neighbors: Neighbors,
+    centers: np.ndarray,
+    k: int,
+    return_distances: bool = False
+) -> Union[CSRIndex, Tuple[CSRIndex, np.ndarray]]:
+    """
+    Returns every cell within k steps of each center, for many centers at once.
+
+    Row i of the result belongs to centers[i]: the center first, then the cells at distance
+    1, 2, ... k, ascending within each distance. Works on any symmetric neighbor relation:
+    face edge adjacency, the face ring index, or Goldberg tile neighbors.
+
+    :param neighbors: (m, w) neighbor array or CSR neighbor index
+    :param centers: Cell indices to query (duplicates are allowed)
+    :param k: Number of steps
+    :param return_distances: Also return the step distance of every entry, aligned with indices
+    :return: CSRIndex (and distances, if requested)
+    """
+    centers = np.asarray(centers, dtype=np.int64).reshape(-1)
+    n_cells = len(neighbors)
+    levels = _frontier_levels(neighbors, np.arange(len(centers)) * n_cells + centers, k, n_cells)
+    return _levels_to_csr(levels, len(centers), n_cells, return_distances)
+
+
+def k_rings(neighbors: Neighbors, centers: np.ndarray, k: int) -> CSRIndex:
+    """
+    Returns the cells at exactly k steps from each center (the hollow ring), ascending per row.
+
+    :param neighbors: (m, w) neighbor array or CSR neighbor index
+    :param centers: Cell indices to query
+    :param k: Number of steps
+    """
+    centers = np.asarray(centers, dtype=np.int64).reshape(-1)
+    n_cells = len(neighbors)
+    levels = _frontier_levels(neighbors, np.arange(len(centers)) * n_cells + centers, k, n_cells)
+    return _levels_to_csr(levels[-1:], len(centers), n_cells, False)
+
+
+@dataclass
+class RingTemplate:
+    """
+    The k-disk of a face in a regular (all valence-6) stretch of a triangle mesh, as a
+    breadth-first tree of relative moves. Node 0 is the center; every other node is reached
+    from its parent through the edge `turns` slots after the edge it was entered by
+    (the center counts as entered by edge 0). Replaying the tree from any regular face
+    reproduces its disk without searching or de-duplicating.
+    """
+    parents: np.ndarray        # shape (nodes,) - parent node, -1 for the center
+    turns: np.ndarray          # shape (nodes,) - edge slot offset from the parent's entry edge
+    level_offsets: np.ndarray  # nodes at distance d are [level_offsets[d], level_offsets[d + 1])
+
+    @property
+    def depth(self) -> int:
+        return len(self.level_offsets) - 2
+
+
+class NeighborhoodIndex:
+    """
+    Batched k-disk and k-ring queries over the edge adjacency of a triangle mesh.
+
+    Centers at least k + 1 steps away from any irregular face (one touching a pentagon vertex
+    or an open edge) are answered by replaying a cached ring template; the rest go through
+    frontier expansion. Both give identical results.
+    """
+
+    def __init__(self, faces: np.ndarray, adjacency: np.ndarray):
+        """
+        :param faces: Mx3 triangle vertex indices
+        :param adjacency: Mx3 edge-ordered face adjacency (column k is across corner k -> k+1)
+        """
+        self.faces = faces
+        self.adjacency = adjacency
+        self._template: Optional[RingTemplate] = None
+        # Sorted faces within _irregular_depth steps of an irregular face
+        self._near_irregular: Optional[np.ndarray] = None
+        self._irregular_depth = -1
+
+    def __len__(self) -> int:
+        return len(self.adjacency)
+
+    def disks(
+        self,
+        centers: np.ndarray,
+        k: int,
+        return_distances: bool = False
+    ) -> Union[CSRIndex, Tuple[CSRIndex, np.ndarray]]:
+        """
+        Returns every face within k edge steps of each center; same layout as k_disks().
+        """
+        centers = np.asarray(centers, dtype=np.int64).reshape(-1)
+        return _levels_to_csr(self._levels(centers, k), len(centers), len(self), return_distances)
+
+    def rings(self, centers: np.ndarray, k: int) -> CSRIndex:
+        """
+        Returns the faces at exactly k edge steps from each center; same layout as k_rings().
+        """
+        centers = np.asarray(centers, dtype=np.int64).reshape(-1)
+        return _levels_to_csr(self._levels(centers, k)[-1:], len(centers), len(self), False)
+
+    def regular(self, centers: np.ndarray, k: int) -> np.ndarray:
+        """
+        Returns a boolean mask of the centers whose k-disk contains no irregular face.
+        """
+        centers = np.asarray(centers, dtype=np.int64).reshape(-1)
+        if self._irregular_depth < k:
+            self._find_irregular(k)
+        return ~_in_sorted(centers, self._near_irregular)
+
+    def template(self, k: int) -> Optional[RingTemplate]:
+        """
+        Returns the cached ring template of depth >= k, building it on first use.
+        Returns None if the mesh has no face far enough from every irregular face.
+        """
+        if self._template is not None and self._template.depth >= k:
+            return self._template
+        self.regular(np.empty(0, dtype=np.int64), k)
+        # The lowest face missing from the sorted near-irregular list is the first regular one
+        near = self._near_irregular
+        gaps = np.flatnonzero(near != np.arange(len(near)))
+        reference = int(gaps[0]) if len(gaps) else len(near)
+        if reference >= len(self):
+            return None
+        self._template = _build_template(np.asarray(self.adjacency), reference, k)
+        return self._template
+
+    def _levels(self, centers: np.ndarray, k: int) -> List[np.ndarray]:
+        n_faces = len(self)
+        keys = np.arange(len(centers)) * n_faces + centers
+        template = self.template(k) if k > 0 else None
+        if template is None:
+            return _frontier_levels(self.adjacency, keys, k, n_faces)
+
+        regular = self.regular(centers, k)
+        replayed = _replay_template(template, self.adjacency, np.flatnonzero(regular), centers[regular], k, n_faces)
+        if regular.all():
+            return replayed
+        searched = _frontier_levels(self.adjacency, keys[~regular], k, n_faces)
+        # Both halves are sorted by (center, face); a stable sort merges the two runs
+        return [np.sort(np.concatenate([a, b]), kind="stable") for a, b in zip(replayed, searched)]
+
+    def _find_irregular(self, k: int) -> None:
+        faces = np.asarray(self.faces)
+        adjacency = np.asarray(self.adjacency)
+        valence = np.bincount(faces.reshape(-1))
+        irregular = np.flatnonzero((valence[faces] != 6).any(axis=1) | (adjacency < 0).any(axis=1))
+        # One multi-source expansion (every irregular face belongs to "center" 0)
+        levels = _frontier_levels(adjacency, irregular.astype(np.int64), k, len(faces))
+        self._near_irregular = np.sort(np.concatenate(levels))
+        self._irregular_depth = k
+
+
+def _expand(neighbors: Neighbors, cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (position in cells, neighbor) for every neighbor of the given cells.
+    """
+    if isinstance(neighbors, CSRIndex):
+        starts = neighbors.offsets[cells]
+        counts = neighbors.offsets[cells + 1] - starts
+        source = np.repeat(np.arange(len(cells)), counts)
+        first = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        values = neighbors.indices[first + np.arange(len(source))].astype(np.int64)
+    else:
+        values = np.asarray(neighbors)[cells].astype(np.int64)
+        source = np.repeat(np.arange(len(cells)), values.shape[1])
+        values = values.reshape(-1)
+    keep = values >= 0
+    return source[keep], values[keep]
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    keys = np.sort(keys)
+    if len(keys) == 0:
+        return keys
+    return keys[np.concatenate([[True], keys[1:] != keys[:-1]])]
+
+
+def _in_sorted(keys: np.ndarray, sorted_keys: np.ndarray) -> np.ndarray:
+    if len(sorted_keys) == 0:
+        return np.zeros(len(keys), dtype=bool)
+    position = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return sorted_keys[position] == keys
+
+
+def _frontier_levels(neighbors: Neighbors, start_keys: np.ndarray, k: int, n_cells: int) -> List[np.ndarray]:
+    """
+    Breadth-first expansion of all centers together. Keys are center * n_cells + cell;
+    returns the sorted keys at distance 0..k.
+
+    In a symmetric relation, the neighbors of distance-d cells lie at d - 1, d or d + 1,
+    so only the two previous frontiers have to be excluded, never the whole visited set.
+    """
+    previous = np.empty(0, dtype=np.int64)
+    current = _sorted_unique(np.asarray(start_keys, dtype=np.int64))
+    levels = [current]
+    for _ in range(k):
+        center, cell = np.divmod(current, n_cells)
+        source, reached = _expand(neighbors, cell)
+        candidates = _sorted_unique(center[source] * n_cells + reached)
+        candidates = candidates[~_in_sorted(candidates, current) & ~_in_sorted(candidates, previous)]
+        previous, current = current, candidates
+        levels.append(current)
+    return levels
+
+
+def _levels_to_csr(levels: List[np.ndarray], n_centers: int, n_cells: int, return_distances: bool):
+    """
+    Assembles per-distance sorted keys into one CSR row per center, nearest distances first.
+    """
+    counts = [np.bincount(level // n_cells, minlength=n_centers) for level in levels]
+    offsets = np.zeros(n_centers + 1, dtype=np.int64)
+    np.cumsum(np.sum(counts, axis=0), out=offsets[1:])
+
+    indices = np.empty(offsets[-1], dtype=np.int32)
+    distances = np.empty(offsets[-1], dtype=np.int32) if return_distances else None
+    filled = offsets[:-1].copy()
+    for distance, (level, level_counts) in enumerate(zip(levels, counts)):
+        center, cell = np.divmod(level, n_cells)
+        level_starts = np.cumsum(level_counts) - level_counts
+        position = filled[center] + np.arange(len(level)) - level_starts[center]
+        indices[position] = cell
+        if distances is not None:
+            distances[position] = distance
+        filled += level_counts
+
+    index = CSRIndex(offsets=offsets, indices=indices)
+    return (index, distances) if return_distances else index
+
+
+def _entry_slots(adjacency: np.ndarray, faces: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """
+    Returns the edge slot of each face that leads back to the previous face.
+    """
+    return np.argmax(adjacency[faces] == previous[..., None], axis=-1)
+
+
+def _build_template(adjacency: np.ndarray, reference: int, k: int) -> RingTemplate:
+    """
+    Records the breadth-first tree of a regular reference face up to depth k.
+    """
+    faces, entries, parents, turns = [reference], [0], [-1], [0]
+    level_offsets = [0, 1]
+    seen = {reference}
+    queue = deque([0])
+    for _ in range(k):
+        for _ in range(level_offsets[-1] - level_offsets[-2]):
+            node = queue.popleft()
+            face, entry = faces[node], entries[node]
+            for turn in ((0, 1, 2) if node == 0 else (1, 2)):
+                neighbor = int(adjacency[face, (entry + turn) % 3])
+                if neighbor in seen:
+                    continue
+                seen.add(neighbor)
+                faces.append(neighbor)
+                entries.append(int(np.flatnonzero(adjacency[neighbor] == face)[0]))
+                parents.append(node)
+                turns.append(turn)
+                queue.append(len(faces) - 1)
+        level_offsets.append(len(faces))
+
+    return RingTemplate(
+        parents=np.asarray(parents, dtype=np.int64),
+        turns=np.asarray(turns, dtype=np.int64),
+        level_offsets=np.asarray(level_offsets, dtype=np.int64),
+    )
+
+
+def _replay_template(
+    template: RingTemplate,
+    adjacency: np.ndarray,
+    positions: np.ndarray,
+    centers: np.ndarray,
+    k: int,
+    n_faces: int
+) -> List[np.ndarray]:
+    """
+    Replays a ring template from many regular centers; returns sorted keys per distance.
+    """
+    n_nodes = int(template.level_offsets[k + 1])
+    faces = np.empty((n_nodes, len(centers)), dtype=np.int64)
+    entries = np.empty((n_nodes, len(centers)), dtype=np.int64)
+    faces[0] = centers
+    entries[0] = 0
+
+    levels = [positions * n_faces + centers]
+    for distance in range(1, k + 1):
+        start, stop = template.level_offsets[distance], template.level_offsets[distance + 1]
+        parents = template.parents[start:stop]
+        sources = faces[parents]
+        slots = (entries[parents] + template.turns[start:stop, None]) % 3
+        faces[start:stop] = adjacency[sources, slots]
+        if distance < k:
+            entries[start:stop] = _entry_slots(adjacency, faces[start:stop], sources)
+        # Center-major order with faces ascending per center matches the frontier keys
+        ring = np.sort(faces[start:stop], axis=0).T
+        levels.append((positions[:, None] * n_faces + ring).reshape(-1))
+    return levels
@@ -0,0 +1,311 @@
+# planet_generator/geometry/operators.py
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+import numpy as np
+
+from planet_generator.geometry.adjacency import build_face_adjacency_array, build_vertex_vertex_index
+
+# Upper bound on gathered values per block in SparseMatrix.dot (rows x row width x fields)
+DOT_BLOCK_VALUES = 1 << 22
+
+
+@dataclass
+class SparseMatrix:
+    """
+    Compressed sparse row matrix: row i has the values data[indptr[i]:indptr[i + 1]]
+    in the columns indices[indptr[i]:indptr[i + 1]].
+
+    Mesh operators have short rows (at most a dozen entries), so products are taken over a
+    padded rows x width copy of the entries, which multiplies many fields at once without
+    any Python loop over rows. Use to_scipy() when SciPy's solvers are needed.
+    """
+    indptr: np.ndarray   # shape (rows + 1,), int64
+    indices: np.ndarray  # shape (nnz,), int32
+    data: np.ndarray     # shape (nnz,), float64
+    shape: Tuple[int, int]
+
+    @classmethod
+    def from_triplets(cls, rows: np.ndarray, cols: np.ndarray, values: np.ndarray, shape: Tuple[int, int]) -> "SparseMatrix":
+        """
+        Builds a matrix from (row, column, value) triplets; duplicate entries are summed.
+        """
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        cols = np.asarray(cols, dtype=np.int64).reshape(-1)
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        keys = rows * shape[1] + cols
+        order = np.argsort(keys, kind="stable")
+        keys = np.take(keys, order)
+        first = np.ones(len(keys), dtype=bool)
+        np.not_equal(keys[1:], keys[:-1], out=first[1:])
+        starts = np.flatnonzero(first)
+        data = np.add.reduceat(np.take(values, order), starts) if len(keys) else np.empty(0)
+        keys = keys[starts]
+        rows = keys // shape[1]
+        cols = keys - rows * shape[1]
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(indptr=indptr, indices=cols.astype(np.int32), data=data, shape=shape)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def dot(self, x: Union[np.ndarray, "SparseMatrix"]) -> Union[np.ndarray, "SparseMatrix"]:
+        """
+        Returns self @ x for x of shape (cols,) or (cols, k): k fields in one pass.
+        If x is a SparseMatrix, returns the sparse product, e.g. to compose operators.
+        """
+        if isinstance(x, SparseMatrix):
+            return self._dot_sparse(x)
+        x = np.asarray(x, dtype=np.float64)
+        if x.shape[0] != self.shape[1]:
+            raise ValueError(f"Cannot multiply a {self.shape} matrix by an array of shape {x.shape}")
+        columns, values = self._padded()
+        fields = x.reshape(self.shape[1], -1)
+        out = np.empty((self.shape[0], fields.shape[1]), dtype=np.float64)
+        block = max(1, DOT_BLOCK_VALUES // max(1, columns.shape[1] * fields.shape[1]))
+        for start in range(0, self.shape[0], block):
+            stop = start + block
+            out[start:stop] = np.einsum("rw,rwk->rk", values[start:stop], fields[columns[start:stop]])
+        return out.reshape((self.shape[0],) + x.shape[1:])
+
+    __matmul__ = dot
+
+    def _dot_sparse(self, other: "SparseMatrix") -> "SparseMatrix":
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Cannot multiply a {self.shape} matrix by a {other.shape} matrix")
+        # Every entry (i, k) of self meets every entry of row k of other
+        counts = np.diff(other.indptr)[self.indices]
+        rows = np.repeat(np.repeat(np.arange(self.shape[0]), np.diff(self.indptr)), counts)
+        starts = other.indptr[self.indices]
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        values = np.repeat(self.data, counts) * other.data[positions]
+        return SparseMatrix.from_triplets(rows, other.indices[positions], values, (self.shape[0], other.shape[1]))
+
+    def transpose(self) -> "SparseMatrix":
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return SparseMatrix.from_triplets(self.indices, rows, self.data, (self.shape[1], self.shape[0]))
+
+    @property
+    def T(self) -> "SparseMatrix":
+        return self.transpose()
+
+    def scale_rows(self, factors: np.ndarray) -> "SparseMatrix":
+        """
+        Returns diag(factors) @ self.
+        """
+        data = self.data * np.repeat(np.asarray(factors, dtype=np.float64), np.diff(self.indptr))
+        return SparseMatrix(indptr=self.indptr, indices=self.indices, data=data, shape=self.shape)
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        np.add.at(dense, (rows, self.indices), self.data)
+        return dense
+
+    def to_scipy(self):
+        """
+        Returns the same matrix as a scipy.sparse.csr_matrix (SciPy is optional).
+        """
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+    def _padded(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (rows, width) padded columns and values, built once and cached.
+        """
+        padded = getattr(self, "_padded_cache", None)
+        if padded is None:
+            counts = np.diff(self.indptr)
+            width = int(counts.max(initial=1))
+            rows = np.repeat(np.arange(self.shape[0]), counts)
+            slots = np.arange(self.nnz) - np.repeat(self.indptr[:-1], counts)
+            columns = np.zeros((self.shape[0], width), dtype=np.int64)
+            values = np.zeros((self.shape[0], width), dtype=np.float64)
+            columns[rows, slots] = self.indices
+            values[rows, slots] = self.data
+            padded = self._padded_cache = (columns, values)
+        return padded
+
+
+class MeshOperators:
+    """
+    Discrete differential operators of a closed triangle mesh, as sparse matrices.
+
+    Per-vertex fields use linear finite elements: the gradient is constant per face, the
+    divergence is its negative adjoint, and the cotangent Laplacian is divergence of gradient.
+    Per-face fields use finite volumes on the face adjacency: Green-Gauss gradient and
+    divergence across the three edges, and their composition as the Laplacian.
+    Uniform (graph) Laplacians are provided for both.
+
+    Vector fields are (m, 3) arrays of per-face vectors. Every operator is built on first use
+    and cached; apply it to a (count,) field or to a (count, k) stack of k fields at once.
+    """
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray, adjacency: Optional[np.ndarray] = None):
+        """
+        :param vertices: Nx3 vertex positions
+        :param faces: Mx3 triangle vertex indices, counter-clockwise seen from outside
+        :param adjacency: Mx3 edge-ordered face adjacency (built from faces if omitted)
+        """
+        self.vertices = np.asarray(vertices, dtype=np.float64)
+        self.faces = np.asarray(faces, dtype=np.int64)
+        self.adjacency = build_face_adjacency_array(self.faces) if adjacency is None else np.asarray(adjacency)
+        self._operators: Dict[str, SparseMatrix] = {}
+
+        corners = self.vertices[self.faces]                       # (m, 3, 3): face, corner, xyz
+        # Edge k runs from corner k to corner k + 1
+        self._edges = corners[:, [1, 2, 0]] - corners
+        cross = np.cross(self._edges[:, 0], -self._edges[:, 2])
+        double_areas = np.linalg.norm(cross, axis=1)
+        self.face_areas = 0.5 * double_areas
+        self.face_normals = cross / double_areas[:, None]
+        self.face_centers = corners.mean(axis=1)
+        # Barycentric vertex areas: a third of every adjacent face
+        self.vertex_areas = np.bincount(self.faces.reshape(-1), np.repeat(self.face_areas / 3, 3),
+                                        minlength=len(self.vertices))
+
+    @property
+    def n_vertices(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def n_faces(self) -> int:
+        return len(self.faces)
+
+    def operator(self, name: str) -> SparseMatrix:
+        """
+        Returns a cached operator by name: vertex_gradient, vertex_divergence, cotangent_laplacian,
+        vertex_uniform_laplacian, face_gradient, face_divergence, face_laplacian, face_uniform_laplacian.
+        """
+        if name not in self._operators:
+            builder = getattr(self, f"_build_{name}", None)
+            if builder is None:
+                raise ValueError(f"Unknown mesh operator '{name}'")
+            self._operators[name] = builder()
+        return self._operators[name]
+
+    def gradient(self, field: np.ndarray) -> np.ndarray:
+        """
+        Per-face gradient vectors (m, 3[, k]) of a per-vertex or per-face scalar field (or k of them).
+        """
+        field = np.asarray(field)
+        name = "vertex_gradient" if len(field) == self.n_vertices else "face_gradient"
+        result = self.operator(name).dot(field)
+        return result.reshape((self.n_faces, 3) + field.shape[1:])
+
+    def divergence(self, vectors: np.ndarray, on: str = "vertex") -> np.ndarray:
+        """
+        Divergence of a per-face vector field (m, 3), evaluated per vertex or per face.
+        """
+        vectors = np.asarray(vectors)
+        flat = vectors.reshape((3 * self.n_faces,) + vectors.shape[2:])
+        return self.operator(f"{on}_divergence").dot(flat)
+
+    def laplacian(self, field: np.ndarray, kind: str = "cotangent") -> np.ndarray:
+        """
+        Laplacian of a per-vertex or per-face field (or a (count, k) stack of fields).
+
+        :param kind: "cotangent" (geometric; finite-volume weights for face fields) or "uniform"
+        """
+        field = np.asarray(field)
+        on_vertices = len(field) == self.n_vertices
+        if kind == "cotangent":
+            name = "cotangent_laplacian" if on_vertices else "face_laplacian"
+        elif kind == "uniform":
+            name = "vertex_uniform_laplacian" if on_vertices else "face_uniform_laplacian"
+        else:
+            raise ValueError(f"Unknown Laplacian kind '{kind}'")
+        return self.operator(name).dot(field)
+
+    def smooth(self, field: np.ndarray, iterations: int = 1, rate: float = 0.5, kind: str = "uniform") -> np.ndarray:
+        """
+        Explicit diffusion: field + rate * L field, repeated. With the uniform Laplacian,
+        rate <= 1 keeps every value within the range of its neighbors.
+        """
+        result = np.asarray(field, dtype=np.float64)
+        for _ in range(iterations):
+            result = result + rate * self.laplacian(result, kind)
+        return result
+
+    def mean_curvature(self) -> np.ndarray:
+        """
+        Per-vertex mean curvature from the cotangent Laplacian of the positions
+        (L x = -2 H n), signed positive where the surface bends away from the planet center.
+        """
+        curvature_normals = self.laplacian(self.vertices)
+        outward = self.vertices / np.linalg.norm(self.vertices, axis=1)[:, None]
+        return -0.5 * np.einsum("ij,ij->i", curvature_normals, outward)
+
+    def _build_vertex_gradient(self) -> SparseMatrix:
+        # grad(phi_k) = N x e_k / 2A, with e_k the edge opposite corner k (from corner k+1 to k+2)
+        opposite = self._edges[:, [1, 2, 0]]
+        basis = np.cross(self.face_normals[:, None, :], opposite) / (2 * self.face_areas)[:, None, None]
+        rows = 3 * np.arange(self.n_faces)[:, None, None] + np.arange(3)[None, None, :]   # (m, 1, 3)
+        rows = np.broadcast_to(rows, (self.n_faces, 3, 3))
+        cols = np.broadcast_to(self.faces[:, :, None], (self.n_faces, 3, 3))
+        return SparseMatrix.from_triplets(rows, cols, basis, (3 * self.n_faces, self.n_vertices))
+
+    def _build_vertex_divergence(self) -> SparseMatrix:
+        # Negative adjoint of the gradient under the face and vertex area inner products
+        weighted = self.operator("vertex_gradient").scale_rows(np.repeat(self.face_areas, 3))
+        return weighted.transpose().scale_rows(-1.0 / self.vertex_areas)
+
+    def _build_cotangent_laplacian(self) -> SparseMatrix:
+        # Corner k's angle is opposite edge (k+1, k+2); each side of an edge adds cot / 2
+        a = -self._edges[:, [2, 0, 1]]     # corner k -> corner k+2 (edge k+2 reversed)
+        b = self._edges                    # corner k -> corner k+1
+        cot = np.einsum("mkj,mkj->mk", a, b) / np.linalg.norm(np.cross(a, b), axis=2)
+        i = self.faces[:, [1, 2, 0]].reshape(-1)
+        j = self.faces[:, [2, 0, 1]].reshape(-1)
+        w = 0.5 * cot.reshape(-1)
+        stiffness = SparseMatrix.from_triplets(
+            np.concatenate([i, j, i, j]), np.concatenate([j, i, i, j]),
+            np.concatenate([w, w, -w, -w]), (self.n_vertices, self.n_vertices))
+        return stiffness.scale_rows(1.0 / self.vertex_areas)
+
+    def _build_vertex_uniform_laplacian(self) -> SparseMatrix:
+        neighbors = build_vertex_vertex_index(self.faces, self.n_vertices)
+        return _uniform_laplacian(neighbors.offsets, neighbors.indices, self.n_vertices)
+
+    def _build_face_gradient(self) -> SparseMatrix:
+        # Green-Gauss: (1 / 2A) sum over edges of (e_k x N) f_across; the own value cancels out
+        outward = np.cross(self._edges, self.face_normals[:, None, :]) / (2 * self.face_areas)[:, None, None]
+        across = np.where(self.adjacency >= 0, self.adjacency, np.arange(self.n_faces)[:, None])
+        rows = 3 * np.arange(self.n_faces)[:, None, None] + np.arange(3)[None, None, :]
+        rows = np.broadcast_to(rows, (self.n_faces, 3, 3))
+        cols = np.broadcast_to(across[:, :, None], (self.n_faces, 3, 3))
+        return SparseMatrix.from_triplets(rows, cols, outward, (3 * self.n_faces, self.n_faces))
+
+    def _build_face_divergence(self) -> SparseMatrix:
+        # (1 / 2A) sum over edges of (e_k x N) . X_across
+        outward = np.cross(self._edges, self.face_normals[:, None, :]) / (2 * self.face_areas)[:, None, None]
+        across = np.where(self.adjacency >= 0, self.adjacency, np.arange(self.n_faces)[:, None])
+        rows = np.broadcast_to(np.arange(self.n_faces)[:, None, None], (self.n_faces, 3, 3))
+        cols = 3 * across[:, :, None] + np.arange(3)[None, None, :]
+        return SparseMatrix.from_triplets(rows, cols, outward, (self.n_faces, 3 * self.n_faces))
+
+    def _build_face_laplacian(self) -> SparseMatrix:
+        # Divergence of gradient, as for vertex fields. A two-point flux across each edge is not
+        # consistent here: recursive icosphere triangles alternate in shape, so the line between
+        # neighboring centers is not orthogonal to their shared edge.
+        return self.operator("face_divergence").dot(self.operator("face_gradient"))
+
+    def _build_face_uniform_laplacian(self) -> SparseMatrix:
+        valid = self.adjacency >= 0
+        counts = valid.sum(axis=1)
+        indptr = np.zeros(self.n_faces + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return _uniform_laplacian(indptr, self.adjacency[valid], self.n_faces)
+
+
+def _uniform_laplacian(offsets: np.ndarray, neighbors: np.ndarray, n: int) -> SparseMatrix:
+    """
+    Graph Laplacian with mean-of-neighbors weights: (L f)_i = mean(f_j) - f_i.
+    """
+    counts = np.diff(offsets)
+    rows = np.repeat(np.arange(n), counts)
+    weights = 1.0 / np.maximum(counts, 1)
+    return SparseMatrix.from_triplets(np.concatenate([rows, np.arange(n)]), np.concatenate([neighbors, np.arange(n)]),
+                                      np.concatenate([weights[rows], -np.ones(n)]), (n, n))
@@ -0,0 +1,161 @@
+# planet_generator/geometry/region.py
+
+from typing import Optional, Union
+import numpy as np
+
+from planet_generator.geometry.face_geometry import FaceGeometry
+
+# Marker in a region's local adjacency for an edge whose neighbor lies outside the region
+OUTSIDE = -1
+
+
+class MeshRegion:
+    """
+    A compact submesh: a set of faces of a larger mesh, renumbered 0..k-1 with their own
+    vertices, so regional work (a river basin, a kingdom) runs on small contiguous arrays.
+
+    Local faces are the region's global faces in ascending order, and local vertices the
+    vertices they use, in ascending global order. Local adjacency keeps the edge order of the
+    global adjacency; edges on the region boundary hold OUTSIDE, and outer_adjacency holds the
+    global face across each of them (OUTSIDE for interior edges), for exchanging halo data.
+
+    Per-face layers move between the planet and the region with gather() / scatter(). When the
+    region is a contiguous range of face indices (e.g. the descendants of one coarse face,
+    see FaceHierarchy.descendant_range), gather() returns a view and nothing is copied.
+    """
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        faces: np.ndarray,
+        face_ids: Union[np.ndarray, slice, range],
+        adjacency: Optional[np.ndarray] = None
+    ):
+        """
+        :param vertices: Global vertex positions, shape (n, 3)
+        :param faces: Global face array, shape (m, 3)
+        :param face_ids: Global faces in the region (any order, no duplicates), or a slice / range
+        :param adjacency: Optional global (m, 3) edge-ordered face adjacency
+        """
+        if isinstance(face_ids, (slice, range)):
+            start, stop, step = face_ids.indices(len(faces)) if isinstance(face_ids, slice) else \
+                (face_ids.start, face_ids.stop, face_ids.step)
+            if step != 1:
+                raise ValueError("Region face ranges must have step 1")
+            face_ids = np.arange(start, stop, dtype=np.int64)
+        else:
+            face_ids = np.sort(np.asarray(face_ids, dtype=np.int64).reshape(-1))
+            if len(face_ids) and (face_ids[0] < 0 or face_ids[-1] >= len(faces)):
+                raise ValueError(f"Face indices must be between 0 and {len(faces) - 1}")
+            if np.any(face_ids[1:] == face_ids[:-1]):
+                raise ValueError("Region face indices contain duplicates")
+
+        self.face_ids = face_ids
+        self.n_global_faces = len(faces)
+        self._range = (int(face_ids[0]), int(face_ids[-1]) + 1) \
+            if len(face_ids) and face_ids[-1] - face_ids[0] + 1 == len(face_ids) else None
+
+        # Local vertices: the sorted unique global vertices of the region's faces
+        global_faces = self.gather(faces).astype(np.int64)
+        corners = np.sort(global_faces.reshape(-1))
+        self.vertex_ids = corners[np.concatenate([[True], corners[1:] != corners[:-1]])] if len(corners) else corners
+        self.n_global_vertices = len(vertices)
+        self.vertices = np.take(vertices, self.vertex_ids, axis=0)
+        self.faces = np.searchsorted(self.vertex_ids, global_faces).astype(np.int32)
+
+        self.adjacency: Optional[np.ndarray] = None
+        self.outer_adjacency: Optional[np.ndarray] = None
+        if adjacency is not None:
+            neighbors = self.gather(adjacency).astype(np.int64)
+            local = self.to_local(neighbors)
+            self.adjacency = local.astype(np.int32)
+            self.outer_adjacency = np.where((local == OUTSIDE) & (neighbors >= 0), neighbors, OUTSIDE)
+
+        self._geometry: Optional[FaceGeometry] = None
+
+    def __len__(self) -> int:
+        return len(self.face_ids)
+
+    @property
+    def is_contiguous(self) -> bool:
+        """
+        True if the region is one contiguous range of global faces (gathers are then views).
+        """
+        return self._range is not None
+
+    @property
+    def boundary_faces(self) -> np.ndarray:
+        """
+        Local indices of the faces with at least one edge on the region boundary.
+        """
+        if self.outer_adjacency is None:
+            raise ValueError("Region was built without adjacency")
+        return np.flatnonzero((self.outer_adjacency >= 0).any(axis=1))
+
+    @property
+    def geometry(self) -> FaceGeometry:
+        """
+        Face geometry of the region, computed lazily from its own vertices and faces.
+        """
+        if self._geometry is None:
+            self._geometry = FaceGeometry(vertices=self.vertices, faces=self.faces)
+        return self._geometry
+
+    def to_local(self, face_ids: np.ndarray) -> np.ndarray:
+        """
+        Maps global face indices to local ones; faces outside the region map to OUTSIDE.
+        """
+        face_ids = np.asarray(face_ids, dtype=np.int64)
+        if self._range is not None:
+            local = face_ids - self._range[0]
+            return np.where((local >= 0) & (face_ids < self._range[1]), local, OUTSIDE)
+        if len(self.face_ids) == 0:
+            return np.full(face_ids.shape, OUTSIDE, dtype=np.int64)
+        position = np.minimum(np.searchsorted(self.face_ids, face_ids), len(self.face_ids) - 1)
+        return np.where(self.face_ids[position] == face_ids, position, OUTSIDE)
+
+    def gather(self, layer: np.ndarray) -> np.ndarray:
+        """
+        Returns the region's rows of a per-face layer (any trailing shape): a view for
+        contiguous regions, otherwise a compact copy. Also accepts a lazily read layer such as
+        a ChunkedArray (see PlanetIO.open_layer), which then reads only the region's rows.
+        """
+        if len(layer) != self.n_global_faces:
+            raise ValueError(f"Expected a per-face layer of {self.n_global_faces} rows, got {len(layer)}")
+        if self._range is not None:
+            return layer[self._range[0]:self._range[1]]
+        return layer[self.face_ids]
+
+    def scatter(self, layer: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Writes the region's values of a per-face layer back into the global layer, in place.
+
+        :param layer: Global per-face layer to update
+        :param values: Region values, one row per local face
+        :return: The updated global layer
+        """
+        if len(values) != len(self):
+            raise ValueError(f"Expected {len(self)} region values, got {len(values)}")
+        if self._range is not None:
+            layer[self._range[0]:self._range[1]] = values
+        else:
+            layer[self.face_ids] = values
+        return layer
+
+    def gather_vertices(self, layer: np.ndarray) -> np.ndarray:
+        """
+        Returns the region's rows of a per-vertex layer, as a compact copy.
+        """
+        if len(layer) != self.n_global_vertices:
+            raise ValueError(f"Expected a per-vertex layer of {self.n_global_vertices} rows, got {len(layer)}")
+        return np.take(layer, self.vertex_ids, axis=0)
+
+    def scatter_vertices(self, layer: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Writes the region's values of a per-vertex layer back into the global layer, in place.
+        Vertices on the region boundary are shared with outside faces and are overwritten too.
+        """
+        if len(values) != len(self.vertex_ids):
+            raise ValueError(f"Expected {len(self.vertex_ids)} region vertex values, got {len(values)}")
+        layer[self.vertex_ids] = values
+        return layer
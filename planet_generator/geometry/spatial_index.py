@@ -0,0 +1,321 @@
+# planet_generator/geometry/spatial_index.py
+
+import os
+import json
+import math
+import shutil
+import numpy as np
+from typing import Optional, Tuple, Union
+
+from planet_generator.geometry.adjacency import CSRIndex
+
+# Bump whenever the layout or meaning of a saved index changes; old copies are then rebuilt
+SPATIAL_INDEX_FORMAT_VERSION = 1
+
+# Average points per grid cell: small enough that a query scans few extra points,
+# large enough that the cell offsets stay a fraction of the point arrays
+POINTS_PER_CELL = 8
+
+# Grid cells enumerated per query batch: bounds the temporaries of one batch to tens of MB
+QUERY_BATCH_CELLS = 1 << 18
+
+SPATIAL_INDEX_ARRAYS = ("offsets", "ids", "points")
+
+# Largest angle between a cube face's axis and any direction on that face: acos(1 / sqrt(3))
+_FACE_HALF_ANGLE = math.acos(1 / math.sqrt(3))
+
+
+class SpatialIndex:
+    """
+    Nearest-neighbor and great-circle radius queries over points on a sphere (e.g. face centers).
+
+    Points are bucketed into a grid on the six faces of the cube map: a direction is assigned to
+    the cube face of its largest coordinate, and to a cell of that face's equi-angular (u, v)
+    grid, so cells cover roughly equal areas. Points are stored sorted by cell, as unit vectors,
+    with CSR offsets per cell, so every array can be saved as .npy and memory-mapped.
+
+    A spherical cap projects onto a cube face as a conic whose (u, v) bounding box follows from
+    the tangent great circles, so a radius query only visits the cells under the cap.
+    K-nearest queries run radius queries with a growing radius until each has k points.
+    """
+
+    def __init__(self, offsets: np.ndarray, ids: np.ndarray, points: np.ndarray, resolution: int, radius: float):
+        """
+        Use SpatialIndex.build() or SpatialIndex.load() rather than calling this directly.
+
+        :param offsets: CSR offsets per grid cell into ids / points, shape (6 * resolution^2 + 1,)
+        :param ids: Id of each point (e.g. its face index), in cell order
+        :param points: Unit vectors of the points in cell order, shape (n, 3) float32
+        :param resolution: Grid cells along each edge of a cube face
+        :param radius: Sphere radius that distances are measured on
+        """
+        self.offsets = offsets
+        self.ids = ids
+        self.points = points
+        self.resolution = resolution
+        self.radius = radius
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(
+        cls,
+        points: np.ndarray,
+        ids: Optional[np.ndarray] = None,
+        radius: Optional[float] = None,
+        resolution: Optional[int] = None
+    ) -> "SpatialIndex":
+        """
+        Builds an index over points on (or near) a sphere centered at the origin.
+
+        :param points: Point positions, shape (n, 3); only their directions are indexed
+        :param ids: Id reported for each point; defaults to its position in points (a face index
+                    when indexing FaceGeometry.centers). Index a subset, e.g. coastal faces, by
+                    passing their centers and face indices.
+        :param radius: Sphere radius for distances; defaults to the mean distance of the points
+        :param resolution: Grid cells along each cube face edge; defaults to about
+                           POINTS_PER_CELL points per cell
+        :return: SpatialIndex
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        norms = np.linalg.norm(points, axis=1)
+        if len(points) and not np.all(norms > 0):
+            raise ValueError("Cannot index points at the origin")
+        ids = np.arange(len(points), dtype=np.int32 if len(points) < 2 ** 31 else np.int64) \
+            if ids is None else np.asarray(ids)
+        if len(ids) != len(points):
+            raise ValueError(f"Expected {len(points)} ids, got {len(ids)}")
+        if radius is None:
+            radius = float(norms.mean()) if len(points) else 1.0
+        if resolution is None:
+            resolution = max(1, math.ceil(math.sqrt(len(points) / (6 * POINTS_PER_CELL))))
+
+        unit = points / norms[:, None]
+        cells = _cells(unit, resolution)
+        order = np.argsort(cells, kind="stable")
+        counts = np.bincount(cells, minlength=6 * resolution * resolution)
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(offsets, np.take(ids, order), np.take(unit, order, axis=0).astype(np.float32),
+                   resolution, float(radius))
+
+    def query_radius(
+        self,
+        points: np.ndarray,
+        distance: Union[float, np.ndarray],
+        return_distances: bool = False
+    ) -> Union[CSRIndex, Tuple[CSRIndex, np.ndarray]]:
+        """
+        Returns the ids of all points within a great-circle distance of each query point.
+
+        :param points: Query positions, shape (n, 3) (directions are used)
+        :param distance: Great-circle distance on the index's sphere, scalar or one per query
+        :param return_distances: Also return the great-circle distance of every entry
+        :return: CSR index with row i for query i, nearest first; with return_distances,
+                 (index, distances) aligned with index.indices
+        """
+        queries = _unit(points)
+        angles = np.broadcast_to(np.asarray(distance, dtype=np.float64) / self.radius, (len(queries),))
+        rows, positions, found_angles = self._search(queries, np.minimum(angles, math.pi))
+
+        order = np.lexsort((found_angles, rows))
+        rows, positions, found_angles = rows[order], positions[order], found_angles[order]
+        offsets = np.zeros(len(queries) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(queries)), out=offsets[1:])
+        result = CSRIndex(offsets, np.take(self.ids, positions))
+        if return_distances:
+            return result, found_angles * self.radius
+        return result
+
+    def query_nearest(self, points: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the k nearest indexed points of each query point.
+
+        :param points: Query positions, shape (n, 3)
+        :param k: Neighbors per query
+        :return: (ids (n, k), great-circle distances (n, k)), nearest first
+        """
+        if not 0 < k <= len(self):
+            raise ValueError(f"k must be between 1 and {len(self)}, got {k}")
+        queries = _unit(points)
+        ids = np.empty((len(queries), k), dtype=self.ids.dtype)
+        distances = np.empty((len(queries), k), dtype=np.float64)
+
+        # Start from the cap expected to hold k points (n * angle^2 / 4 of them) with some slack,
+        # and double it for the queries that found fewer
+        pending = np.arange(len(queries))
+        angle = np.full(len(queries), min(math.pi, 3 * math.sqrt(k / len(self))))
+        while len(pending):
+            found, found_distances = self.query_radius(
+                queries[pending], angle[pending] * self.radius, return_distances=True
+            )
+            counts = found.counts()
+            done = counts >= k
+            starts = found.offsets[:-1][done]
+            take = starts[:, None] + np.arange(k)
+            ids[pending[done]] = found.indices[take]
+            distances[pending[done]] = found_distances[take]
+            pending = pending[~done]
+            angle[pending] = np.minimum(2 * angle[pending], math.pi)
+        return ids, distances
+
+    def _search(self, queries: np.ndarray, angles: np.ndarray):
+        """
+        Returns (query row, point position, angle) for every point within each query's angle.
+        """
+        cell_boxes = _cap_cell_boxes(queries, angles, self.resolution)
+        chord_limits = 2 * np.sin(angles / 2)
+        rows, positions, found_angles = [], [], []
+
+        # Batches of consecutive queries, bounded by the number of grid cells they enumerate
+        query_of_box = cell_boxes[0]
+        cells_per_query = np.bincount(query_of_box, weights=cell_boxes[-1], minlength=len(queries))
+        batch = ((np.cumsum(cells_per_query) - cells_per_query) // QUERY_BATCH_CELLS).astype(np.int64)
+        query_bounds = np.searchsorted(batch, np.arange(batch[-1] + 2)) if len(batch) else np.zeros(1, dtype=np.int64)
+        box_bounds = np.searchsorted(query_of_box, query_bounds)
+        for start, stop in zip(box_bounds[:-1], box_bounds[1:]):
+            if start == stop:
+                continue
+            box = tuple(column[start:stop] for column in cell_boxes)
+            query, cells = _expand_boxes(box, self.resolution)
+
+            # Every point in the visited cells, then the exact chord test
+            starts = np.take(self.offsets, cells)
+            counts = np.take(self.offsets, cells + 1) - starts
+            query = np.repeat(query, counts)
+            position = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(len(query))
+            p = np.take(self.points, position, axis=0).astype(np.float64)
+            q = np.take(queries, query, axis=0)
+            delta = p - q
+            chord = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+            keep = chord <= np.take(chord_limits, query) * (1 + 1e-9)
+            rows.append(query[keep])
+            positions.append(position[keep])
+
+            # Angles from atan2(|p x q|, p . q), accurate at every separation (unlike the chord's arcsin)
+            p, q = p[keep], q[keep]
+            found_angles.append(np.arctan2(np.linalg.norm(np.cross(p, q), axis=1), np.einsum("ij,ij->i", p, q)))
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+        return np.concatenate(rows), np.concatenate(positions), np.concatenate(found_angles)
+
+    def save(self, folder: str) -> None:
+        """
+        Saves the index as raw .npy arrays plus a manifest, written to a temporary folder and
+        renamed into place, so a reader never sees a partial index.
+        """
+        tmp_folder = f"{folder}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        os.makedirs(tmp_folder)
+        for name in SPATIAL_INDEX_ARRAYS:
+            np.save(os.path.join(tmp_folder, f"{name}.npy"), getattr(self, name))
+        manifest = {
+            "format_version": SPATIAL_INDEX_FORMAT_VERSION,
+            "resolution": self.resolution,
+            "radius": self.radius,
+            "count": len(self),
+        }
+        with open(os.path.join(tmp_folder, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        shutil.rmtree(folder, ignore_errors=True)
+        os.rename(tmp_folder, folder)
+
+    @classmethod
+    def load(cls, folder: str, mmap_mode: Optional[str] = "r") -> "SpatialIndex":
+        """
+        Loads a saved index. Arrays are memory-mapped unless mmap_mode is None, so processes
+        that load the same index share one copy through the page cache.
+        """
+        with open(os.path.join(folder, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != SPATIAL_INDEX_FORMAT_VERSION:
+            raise ValueError(f"Spatial index in {folder} has format version {manifest.get('format_version')}, "
+                             f"expected {SPATIAL_INDEX_FORMAT_VERSION}")
+        arrays = {
+            name: np.load(os.path.join(folder, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in SPATIAL_INDEX_ARRAYS
+        }
+        return cls(resolution=manifest["resolution"], radius=manifest["radius"], **arrays)
+
+
+def _unit(points: np.ndarray) -> np.ndarray:
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    return points / np.linalg.norm(points, axis=1, keepdims=True)
+
+
+def _cells(unit: np.ndarray, resolution: int) -> np.ndarray:
+    """
+    Grid cell of each unit vector: cube face 2 * axis + (0 if positive else 1), then the
+    equi-angular (u, v) cell on that face.
+    """
+    axis = np.argmax(np.abs(unit), axis=1)
+    rows = np.arange(len(unit))
+    major = unit[rows, axis]
+    face = 2 * axis + (major < 0)
+    u = unit[rows, (axis + 1) % 3] / np.abs(major)
+    v = unit[rows, (axis + 2) % 3] / np.abs(major)
+    return (face * resolution + _cell_coordinate(v, resolution)) * resolution + _cell_coordinate(u, resolution)
+
+
+def _cell_coordinate(u: np.ndarray, resolution: int) -> np.ndarray:
+    """
+    Equi-angular cell index of a gnomonic face coordinate u in [-1, 1].
+    """
+    angle = np.arctan(u) * (4 / math.pi)
+    return np.clip(((angle + 1) * (resolution / 2)).astype(np.int64), 0, resolution - 1)
+
+
+def _cap_cell_boxes(queries: np.ndarray, angles: np.ndarray, resolution: int):
+    """
+    For every (query, cube face) pair the cap can reach, the (u, v) cell box covering the cap:
+    (query, face, u0, v0, width, height, cells).
+    """
+    n = len(queries)
+    query = np.repeat(np.arange(n), 6)
+    face = np.tile(np.arange(6), n)
+    axis = face // 2
+    sign = np.where(face % 2 == 0, 1.0, -1.0)
+    q = np.take(queries, query, axis=0)
+    rows = np.arange(len(query))
+    qz = sign * q[rows, axis]
+    qu = q[rows, (axis + 1) % 3]
+    qv = q[rows, (axis + 2) % 3]
+    angle = np.take(angles, query)
+
+    # The cap reaches the face only if it comes within the face's half-angle of its axis
+    reach = qz >= np.cos(np.minimum(angle + _FACE_HALF_ANGLE, math.pi))
+    low_u = np.full(len(query), -1.0)
+    high_u = np.ones(len(query))
+    low_v, high_v = low_u.copy(), high_u.copy()
+
+    # A cap inside the face's hemisphere has a bounded projection: u is extreme where the great
+    # circle u * z = x is tangent to the cap, (qz^2 - s^2) u^2 - 2 qx qz u + qx^2 - s^2 = 0
+    s = np.sin(angle)
+    bounded = reach & (angle < math.pi / 2) & (qz > s)
+    denominator = qz[bounded] ** 2 - s[bounded] ** 2
+    for q_other, low, high in ((qu, low_u, high_u), (qv, low_v, high_v)):
+        other = q_other[bounded]
+        spread = s[bounded] * np.sqrt(other ** 2 + qz[bounded] ** 2 - s[bounded] ** 2)
+        low[bounded] = np.maximum((other * qz[bounded] - spread) / denominator, -1.0)
+        high[bounded] = np.minimum((other * qz[bounded] + spread) / denominator, 1.0)
+    reach &= (low_u <= high_u) & (low_v <= high_v)
+
+    u0 = _cell_coordinate(low_u[reach], resolution)
+    v0 = _cell_coordinate(low_v[reach], resolution)
+    width = _cell_coordinate(high_u[reach], resolution) - u0 + 1
+    height = _cell_coordinate(high_v[reach], resolution) - v0 + 1
+    return query[reach], face[reach], u0, v0, width, height, width * height
+
+
+def _expand_boxes(boxes, resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (query, grid cell) for every cell of the given cell boxes.
+    """
+    query, face, u0, v0, width, height, cells = boxes
+    owner = np.repeat(np.arange(len(query)), cells)
+    local = np.arange(len(owner)) - np.repeat(np.cumsum(cells) - cells, cells)
+    w = np.take(width, owner)
+    u = np.take(u0, owner) + local % w
+    v = np.take(v0, owner) + local // w
+    return np.take(query, owner), (np.take(face, owner) * resolution + v) * resolution + u
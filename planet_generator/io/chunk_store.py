@@ -0,0 +1,319 @@
+# planet_generator/io/chunk_store.py
+
+import os
+import bz2
+import json
+import lzma
+import zlib
+import struct
+import numpy as np
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+# File signature and layout version of a chunked array file (version 2 added chunk filters)
+CHUNK_FILE_MAGIC = b"TVGCHUNK"
+CHUNK_FORMAT_VERSION = 2
+
+# Extension of chunked array files (next to the .npy files of uncompressed arrays)
+CHUNK_EXTENSION = ".chunks"
+
+# Target uncompressed size of one chunk: large enough to compress well, small enough that
+# reading a region decompresses little beyond it
+TARGET_CHUNK_BYTES = 1 << 20
+
+# Standard-library codecs: name -> (compress(data, level), decompress(data), default level)
+CHUNK_CODECS: Dict[str, Tuple[Callable, Callable, Optional[int]]] = {
+    "none": (lambda data, level: bytes(data), bytes, None),
+    "zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress, 6),
+    "lzma": (lambda data, level: lzma.compress(data, preset=level), lzma.decompress, 6),
+    "bz2": (lambda data, level: bz2.compress(data, level), bz2.decompress, 9),
+}
+
+# Valid levels / presets per codec
+CODEC_LEVELS = {"none": (None,), "zlib": range(0, 10), "lzma": range(0, 10), "bz2": range(1, 10)}
+
+# Reversible transforms applied to each chunk before compression, in the order given:
+#   delta   - difference of consecutive rows (per column, on the raw bits, wrapping), so slowly
+#             varying floats and the vertex indices of neighboring faces become small numbers
+#   shuffle - groups byte k of every value together, so similar high bytes form long runs
+CHUNK_FILTERS = ("delta", "shuffle")
+
+
+@dataclass(frozen=True)
+class CodecSpec:
+    """
+    A chunk codec setting, written as "[filter+...]codec[-level]", e.g. "zlib-1", "lzma-6" or
+    "delta+shuffle+zlib-5" (parse with CodecSpec.parse; str() gives the canonical form).
+    """
+    codec: str = "zlib"
+    level: Optional[int] = None
+    filters: Tuple[str, ...] = ()
+
+    @classmethod
+    def parse(cls, spec: Union[str, "CodecSpec"]) -> "CodecSpec":
+        if isinstance(spec, CodecSpec):
+            return spec
+        *filters, codec = spec.strip().lower().split("+")
+        name, _, level = codec.partition("-")
+        if name not in CHUNK_CODECS:
+            raise ValueError(f"Unknown codec '{name}' in '{spec}'; expected one of {', '.join(CHUNK_CODECS)}")
+        unknown = [f for f in filters if f not in CHUNK_FILTERS]
+        if unknown:
+            raise ValueError(f"Unknown filter '{unknown[0]}' in '{spec}'; expected {', '.join(CHUNK_FILTERS)}")
+        level = int(level) if level else CHUNK_CODECS[name][2]
+        if level not in CODEC_LEVELS[name]:
+            raise ValueError(f"Invalid level {level} for codec '{name}'")
+        return cls(name, level, tuple(filters))
+
+    def __str__(self) -> str:
+        codec = self.codec if self.level is None else f"{self.codec}-{self.level}"
+        return "+".join(self.filters + (codec,))
+
+
+def default_chunk_rows(row_bytes: int, target_bytes: int = TARGET_CHUNK_BYTES) -> int:
+    """
+    Rows per chunk: the largest power of 4 whose chunk stays within target_bytes. Per-face arrays
+    of a recursive icosphere are in hierarchy order, so such a chunk holds exactly the
+    descendants of one coarser face (a base face, or a Morton range below it).
+    """
+    rows = 1
+    while rows * 4 * max(1, row_bytes) <= target_bytes:
+        rows *= 4
+    return rows
+
+
+def write_chunked_array(
+    path: str,
+    array: np.ndarray,
+    codec: Union[str, CodecSpec] = "zlib",
+    chunk_rows: Optional[int] = None,
+    workers: Optional[int] = None
+) -> dict:
+    """
+    Writes an array as independently compressed chunks of rows, filtered and compressed in a
+    thread pool (the standard-library codecs release the GIL). The file is written under a
+    temporary name and renamed into place.
+
+    File layout: magic, header length (uint32), JSON header, chunk offsets ((chunks + 1) int64,
+    relative to the data start), then the compressed chunks in row order.
+
+    :param path: Output file (conventionally <name>.chunks)
+    :param array: Array to store; rows are split along the first axis
+    :param codec: Codec spec, e.g. "zlib-1" or "delta+shuffle+lzma-6" (see CodecSpec)
+    :param chunk_rows: Rows per chunk (default_chunk_rows() if omitted)
+    :param workers: Compression threads (CPU count if omitted)
+    :return: The header written (dtype, shape, codec, level, filters, chunk_rows, chunks)
+    """
+    spec = CodecSpec.parse(codec)
+    compress = CHUNK_CODECS[spec.codec][0]
+    array = np.asarray(array) if not isinstance(array, np.ndarray) else array
+    if spec.filters and array.dtype.itemsize not in _UNSIGNED:
+        raise ValueError(f"Filters need 1, 2, 4 or 8-byte values, got {array.dtype}")
+    row_bytes = array.dtype.itemsize * int(np.prod(array.shape[1:], dtype=np.int64))
+    chunk_rows = chunk_rows or default_chunk_rows(row_bytes)
+    n_chunks = -(-len(array) // chunk_rows)
+    header = {
+        "version": CHUNK_FORMAT_VERSION,
+        "dtype": np.lib.format.dtype_to_descr(array.dtype),
+        "shape": list(array.shape),
+        "codec": spec.codec,
+        "level": spec.level,
+        "filters": list(spec.filters),
+        "chunk_rows": chunk_rows,
+        "chunks": n_chunks,
+    }
+    encoded = json.dumps(header).encode("utf-8")
+
+    def compress_chunk(index: int) -> bytes:
+        chunk = np.ascontiguousarray(array[index * chunk_rows:(index + 1) * chunk_rows])
+        return compress(memoryview(_encode(chunk, spec.filters)).cast("B"), spec.level)
+
+    offsets = np.zeros(n_chunks + 1, dtype="<i8")
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as f, ThreadPoolExecutor(max_workers=workers) as pool:
+        f.write(CHUNK_FILE_MAGIC + struct.pack("<I", len(encoded)) + encoded)
+        index_position = f.tell()
+        f.write(offsets.tobytes())
+        for k, blob in enumerate(pool.map(compress_chunk, range(n_chunks))):
+            f.write(blob)
+            offsets[k + 1] = offsets[k] + len(blob)
+        f.seek(index_position)
+        f.write(offsets.tobytes())
+    os.replace(tmp_path, path)
+    return header
+
+
+def read_chunked_array(path: str, workers: Optional[int] = None) -> np.ndarray:
+    """
+    Reads a whole chunked array into memory, decompressing chunks in a thread pool.
+    """
+    return ChunkedArray(path).read(workers=workers)
+
+
+class ChunkedArray:
+    """
+    Read-only, randomly accessible view of a chunked array file.
+
+    Opening reads only the header and chunk index. Indexing with an integer, a slice or an
+    array of row indices decompresses just the chunks those rows fall in, so reading one region
+    of a planet-sized layer costs time proportional to the region.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(CHUNK_FILE_MAGIC)) != CHUNK_FILE_MAGIC:
+                raise ValueError(f"{path} is not a chunked array file")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            if header.get("version", 0) > CHUNK_FORMAT_VERSION:
+                raise ValueError(f"{path} has chunk format version {header.get('version')}, "
+                                 f"newer than the supported {CHUNK_FORMAT_VERSION}")
+            self.offsets = np.frombuffer(f.read(8 * (header["chunks"] + 1)), dtype="<i8")
+            self._data_start = f.tell()
+        self.header = header
+        self.dtype = np.dtype(np.lib.format.descr_to_dtype(header["dtype"]))
+        self.shape = tuple(header["shape"])
+        self.chunk_rows = header["chunk_rows"]
+        self.n_chunks = header["chunks"]
+        self.spec = CodecSpec(header["codec"], header["level"], tuple(header.get("filters", ())))
+        self._decompress = CHUNK_CODECS[header["codec"]][1]
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64)) * self.dtype.itemsize
+
+    @property
+    def compressed_bytes(self) -> int:
+        return int(self.offsets[-1])
+
+    def chunk_bounds(self, chunk: int) -> Tuple[int, int]:
+        """
+        Returns the [start, stop) rows held by a chunk.
+        """
+        start = chunk * self.chunk_rows
+        return start, min(start + self.chunk_rows, len(self))
+
+    def read(self, start: int = 0, stop: Optional[int] = None, workers: Optional[int] = None) -> np.ndarray:
+        """
+        Returns rows [start, stop) as a new array, decompressing only the chunks they cover.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        out = np.empty((max(0, stop - start),) + self.shape[1:], dtype=self.dtype)
+        if stop <= start:
+            return out
+        chunks = range(start // self.chunk_rows, (stop - 1) // self.chunk_rows + 1)
+        for chunk, values in zip(chunks, self._load_chunks(chunks, workers)):
+            first, last = self.chunk_bounds(chunk)
+            low, high = max(first, start), min(last, stop)
+            out[low - start:high - start] = values[low - first:high - first]
+        return out
+
+    def take(self, rows: Sequence[int], workers: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the given rows (any order, repeats allowed), decompressing only their chunks.
+        """
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        rows = np.where(rows < 0, rows + len(self), rows)
+        if len(rows) and (rows.min() < 0 or rows.max() >= len(self)):
+            raise IndexError(f"Row index out of range for {len(self)} rows")
+        out = np.empty((len(rows),) + self.shape[1:], dtype=self.dtype)
+        chunk_of_row = rows // self.chunk_rows
+        chunks = np.unique(chunk_of_row)
+        for chunk, values in zip(chunks.tolist(), self._load_chunks(chunks.tolist(), workers)):
+            selected = np.flatnonzero(chunk_of_row == chunk)
+            out[selected] = values[rows[selected] - chunk * self.chunk_rows]
+        return out
+
+    def __getitem__(self, key):
+        rest = ()
+        if isinstance(key, tuple):
+            key, rest = key[0], key[1:]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                result = self.read(start, stop)
+            else:
+                result = self.take(np.arange(start, stop, step))
+        elif isinstance(key, (int, np.integer)):
+            result = self.take([key])[0]
+            return result[rest] if rest else result
+        else:
+            key = np.asarray(key)
+            result = self.take(np.flatnonzero(key) if key.dtype == bool else key)
+        return result[(slice(None),) + rest] if rest else result
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.read()
+        return values if dtype is None else values.astype(dtype)
+
+    def _load_chunks(self, chunks: Sequence[int], workers: Optional[int] = None):
+        """
+        Reads the compressed chunks sequentially (ascending file order), then decompresses
+        them in a thread pool. Yields each chunk's rows, in the order given.
+        """
+        chunks = list(chunks)
+        blobs = {}
+        with open(self.path, "rb") as f:
+            for chunk in sorted(set(chunks)):
+                f.seek(self._data_start + int(self.offsets[chunk]))
+                blobs[chunk] = f.read(int(self.offsets[chunk + 1] - self.offsets[chunk]))
+
+        def decode(chunk: int) -> np.ndarray:
+            first, last = self.chunk_bounds(chunk)
+            data = np.frombuffer(self._decompress(blobs[chunk]), dtype=np.uint8)
+            return _decode(data, self.spec.filters, self.dtype, (last - first,) + self.shape[1:])
+
+        if len(chunks) == 1:
+            yield decode(chunks[0])
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from pool.map(decode, chunks)
+
+
+# Unsigned integer type of each value size, for filtering values by their raw bits
+_UNSIGNED = {1: np.uint8, 2: np.uint16, 4: np.uint32, 8: np.uint64}
+
+
+def _encode(chunk: np.ndarray, filters: Sequence[str]) -> np.ndarray:
+    """
+    Applies the chunk filters in order; returns the bytes to compress as a uint8 array.
+    """
+    if not filters:
+        return chunk.reshape(-1).view(np.uint8)
+    itemsize = chunk.dtype.itemsize
+    values = chunk.reshape(len(chunk), -1).view(_UNSIGNED[itemsize])
+    for name in filters:
+        if name == "delta":
+            rows = values.reshape(len(chunk), -1)
+            values = rows.copy()
+            values[1:] -= rows[:-1]
+        else:
+            values = np.ascontiguousarray(values.reshape(-1).view(np.uint8).reshape(-1, itemsize).T)
+            values = values.reshape(-1).view(_UNSIGNED[itemsize])
+    return values.reshape(-1).view(np.uint8)
+
+
+def _decode(data: np.ndarray, filters: Sequence[str], dtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+    """
+    Reverses the chunk filters (in reverse order) on decompressed bytes.
+    """
+    if not filters:
+        return data.view(dtype).reshape(shape)
+    itemsize = dtype.itemsize
+    values = data.view(_UNSIGNED[itemsize])
+    for name in reversed(filters):
+        if name == "delta":
+            values = np.cumsum(values.reshape(shape[0], -1), axis=0, dtype=values.dtype)
+        else:
+            values = np.ascontiguousarray(values.reshape(-1).view(np.uint8).reshape(itemsize, -1).T)
+            values = values.reshape(-1).view(_UNSIGNED[itemsize])
+    return np.ascontiguousarray(values).reshape(-1).view(dtype).reshape(shape)
@@ -0,0 +1,341 @@
+# planet_generator/io/mesh_format.py
+
+import os
+import json
+import hashlib
+import numpy as np
+from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
+
+from planet_generator.planet_mesh import PlanetMesh
+from planet_generator.geometry.face_geometry import FaceGeometry, FACE_GEOMETRY_FIELDS
+from planet_generator.io.mesh_stream import STREAMED_MESH_DIR
+from planet_generator.io.chunk_store import CHUNK_EXTENSION, ChunkedArray, CodecSpec, read_chunked_array, write_chunked_array
+from planet_generator.io.topology_store import TopologyStore
+from logger.logger import LoggerFactory
+
+logger = LoggerFactory("MeshFormat").get_logger()
+
+# Sub-folder of a planet folder that holds the mesh arrays (shared with streamed meshes)
+MESH_DIR = STREAMED_MESH_DIR
+
+# Bump whenever the layout or meaning of a saved mesh array changes
+MESH_FORMAT_VERSION = 1
+
+# Bytes hashed per step when checksumming, so memory-mapped arrays are read in bounded pieces
+CHECKSUM_CHUNK_BYTES = 1 << 24
+
+
+def array_checksum(array: np.ndarray) -> str:
+    """
+    Content checksum of an array's values (not its file), as "blake2b:<hex digest>".
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    flat = np.asarray(array).reshape(-1)
+    step = max(1, CHECKSUM_CHUNK_BYTES // max(1, flat.itemsize))
+    for start in range(0, len(flat), step):
+        digest.update(np.ascontiguousarray(flat[start:start + step]).view(np.uint8))
+    return f"blake2b:{digest.hexdigest()}"
+
+
+def mesh_arrays(mesh: PlanetMesh) -> Dict[str, np.ndarray]:
+    """
+    The arrays a planet folder stores for a mesh: its radius-scaled vertices, its faces and
+    adjacency unless they come from the shared TopologyStore, and every face geometry field
+    that has been evaluated or persisted (the rest stay lazy and are computed on first use).
+    """
+    arrays = {"vertices": mesh.vertices}
+    if getattr(mesh, "topology_key", None) is None:
+        arrays["faces"] = mesh.faces
+        if mesh.adjacency is not None:
+            arrays["adjacency"] = mesh.adjacency
+    for name in FACE_GEOMETRY_FIELDS:
+        if mesh.geometry.is_loaded(name) or mesh.geometry.is_persisted(name):
+            arrays[name] = mesh.geometry.get(name)
+    return arrays
+
+
+def save_mesh_folder(
+    mesh: PlanetMesh,
+    folder_path: str,
+    codec: Optional[str] = None
+) -> str:
+    """
+    Saves a mesh as one file per array plus a manifest.json with each array's dtype, shape and
+    checksum, in <folder_path>/mesh/. Every file is written to a temporary name and renamed into
+    place, and the manifest is replaced last.
+
+    Arrays are raw .npy files by default. With a codec they are written as chunked, compressed
+    files instead (see chunk_store), trading memory-mapping for size.
+
+    Saves are incremental: arrays whose checksum and storage match the previous manifest are
+    not rewritten, and arrays that are already memory-mapped from their own file in the folder
+    (a streamed or previously loaded mesh) are neither rewritten nor re-hashed.
+
+    :param mesh: Mesh to save
+    :param folder_path: Planet folder
+    :param codec: Optional chunk codec spec, e.g. "zlib-1" (see chunk_store.CodecSpec); None saves raw .npy
+    :return: Path of the mesh folder
+    """
+    mesh_folder = os.path.join(folder_path, MESH_DIR)
+    os.makedirs(mesh_folder, exist_ok=True)
+    previous = read_mesh_manifest(folder_path) or {}
+    previous_arrays = previous.get("arrays", {})
+    written = []
+
+    def save(name, array):
+        checksum = array_checksum(array)
+        entry = previous_arrays.get(name)
+        if entry is not None and entry.get("checksum") == checksum and is_stored(mesh_folder, name, entry, codec):
+            return entry
+        entry = save_array(mesh_folder, name, array, codec)
+        entry["checksum"] = checksum
+        written.append(name)
+        return entry
+
+    # Arrays are hashed and written (and compressed) concurrently; numpy I/O, hashing and the codecs release the GIL
+    entries = {}
+    with ThreadPoolExecutor() as pool:
+        for name, array in mesh_arrays(mesh).items():
+            if codec is None and _is_mapped_file(array, os.path.join(mesh_folder, f"{name}.npy")):
+                # Unchanged on disk; streamed arrays keep their checksum-less entry rather than being re-read
+                entries[name] = previous_arrays.get(name, {"dtype": str(array.dtype), "shape": list(array.shape)})
+            else:
+                entries[name] = pool.submit(save, name, array)
+    entries = {name: entry.result() if isinstance(entry, Future) else entry for name, entry in entries.items()}
+
+    # Files of arrays the mesh no longer has (e.g. a field saved before) would shadow lazy fields
+    for name in set(previous_arrays) - set(entries):
+        remove_array_files(mesh_folder, name)
+
+    manifest = {key: value for key, value in previous.items() if key not in ("arrays",)}
+    manifest.update({
+        "format": "columnar",
+        "format_version": MESH_FORMAT_VERSION,
+        "radius": mesh.radius,
+        "subdivisions": getattr(mesh, "subdivisions", None),
+        "frequency": getattr(mesh, "frequency", None),
+        "topology": getattr(mesh, "topology_key", None),
+        "arrays": entries,
+    })
+    if manifest != previous:
+        write_json_atomic(os.path.join(mesh_folder, "manifest.json"), manifest)
+    logger.info(f"Saved {len(written)} of {len(entries)} mesh arrays to {mesh_folder} (the rest were unchanged)")
+    return mesh_folder
+
+
+def read_mesh_manifest(folder_path: str) -> Optional[dict]:
+    """
+    Returns the mesh manifest of a planet folder, or None if it has no columnar mesh.
+    """
+    path = os.path.join(folder_path, MESH_DIR, "manifest.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def open_mesh_folder(
+    folder_path: str,
+    topology_store: Optional[TopologyStore] = None,
+    mmap_mode: Optional[str] = "r"
+) -> PlanetMesh:
+    """
+    Opens a saved mesh with every array memory-mapped: nothing is read until it is touched,
+    so opening takes milliseconds at any size (compressed arrays are decompressed in parallel
+    instead, geometry fields on first access). Shared topology is mapped from the store, and
+    face geometry fields without a file are computed lazily from the mapped vertices and faces.
+    Also opens streamed meshes, which use the same layout.
+
+    :param folder_path: Planet folder
+    :param topology_store: Store to resolve shared topology from (default store if omitted)
+    :param mmap_mode: numpy memory-map mode ("r" read-only, "r+" to edit in place, None to read)
+    """
+    manifest = read_mesh_manifest(folder_path)
+    if manifest is None:
+        raise FileNotFoundError(f"No mesh manifest in {folder_path}")
+    if manifest.get("format_version", MESH_FORMAT_VERSION) > MESH_FORMAT_VERSION:
+        raise ValueError(f"Mesh in {folder_path} has format version {manifest['format_version']}, "
+                         f"newer than the supported {MESH_FORMAT_VERSION}")
+    mesh_folder = os.path.join(folder_path, MESH_DIR)
+    names = manifest["arrays"]
+
+    def mapped(name):
+        if name not in names:
+            return None
+        return open_array(mesh_folder, name, mmap_mode)
+
+    topology = None
+    topology_key = manifest.get("topology")
+    if topology_key is not None and "faces" not in names:
+        topology = (topology_store or TopologyStore()).load_or_rebuild(
+            topology_key, manifest.get("subdivisions"), manifest.get("frequency")
+        )
+        topology_key = topology.key
+
+    vertices = mapped("vertices")
+    if vertices is None:
+        vertices = topology.scaled_vertices(manifest["radius"])
+    faces = mapped("faces") if topology is None else topology.faces
+    adjacency = mapped("adjacency") if topology is None else topology.adjacency
+    geometry = FaceGeometry(sources={
+        name: _array_source(mesh_folder, name) for name in FACE_GEOMETRY_FIELDS if name in names
+    }, mmap_mode=mmap_mode)
+
+    mesh = PlanetMesh(
+        radius=manifest["radius"],
+        vertices=vertices,
+        faces=faces,
+        face_geometry=geometry,
+        face_adjacency=adjacency,
+        subdivisions=manifest.get("subdivisions"),
+        frequency=manifest.get("frequency"),
+        topology_key=topology_key,
+        mesh_indexes=None if topology is None else {
+            "vertex_faces": topology.vertex_faces,
+            "vertex_vertices": topology.vertex_vertices,
+            "face_ring": topology.face_ring,
+        },
+    )
+    logger.info(f"Opened mesh from {mesh_folder}")
+    return mesh
+
+
+def verify_mesh_folder(folder_path: str) -> List[str]:
+    """
+    Re-hashes every saved mesh array and returns the names whose dtype, shape or checksum
+    differ from the manifest (arrays saved without a checksum are only checked for shape).
+    """
+    manifest = read_mesh_manifest(folder_path)
+    if manifest is None:
+        raise FileNotFoundError(f"No mesh manifest in {folder_path}")
+    mismatched = []
+    mesh_folder = os.path.join(folder_path, MESH_DIR)
+    for name, entry in manifest["arrays"].items():
+        if array_file(mesh_folder, name) is None:
+            mismatched.append(name)
+            continue
+        array = open_array(mesh_folder, name, mmap_mode="r")
+        if str(array.dtype) != entry["dtype"] or list(array.shape) != entry["shape"] or \
+                ("checksum" in entry and array_checksum(array) != entry["checksum"]):
+            mismatched.append(name)
+    return mismatched
+
+
+def save_array(
+    folder: str,
+    name: str,
+    array: np.ndarray,
+    codec: Optional[str] = None
+) -> dict:
+    """
+    Saves one array of a planet folder as <name>.npy, or as chunked, compressed <name>.chunks
+    when a codec is given, removing the file of the other kind.
+
+    :return: Manifest entry for the array (dtype, shape, and the storage details if chunked)
+    """
+    entry = {"dtype": str(array.dtype), "shape": list(array.shape)}
+    if codec is None:
+        write_array_atomic(os.path.join(folder, f"{name}.npy"), array)
+        stale = os.path.join(folder, f"{name}{CHUNK_EXTENSION}")
+    else:
+        spec = CodecSpec.parse(codec)
+        header = write_chunked_array(os.path.join(folder, f"{name}{CHUNK_EXTENSION}"), array, spec)
+        entry.update({"storage": "chunked", "codec": str(spec), "chunk_rows": header["chunk_rows"]})
+        stale = os.path.join(folder, f"{name}.npy")
+    if os.path.exists(stale):
+        try:
+            os.remove(stale)
+        except OSError as e:
+            # Still memory-mapped on a platform that locks mapped files; it is ignored once the new file exists
+            logger.warning(f"Could not remove {stale}: {e}")
+    return entry
+
+
+def is_stored(folder: str, name: str, entry: dict, codec: Optional[str] = None) -> bool:
+    """
+    True if a saved array's file exists in the storage a save with this codec would produce
+    (raw .npy for None, otherwise a chunked file with the same codec spec).
+    """
+    if codec is None:
+        return "storage" not in entry and os.path.exists(os.path.join(folder, f"{name}.npy"))
+    return entry.get("codec") == str(CodecSpec.parse(codec)) and \
+        os.path.exists(os.path.join(folder, f"{name}{CHUNK_EXTENSION}"))
+
+
+def array_file(folder: str, name: str) -> Optional[str]:
+    """
+    Returns the file holding a saved array (.npy or .chunks; the newer one if a stale file of
+    the other kind could not be removed), or None.
+    """
+    paths = [os.path.join(folder, f"{name}{extension}") for extension in (".npy", CHUNK_EXTENSION)]
+    paths = [path for path in paths if os.path.exists(path)]
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+def open_array(
+    folder: str,
+    name: str,
+    mmap_mode: Optional[str] = "r",
+    lazy: bool = False
+) -> Union[np.ndarray, ChunkedArray, None]:
+    """
+    Opens a saved array: a .npy file is memory-mapped, a chunked file is decompressed in
+    parallel, or with lazy=True returned as a ChunkedArray that decompresses only the rows it
+    is indexed with.
+
+    :return: The array, or None if the folder has no file for it
+    """
+    path = array_file(folder, name)
+    if path is None:
+        return None
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode=mmap_mode)
+    return ChunkedArray(path) if lazy else read_chunked_array(path)
+
+
+def remove_array_files(folder: str, name: str) -> None:
+    """
+    Removes every stored file of an array.
+    """
+    for extension in (".npy", CHUNK_EXTENSION):
+        path = os.path.join(folder, f"{name}{extension}")
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def write_array_atomic(path: str, array: np.ndarray) -> None:
+    """
+    Writes an array as .npy under a temporary name and renames it over path.
+    """
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        np.save(f, np.asarray(array))
+    os.replace(tmp_path, path)
+
+
+def write_json_atomic(path: str, data: dict) -> None:
+    """
+    Writes a JSON file under a temporary name and renames it over path.
+    """
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _array_source(folder: str, name: str):
+    """
+    FaceGeometry source of a saved field: the .npy path to map, or a loader for a chunked file.
+    """
+    path = array_file(folder, name)
+    return path if path is None or path.endswith(".npy") else partial(read_chunked_array, path)
+
+
+def _is_mapped_file(array: np.ndarray, path: str) -> bool:
+    """
+    True if the array is memory-mapped from the given file.
+    """
+    filename = getattr(array, "filename", None)
+    return filename is not None and os.path.abspath(filename) == os.path.abspath(path)
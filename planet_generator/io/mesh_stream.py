@@ -0,0 +1,182 @@
+# planet_generator/io/mesh_stream.py
+
+import os
+import json
+import numpy as np
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from planet_generator.geometry.adjacency import index_dtype
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.face_geometry import FaceGeometry, face_geometry_arrays
+from planet_generator.planet_mesh import PlanetMesh
+from logger.logger import LoggerFactory
+
+logger = LoggerFactory("MeshStream").get_logger()
+
+# Sub-folder of a planet folder that holds a streamed mesh
+STREAMED_MESH_DIR = "mesh"
+
+# Face geometry arrays written next to vertices and faces, with their per-face shape
+FACE_GEOMETRY_ARRAYS = {
+    "centers": (3,),
+    "normals": (3,),
+    "areas": (),
+    "latitudes": (),
+    "longitudes": (),
+    "slopes": (),
+}
+
+# Default patch size: 4^10 faces keeps the working set of one chunk around a hundred megabytes
+DEFAULT_MAX_CHUNK_FACES = 4 ** 10
+
+
+def stream_planet_mesh(
+    folder_path: str,
+    radius: float,
+    subdivisions: int,
+    max_chunk_faces: int = DEFAULT_MAX_CHUNK_FACES
+) -> str:
+    """
+    Generates a recursive icosphere straight into memory-mapped .npy files, one base-face
+    chunk at a time, so peak memory is bounded by the chunk size rather than the mesh size.
+
+    Writes vertices, faces, the edge-ordered face adjacency and every face geometry array
+    into <folder_path>/mesh/, plus a manifest.json describing them. Vertices use the patch
+    layout of parallel generation (see IcosphereGenerator); face order is the usual
+    recursive order, and each chunk's adjacency rows are derived from its patch alone.
+
+    :param folder_path: Planet folder
+    :param radius: Planet radius
+    :param subdivisions: Recursive subdivision level
+    :param max_chunk_faces: Upper bound on faces generated per chunk
+    :return: Path of the streamed mesh folder
+    """
+    generator = IcosphereGenerator(radius, subdivisions)
+    n_vertices = 10 * 4 ** subdivisions + 2
+    n_faces = 20 * 4 ** subdivisions
+    index_dtypes = streamed_index_dtypes(subdivisions)
+    patch_level = generator.patch_level_for(max_chunk_faces)
+
+    mesh_folder = os.path.join(folder_path, STREAMED_MESH_DIR)
+    os.makedirs(mesh_folder, exist_ok=True)
+    logger.info(f"Streaming {n_faces:,} faces into {mesh_folder} "
+                f"in {20 * 4 ** patch_level:,} chunks of {4 ** (subdivisions - patch_level):,} faces")
+
+    # Create every array file up front; chunks are then written through short-lived windows
+    arrays = {"vertices": _create_array(mesh_folder, "vertices", (n_vertices, 3), np.float32),
+              "faces": _create_array(mesh_folder, "faces", (n_faces, 3), index_dtypes["faces"]),
+              "adjacency": _create_array(mesh_folder, "adjacency", (n_faces, 3), index_dtypes["adjacency"])}
+    for name, item_shape in FACE_GEOMETRY_ARRAYS.items():
+        arrays[name] = _create_array(mesh_folder, name, (n_faces,) + item_shape, np.float32)
+
+    patches = zip(generator.iter_patches(patch_level), generator.iter_patch_adjacency(patch_level))
+    for (first_face, ids, owned, positions, local_faces), adjacency in patches:
+        owned_ids = ids[owned]
+        first_vertex = int(owned_ids.min())
+        with _array_window(arrays["vertices"], first_vertex, int(owned_ids.max()) + 1) as vertices:
+            vertices[owned_ids - first_vertex] = positions[owned]
+
+        end = first_face + len(local_faces)
+        with _array_window(arrays["faces"], first_face, end) as faces:
+            faces[:] = ids[local_faces]
+        with _array_window(arrays["adjacency"], first_face, end) as window:
+            window[:] = adjacency
+
+        # Face geometry from the chunk's own positions; the global arrays are never read back
+        values = face_geometry_arrays(*(positions[local_faces[:, k]] for k in range(3)))
+        for name, value in zip(FACE_GEOMETRY_ARRAYS, values):
+            with _array_window(arrays[name], first_face, end) as window:
+                window[:] = value
+
+    manifest = {
+        "radius": radius,
+        "subdivisions": subdivisions,
+        "layout": "patch",
+        "arrays": {
+            name: {"dtype": str(info["dtype"]), "shape": list(info["shape"])}
+            for name, info in arrays.items()
+        },
+    }
+    with open(os.path.join(mesh_folder, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"Streamed mesh complete: {mesh_folder}")
+    return mesh_folder
+
+
+def streamed_index_dtypes(subdivisions: int) -> Dict[str, type]:
+    """
+    Index dtypes of a streamed mesh: faces hold vertex ids and adjacency holds face ids, each
+    int32 until its largest id passes 2^31 - 1 (for both, from subdivision 14 on).
+    """
+    n_vertices = 10 * 4 ** subdivisions + 2
+    n_faces = 20 * 4 ** subdivisions
+    return {"faces": index_dtype(n_vertices - 1), "adjacency": index_dtype(n_faces - 1)}
+
+
+def _create_array(folder: str, name: str, shape: tuple, dtype) -> dict:
+    """
+    Creates an .npy file of the given shape without touching its data,
+    and returns what is needed to map row ranges of it later.
+    """
+    path = os.path.join(folder, f"{name}.npy")
+    np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    with open(path, "rb") as f:
+        np.lib.format.read_magic(f)
+        np.lib.format.read_array_header_1_0(f)
+        offset = f.tell()
+    return {"path": path, "offset": offset, "shape": shape, "dtype": np.dtype(dtype)}
+
+
+@contextmanager
+def _array_window(array: dict, start: int, stop: int):
+    """
+    Memory-maps rows [start, stop) of an array file for writing, then flushes and unmaps them.
+    Unmapping after every chunk keeps the written pages out of the process' resident set.
+    """
+    row_shape = array["shape"][1:]
+    row_bytes = array["dtype"].itemsize * int(np.prod(row_shape, dtype=np.int64))
+    window = np.memmap(array["path"], dtype=array["dtype"], mode="r+",
+                       offset=array["offset"] + start * row_bytes, shape=(stop - start,) + row_shape)
+    try:
+        yield window
+    finally:
+        window.flush()
+        del window
+
+
+def is_streamed_mesh(folder_path: str) -> bool:
+    """
+    Returns True if the planet folder holds a streamed (memory-mapped) mesh.
+    """
+    return os.path.exists(os.path.join(folder_path, STREAMED_MESH_DIR, "manifest.json"))
+
+
+def open_streamed_mesh(folder_path: str, mmap_mode: Optional[str] = "r") -> PlanetMesh:
+    """
+    Opens a streamed mesh as a PlanetMesh whose arrays are memory-mapped, so nothing is
+    read from disk until it is accessed. Face geometry fields are mapped on first access.
+
+    :param folder_path: Planet folder
+    :param mmap_mode: numpy memory-map mode ("r" for read-only, "r+" to edit in place)
+    """
+    mesh_folder = os.path.join(folder_path, STREAMED_MESH_DIR)
+    with open(os.path.join(mesh_folder, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    arrays = {
+        name: np.load(os.path.join(mesh_folder, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in ("vertices", "faces", "adjacency")
+        if os.path.exists(os.path.join(mesh_folder, f"{name}.npy"))
+    }
+    logger.info(f"Opened streamed mesh from {mesh_folder}")
+    return PlanetMesh(
+        radius=manifest["radius"],
+        vertices=arrays["vertices"],
+        faces=arrays["faces"],
+        face_geometry=FaceGeometry(sources={
+            name: os.path.join(mesh_folder, f"{name}.npy") for name in FACE_GEOMETRY_ARRAYS
+        }, mmap_mode=mmap_mode),
+        face_adjacency=arrays.get("adjacency"),
+        subdivisions=manifest["subdivisions"],
+    )
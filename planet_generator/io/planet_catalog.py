@@ -0,0 +1,392 @@
+# planet_generator/io/planet_catalog.py
+
+import os
+import json
+import time
+import zlib
+import struct
+import sqlite3
+import argparse
+import numpy as np
+from contextlib import closing
+from dataclasses import dataclass, fields
+from typing import List, Optional, Tuple
+
+from config import ROOT_DIR
+from planet_generator.geometry.hierarchy import FaceHierarchy
+from planet_generator.geometry.locate import FaceLocator
+from logger.logger import LoggerFactory
+
+logger = LoggerFactory("PlanetCatalog").get_logger()
+
+# Folder holding one sub-folder per saved planet, and the catalog file inside it
+PLANETS_DIR = os.path.join(ROOT_DIR, "gamedata", "planets")
+CATALOG_FILE = "catalog.sqlite"
+
+# Bump whenever the table layout changes; older catalogs are rebuilt from the planet folders
+CATALOG_SCHEMA_VERSION = 1
+
+# Equirectangular thumbnail size (width, height) in pixels, and the hierarchy level its pixels are located on
+THUMBNAIL_SIZE = (64, 32)
+THUMBNAIL_LEVEL = 5
+
+# Columns that list() can sort by
+SORT_COLUMNS = ("saved_time", "generation_time", "name", "seed", "radius", "subdivisions",
+                "face_count", "disk_bytes", "data_bytes")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS planets (
+    folder TEXT PRIMARY KEY,            -- planet folder name, relative to the catalog directory
+    name TEXT NOT NULL,
+    seed INTEGER,
+    radius REAL,
+    subdivisions INTEGER,
+    frequency INTEGER,
+    face_count INTEGER,
+    vertex_count INTEGER,
+    disk_bytes INTEGER,                 -- size of the planet folder on disk
+    data_bytes INTEGER,                 -- uncompressed size of its arrays
+    codec TEXT,
+    generation_time TEXT,
+    saved_time REAL,                    -- Unix time of the last save
+    metadata_mtime REAL,                -- mtime of metadata.json when cataloged, to detect outside changes
+    thumbnail BLOB                      -- small grayscale PNG of the elevation (or plate) map
+);
+CREATE INDEX IF NOT EXISTS planets_saved_time ON planets (saved_time);
+CREATE INDEX IF NOT EXISTS planets_name ON planets (name);
+CREATE TABLE IF NOT EXISTS catalog_info (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+@dataclass
+class CatalogEntry:
+    """
+    One saved planet as recorded in the catalog.
+    """
+    folder: str
+    name: str
+    seed: Optional[int] = None
+    radius: Optional[float] = None
+    subdivisions: Optional[int] = None
+    frequency: Optional[int] = None
+    face_count: Optional[int] = None
+    vertex_count: Optional[int] = None
+    disk_bytes: Optional[int] = None
+    data_bytes: Optional[int] = None
+    codec: Optional[str] = None
+    generation_time: Optional[str] = None
+    saved_time: Optional[float] = None
+    metadata_mtime: Optional[float] = None
+    thumbnail: Optional[bytes] = None
+    path: str = ""
+
+
+_COLUMNS = tuple(f.name for f in fields(CatalogEntry) if f.name != "path")
+
+
+class PlanetCatalog:
+    """
+    SQLite index of the planets saved under one directory (gamedata/planets by default), so
+    listing, sorting and filtering saved planets is a single indexed query instead of opening
+    every folder. PlanetIO.save() keeps it current; rebuild() and repair() resync it with the
+    folders after planets were copied, deleted or edited outside the game.
+    """
+
+    def __init__(self, directory: str = PLANETS_DIR):
+        """
+        :param directory: Directory holding one sub-folder per planet; the catalog file lives in it
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, CATALOG_FILE)
+
+    @classmethod
+    def for_folder(cls, folder_path: str) -> "PlanetCatalog":
+        """
+        The catalog covering a planet folder (the one in its parent directory).
+        """
+        return cls(os.path.dirname(os.path.abspath(folder_path)))
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(self.directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10.0)
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT value FROM catalog_info WHERE key = 'schema_version'").fetchone()
+        if row is None:
+            conn.execute("INSERT INTO catalog_info VALUES ('schema_version', ?)", (str(CATALOG_SCHEMA_VERSION),))
+            conn.commit()
+        elif int(row[0]) != CATALOG_SCHEMA_VERSION:
+            raise ValueError(f"Catalog {self.path} has schema version {row[0]}, expected {CATALOG_SCHEMA_VERSION}; "
+                             f"delete it and run rebuild()")
+        return conn
+
+    def update(
+        self,
+        planet,
+        folder_path: str,
+        thumbnail: bool = True,
+        saved_time: Optional[float] = None
+    ) -> CatalogEntry:
+        """
+        Records (or refreshes) a saved planet. Called by PlanetIO.save() after writing the folder.
+
+        :param planet: The saved Planet
+        :param folder_path: Its folder (inside this catalog's directory)
+        :param thumbnail: Render a new thumbnail; if False the recorded one is kept
+        :param saved_time: Unix time of the save (now if omitted)
+        """
+        entry = _entry_from_planet(planet, folder_path, saved_time)
+        with closing(self._connect()) as conn, conn:
+            if thumbnail:
+                entry.thumbnail = render_thumbnail(planet)
+            else:
+                row = conn.execute("SELECT thumbnail FROM planets WHERE folder = ?", (entry.folder,)).fetchone()
+                entry.thumbnail = row[0] if row else render_thumbnail(planet)
+            conn.execute(f"INSERT OR REPLACE INTO planets ({', '.join(_COLUMNS)}) "
+                         f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                         tuple(getattr(entry, column) for column in _COLUMNS))
+        return entry
+
+    def remove(self, folder: str) -> bool:
+        """
+        Drops a planet from the catalog (its folder is left alone). Returns True if it was listed.
+        """
+        with closing(self._connect()) as conn, conn:
+            return conn.execute("DELETE FROM planets WHERE folder = ?", (os.path.basename(folder),)).rowcount > 0
+
+    def get(self, folder: str, thumbnail: bool = True) -> Optional[CatalogEntry]:
+        """
+        Returns the entry of one planet folder (by path or folder name), or None.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(f"SELECT {self._select(thumbnail)} FROM planets WHERE folder = ?",
+                               (os.path.basename(folder),)).fetchone()
+        return None if row is None else self._entry(row)
+
+    def list(
+        self,
+        sort_by: str = "saved_time",
+        descending: bool = True,
+        name: Optional[str] = None,
+        seed: Optional[int] = None,
+        min_faces: Optional[int] = None,
+        max_faces: Optional[int] = None,
+        subdivisions: Optional[int] = None,
+        limit: Optional[int] = None,
+        thumbnails: bool = False
+    ) -> List[CatalogEntry]:
+        """
+        Lists cataloged planets, sorted and filtered in SQL.
+
+        :param sort_by: One of SORT_COLUMNS
+        :param descending: Sort order (newest / largest first by default)
+        :param name: Case-insensitive substring the planet name must contain
+        :param seed: Exact seed
+        :param min_faces: Minimum face count
+        :param max_faces: Maximum face count
+        :param subdivisions: Exact subdivision level
+        :param limit: Maximum number of entries
+        :param thumbnails: Also return the thumbnail PNGs (left out by default to keep listings fast)
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by '{sort_by}'; expected one of {', '.join(SORT_COLUMNS)}")
+        clauses, parameters = [], []
+        if name:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            parameters.append("%" + name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        for column, operator, value in (("seed", "=", seed), ("face_count", ">=", min_faces),
+                                        ("face_count", "<=", max_faces), ("subdivisions", "=", subdivisions)):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                parameters.append(value)
+        query = f"SELECT {self._select(thumbnails)} FROM planets"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY {sort_by} {'DESC' if descending else 'ASC'}, folder"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(int(limit))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, parameters).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def most_recent(self) -> Optional[CatalogEntry]:
+        """
+        The most recently saved planet, or None if the catalog is empty.
+        """
+        entries = self.list(limit=1)
+        return entries[0] if entries else None
+
+    def rebuild(self) -> int:
+        """
+        Recreates the catalog from scratch by opening every planet folder. Returns the planet count.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        added, _, _ = self.repair()
+        logger.info(f"Rebuilt catalog {self.path} with {added} planets")
+        return added
+
+    def repair(self) -> Tuple[int, int, int]:
+        """
+        Resyncs the catalog with the planet folders without touching unchanged entries: adds
+        folders it is missing, refreshes those whose metadata.json changed since they were
+        cataloged, and drops entries whose folder is gone.
+
+        :return: (added, refreshed, removed) counts
+        """
+        # Imported here: planet_io maintains the catalog, so it imports this module
+        from planet_generator.io.planet_io import PlanetIO
+
+        with closing(self._connect()) as conn:
+            known = dict(conn.execute("SELECT folder, metadata_mtime FROM planets").fetchall())
+        on_disk = {}
+        if os.path.isdir(self.directory):
+            for folder in os.listdir(self.directory):
+                metadata_path = os.path.join(self.directory, folder, "metadata.json")
+                if os.path.exists(metadata_path):
+                    on_disk[folder] = os.path.getmtime(metadata_path)
+
+        added = refreshed = 0
+        for folder, mtime in sorted(on_disk.items()):
+            if folder in known and known[folder] == mtime:
+                continue
+            try:
+                planet = PlanetIO.load(os.path.join(self.directory, folder))
+            except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+                logger.warning(f"Cannot catalog {folder}: {e}")
+                continue
+            self.update(planet, os.path.join(self.directory, folder), saved_time=mtime)
+            if folder in known:
+                refreshed += 1
+            else:
+                added += 1
+
+        stale = [folder for folder in known if folder not in on_disk]
+        if stale:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("DELETE FROM planets WHERE folder = ?", [(folder,) for folder in stale])
+        logger.info(f"Catalog repair: {added} added, {refreshed} refreshed, {len(stale)} removed")
+        return added, refreshed, len(stale)
+
+    @staticmethod
+    def _select(thumbnail: bool) -> str:
+        return ", ".join(column if thumbnail or column != "thumbnail" else "NULL" for column in _COLUMNS)
+
+    def _entry(self, row) -> CatalogEntry:
+        entry = CatalogEntry(*row)
+        entry.path = os.path.join(self.directory, entry.folder)
+        return entry
+
+
+def render_thumbnail(planet, size: Tuple[int, int] = THUMBNAIL_SIZE) -> Optional[bytes]:
+    """
+    Renders a small equirectangular grayscale PNG of the planet's elevation (or plate map).
+    Pixels are located on a coarse level of the face hierarchy (cheap at any mesh size) and
+    sample the central finest-level descendant of their coarse face. Returns None if the planet
+    has neither layer or its mesh has no subdivision hierarchy.
+    """
+    layer = planet.elevation if planet.elevation is not None else planet.cratons
+    subdivisions = getattr(planet.mesh, "subdivisions", None)
+    if layer is None or subdivisions is None:
+        return None
+    width, height = size
+    lat = 90.0 - (np.arange(height) + 0.5) * 180.0 / height
+    lon = -180.0 + (np.arange(width) + 0.5) * 360.0 / width
+    lat, lon = np.meshgrid(lat, lon, indexing="ij")
+
+    level = min(subdivisions, THUMBNAIL_LEVEL)
+    hierarchy = FaceHierarchy(subdivisions)
+    locator = FaceLocator(planet.mesh.vertices, hierarchy.coarse_faces(planet.mesh.faces, level), level)
+    coarse, _ = locator.locate(lat.reshape(-1), lon.reshape(-1))
+    # Following the center child (3) down each level: f -> 4f + 3
+    span = 4 ** (subdivisions - level)
+    values = np.asarray(layer[coarse * span + (span - 1)], dtype=np.float64)
+    if planet.elevation is None:
+        values = (values * 97) % 256  # spread plate ids over the gray range
+    else:
+        low, high = values.min(), values.max()
+        values = (values - low) / (high - low) * 255.0 if high > low else np.full_like(values, 128.0)
+    return encode_png(values.reshape(height, width).astype(np.uint8))
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """
+    Encodes an 8-bit grayscale image (height, width) as PNG, using only zlib.
+    """
+    height, width = image.shape
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = np.hstack([np.zeros((height, 1), dtype=np.uint8), image.astype(np.uint8)])  # filter type 0 per row
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows.tobytes(), 9))
+            + chunk(b"IEND", b""))
+
+
+def _entry_from_planet(planet, folder_path: str, saved_time: Optional[float] = None) -> CatalogEntry:
+    """
+    Catalog fields of a saved planet: its metadata, mesh counts and on-disk / in-memory sizes.
+    The save time defaults to now.
+    """
+    mesh = planet.mesh
+    disk_bytes = 0
+    for root, _, names in os.walk(folder_path):
+        disk_bytes += sum(os.path.getsize(os.path.join(root, name)) for name in names)
+    data_bytes = sum(a.nbytes for a in (mesh.vertices, mesh.faces, mesh.adjacency, planet.elevation, planet.cratons)
+                     if a is not None)
+    metadata_path = os.path.join(folder_path, "metadata.json")
+    codec = None
+    if os.path.exists(metadata_path):
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            codec = json.load(f).get("codec")
+    return CatalogEntry(
+        folder=os.path.basename(os.path.abspath(folder_path)),
+        name=planet.name,
+        seed=planet.seed,
+        radius=float(mesh.radius),
+        subdivisions=getattr(mesh, "subdivisions", None),
+        frequency=getattr(mesh, "frequency", None),
+        face_count=len(mesh.faces),
+        vertex_count=len(mesh.vertices),
+        disk_bytes=disk_bytes,
+        data_bytes=data_bytes,
+        codec=codec,
+        generation_time=planet.generation_time,
+        saved_time=time.time() if saved_time is None else saved_time,
+        metadata_mtime=os.path.getmtime(metadata_path) if os.path.exists(metadata_path) else None,
+        path=os.path.abspath(folder_path),
+    )
+
+
+def main():
+    """
+    Lists the cataloged planets, or rebuilds / repairs the catalog from the planet folders.
+    """
+    parser = argparse.ArgumentParser(description="TVG saved planet catalog")
+    parser.add_argument("--directory", type=str, default=PLANETS_DIR, help="Directory holding the planet folders")
+    parser.add_argument("--rebuild", action="store_true", help="Recreate the catalog from every planet folder")
+    parser.add_argument("--repair", action="store_true", help="Add, refresh and drop entries to match the folders")
+    parser.add_argument("--sort", type=str, default="saved_time", choices=SORT_COLUMNS, help="Sort column")
+    parser.add_argument("--ascending", action="store_true", help="Sort ascending")
+    parser.add_argument("--name", type=str, help="Only planets whose name contains this text")
+    parser.add_argument("--limit", type=int, help="Maximum number of planets to list")
+    args = parser.parse_args()
+
+    catalog = PlanetCatalog(args.directory)
+    if args.rebuild:
+        catalog.rebuild()
+    elif args.repair or not catalog.exists():
+        catalog.repair()
+    for entry in catalog.list(args.sort, not args.ascending, name=args.name, limit=args.limit):
+        saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.saved_time)) if entry.saved_time else "?"
+        logger.info(f"{entry.name:<24} seed {entry.seed:<8} {entry.face_count or 0:>12,} faces  "
+                    f"{(entry.disk_bytes or 0) / 1e6:>9.1f} MB  saved {saved}  ({entry.folder})")
+
+
+if __name__ == "__main__":
+    main()
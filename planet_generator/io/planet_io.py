@@ -1,21 +1,45 @@
 import os
+import shutil
 import json
 import joblib
+import hashlib
+import sqlite3
 import numpy as np
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Set, Union
 
+from planet_generator.planet_config import PLANET_CONFIG
 from planet_generator.planet_mesh import PlanetMesh
+from planet_generator.io.topology_store import TopologyStore
+from planet_generator.io.mesh_format import (
+    MESH_DIR, save_mesh_folder, open_mesh_folder, read_mesh_manifest, save_array, open_array, array_file, is_stored,
+    array_checksum, write_json_atomic, remove_array_files
+)
+from planet_generator.io.chunk_store import ChunkedArray, CodecSpec
+from planet_generator.io.planet_catalog import PlanetCatalog
+from planet_generator.geometry.adjacency import build_face_adjacency_array
+from planet_generator.geometry.spatial_index import SpatialIndex
 from logger.logger import LoggerFactory
 
 logger = LoggerFactory("PlanetIO").get_logger()
 
+# Sub-folder of a planet folder that holds the saved face spatial index
+SPATIAL_INDEX_DIR = "spatial_index"
+
+
+# Parts of a Planet that are saved separately and tracked for incremental saves
+PLANET_LAYERS = ("mesh", "elevation", "cratons", "biome_tags")
+
 
 @dataclass
 class Planet:
     """
     Wrapper class for a full planet, including geometry, simulation layers, and metadata.
+
+    Assigning a layer (planet.elevation = ...) marks it dirty; edits made in place must be
+    flagged with mark_dirty(). PlanetIO.save() then rewrites only dirty layers when saving back
+    to the folder the planet was loaded from or last saved to (see saved_folder).
     """
     name: str
     seed: int
@@ -25,86 +49,257 @@ class Planet:
     biome_tags: Optional[List[str]] = None        # list of biome tags per face or index map
     generation_time: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     version: str = "1.0"
+    saved_folder: Optional[str] = field(default=None, repr=False, compare=False)
+    dirty: Set[str] = field(default_factory=set, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in PLANET_LAYERS and "dirty" in self.__dict__:
+            self.dirty.add(name)
+
+    def mark_dirty(self, *layers: str) -> None:
+        """
+        Flags layers edited in place (e.g. planet.elevation[faces] += 1) for the next save.
+        """
+        unknown = set(layers) - set(PLANET_LAYERS)
+        if unknown:
+            raise ValueError(f"Unknown planet layers {sorted(unknown)}; expected {', '.join(PLANET_LAYERS)}")
+        self.dirty.update(layers)
 
 
 class PlanetIO:
     """
     Handles saving and loading Planet objects using modular file-based layout.
+
+    The mesh is saved in columnar form (see mesh_format): one raw .npy file per array under
+    mesh/, plus a manifest with dtypes, shapes and checksums, and is memory-mapped on load.
+    Meshes that came from the shared TopologyStore are saved without their faces and adjacency;
+    the manifest references the store entry instead. Streamed meshes (see mesh_stream) use the
+    same layout and are not rewritten. Folders saved before the columnar format (mesh.joblib)
+    still load.
+
+    Saving with a codec (PLANET_CONFIG["save_codec"] by default) stores the mesh and layers as
+    chunked, compressed files instead (see chunk_store), each array compressed chunk-parallel
+    in a thread pool; open_layer() then reads any face range or face set of a layer while
+    decompressing only the chunks it covers.
     """
 
     @staticmethod
-    def save(planet: Planet, folder_path: str) -> None:
+    def save(
+        planet: Planet,
+        folder_path: str,
+        codec: Optional[str] = PLANET_CONFIG.get("save_codec"),
+        verify: bool = False,
+        catalog: bool = True
+    ) -> None:
+        """
+        Saves incrementally: metadata.json keeps a content checksum per layer (the mesh manifest
+        one per mesh array), and only arrays whose content or storage changed are written, each
+        to a temporary file renamed into place. Saving back to the planet's own folder trusts
+        its dirty flags and does not even hash clean layers, so a save after a one-layer edit
+        costs time proportional to that layer.
+
+        :param planet: Planet to save
+        :param folder_path: Planet folder
+        :param codec: Optional chunk codec spec: "none", "zlib-1".."zlib-9", "lzma-0".."lzma-9", "bz2-1".."bz2-9",
+                      optionally prefixed with "delta+" / "shuffle+" filters (see chunk_store.CodecSpec).
+                      None saves raw, memory-mappable .npy arrays (fastest to save and open).
+        :param verify: Hash every layer instead of trusting the dirty flags (catches unflagged in-place edits)
+        :param catalog: Record the save in the PlanetCatalog of the folder's parent directory
+        """
         os.makedirs(folder_path, exist_ok=True)
+        metadata_path = os.path.join(folder_path, "metadata.json")
+        previous = {}
+        if os.path.exists(metadata_path):
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        previous_layers = previous.get("layers", {})
+        in_sync = not verify and planet.saved_folder is not None and \
+            os.path.abspath(planet.saved_folder) == os.path.abspath(folder_path)
 
-        # Save mesh using joblib with higher compression
-        mesh_path = os.path.join(folder_path, "mesh.joblib")
-        joblib.dump(planet.mesh, mesh_path, compress=("lzma", 9))
-        logger.info(f"Saved mesh to {mesh_path}")
+        def clean(layer):
+            return in_sync and layer not in planet.dirty
 
-        # Save elevation
-        if planet.elevation is not None:
-            elevation_path = os.path.join(folder_path, "elevation.npy")
-            np.save(elevation_path, planet.elevation)
-            logger.info(f"Saved elevation to {elevation_path}")
+        # Save the mesh as raw arrays, leaving out shared topology
+        written = set()
+        mesh = planet.mesh
+        topology_key = getattr(mesh, "topology_key", None)
+        mesh_manifest = read_mesh_manifest(folder_path)
+        if clean("mesh") and mesh_manifest is not None and all(
+                is_stored(os.path.join(folder_path, MESH_DIR), name, entry, codec)
+                for name, entry in mesh_manifest["arrays"].items()):
+            logger.info("Mesh unchanged; not saved")
         else:
-            logger.info("No elevation data to save.")
+            save_mesh_folder(mesh, folder_path, codec)
+            written.add("mesh")
+        legacy_path = os.path.join(folder_path, "mesh.joblib")
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
 
-        # Save craton map
-        if planet.cratons is not None:
-            cratons_path = os.path.join(folder_path, "cratons.npy")
-            np.save(cratons_path, planet.cratons)
-            logger.info(f"Saved craton map to {cratons_path}")
-        else:
-            logger.info("No craton map to save.")
+        # Save the spatial index if one was built, as memory-mappable arrays
+        spatial_index = getattr(planet.mesh, "_spatial_index", None)
+        index_path = os.path.join(folder_path, SPATIAL_INDEX_DIR)
+        if spatial_index is not None and not _is_mapped_from(spatial_index.points, index_path):
+            spatial_index.save(index_path)
+            logger.info(f"Saved spatial index to {index_path}")
+        elif spatial_index is None and os.path.exists(index_path):
+            shutil.rmtree(index_path)
+            logger.info(f"Removed stale spatial index {index_path}")
+
+        # Save the per-face layers (elevation, craton map) and biome tags, skipping unchanged ones
+        layers = {}
+        for name in ("elevation", "cratons"):
+            array = getattr(planet, name)
+            entry = previous_layers.get(name)
+            if array is None:
+                if entry is not None or array_file(folder_path, name) is not None:
+                    remove_array_files(folder_path, name)
+                    logger.info(f"Removed saved {name}; the planet no longer has it")
+                continue
+            if entry is not None and is_stored(folder_path, name, entry, codec) and (
+                    clean(name) or entry.get("checksum") == array_checksum(array)):
+                layers[name] = entry
+                continue
+            layers[name] = save_array(folder_path, name, array, codec)
+            written.add(name)
+            layers[name]["checksum"] = array_checksum(array)
+            logger.info(f"Saved {name} to {folder_path}")
 
-        # Save biome tags (as JSON string list)
+        biomes_path = os.path.join(folder_path, "biomes.json")
         if planet.biome_tags is not None:
-            biomes_path = os.path.join(folder_path, "biomes.json")
-            with open(biomes_path, "w", encoding="utf-8") as f:
-                json.dump(planet.biome_tags, f, indent=2)
-            logger.info(f"Saved biome tags to {biomes_path}")
-        else:
-            logger.info("No biome tags to save.")
+            entry = previous_layers.get("biome_tags")
+            unchanged = entry is not None and os.path.exists(biomes_path) and (
+                clean("biome_tags") or entry.get("checksum") == _json_checksum(planet.biome_tags))
+            if unchanged:
+                layers["biome_tags"] = entry
+            else:
+                write_json_atomic(biomes_path, planet.biome_tags)
+                layers["biome_tags"] = {"checksum": _json_checksum(planet.biome_tags)}
+                logger.info(f"Saved biome tags to {biomes_path}")
+        elif os.path.exists(biomes_path):
+            os.remove(biomes_path)
+            logger.info("Removed saved biome tags; the planet no longer has them")
 
-        # Save metadata
+        # Save metadata (only if it changed), with the layer checksums the next save compares against
         metadata = {
             "name": planet.name,
             "seed": planet.seed,
             "generation_time": planet.generation_time,
             "version": planet.version,
+            "radius": planet.mesh.radius,
+            "subdivisions": getattr(planet.mesh, "subdivisions", None),
+            "frequency": getattr(planet.mesh, "frequency", None),
         }
-        metadata_path = os.path.join(folder_path, "metadata.json")
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
-        logger.info(f"Saved metadata to {metadata_path}")
+        if topology_key is not None:
+            metadata["topology"] = topology_key
+        metadata["mesh"] = "columnar"
+        if codec is not None:
+            metadata["codec"] = str(CodecSpec.parse(codec))
+        metadata["layers"] = layers
+        if metadata != previous:
+            write_json_atomic(metadata_path, metadata)
+            logger.info(f"Saved metadata to {metadata_path}")
 
+        # Keep the catalog of saved planets current; the thumbnail is re-rendered only if the map changed
+        if catalog:
+            try:
+                PlanetCatalog.for_folder(folder_path).update(
+                    planet, folder_path, thumbnail=bool(written & {"mesh", "elevation", "cratons"}))
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Could not update the planet catalog: {e}")
+
+        planet.saved_folder = folder_path
+        planet.dirty.clear()
         logger.info(f"Planet save complete: {folder_path}")
 
     @staticmethod
-    def load(folder_path: str) -> Planet:
-        # Load mesh
-        mesh_path = os.path.join(folder_path, "mesh.joblib")
+    def load_mesh(folder_path: str, topology_store: Optional[TopologyStore] = None) -> PlanetMesh:
+        """
+        Loads only the mesh of a saved planet, with its arrays memory-mapped (re-attaching shared
+        topology from the store), so nothing is read until it is touched.
+        """
+        if read_mesh_manifest(folder_path) is not None:
+            mesh = open_mesh_folder(folder_path, topology_store)
+        else:
+            mesh = PlanetIO._load_legacy_mesh(os.path.join(folder_path, "mesh.joblib"), topology_store)
+
+        # Attach a saved spatial index, memory-mapped so worker processes share one copy
+        index_path = os.path.join(folder_path, SPATIAL_INDEX_DIR)
+        if os.path.exists(os.path.join(index_path, "manifest.json")):
+            try:
+                spatial_index = SpatialIndex.load(index_path)
+            except ValueError as e:
+                logger.warning(f"Saved spatial index is unusable: {e}")
+            else:
+                if len(spatial_index) == len(mesh.faces):
+                    mesh._spatial_index = spatial_index
+                    logger.info(f"Loaded spatial index from {index_path}")
+                else:
+                    logger.warning(f"Saved spatial index covers {len(spatial_index)} faces, "
+                                   f"mesh has {len(mesh.faces)}; ignoring it")
+        return mesh
+
+    @staticmethod
+    def _load_legacy_mesh(mesh_path: str, topology_store: Optional[TopologyStore]) -> PlanetMesh:
+        """
+        Loads a mesh pickled with joblib by earlier versions, re-attaching shared topology
+        if it was saved without it.
+        """
         mesh = joblib.load(mesh_path)
         logger.info(f"Loaded mesh from {mesh_path}")
 
+        if getattr(mesh, "topology_key", None) is not None and mesh.faces is None:
+            store = topology_store or TopologyStore()
+            topology = store.load_or_rebuild(mesh.topology_key, mesh.subdivisions, mesh.frequency)
+            mesh.vertices = topology.scaled_vertices(mesh.radius)
+            mesh.faces = topology.faces
+            mesh.adjacency = topology.adjacency
+            mesh._vertex_faces = topology.vertex_faces
+            mesh._vertex_vertices = topology.vertex_vertices
+            mesh._face_ring = topology.face_ring
+            mesh.topology_key = topology.key
+            mesh.geometry.bind(mesh.vertices, mesh.faces)
+            logger.info(f"Attached shared topology {topology.key}")
+        elif isinstance(mesh.adjacency, dict):
+            # Meshes saved before adjacency became an array
+            mesh.adjacency = build_face_adjacency_array(mesh.faces)
+        return mesh
+
+    @staticmethod
+    def open_layer(folder_path: str, name: str) -> Union[np.ndarray, ChunkedArray]:
+        """
+        Opens one saved per-face layer (e.g. "elevation") for random access without loading the
+        planet: raw layers are memory-mapped read-only, compressed ones returned as a ChunkedArray
+        that decompresses only the chunks a slice or index array covers. Either works with
+        MeshRegion.gather().
+        """
+        layer = open_array(folder_path, name, mmap_mode="r", lazy=True)
+        if layer is None:
+            raise FileNotFoundError(f"No layer '{name}' in {folder_path}")
+        return layer
+
+    @staticmethod
+    def load(folder_path: str) -> Planet:
+        # Load mesh
+        mesh = PlanetIO.load_mesh(folder_path)
+
         # Load metadata
         metadata_path = os.path.join(folder_path, "metadata.json")
         with open(metadata_path, "r", encoding="utf-8") as f:
             metadata = json.load(f)
         logger.info(f"Loaded metadata from {metadata_path}")
 
-        # Optional layers
-        elevation_path = os.path.join(folder_path, "elevation.npy")
-        elevation = np.load(elevation_path) if os.path.exists(elevation_path) else None
+        # Optional layers, memory-mapped copy-on-write: paged in on access, editable in memory
+        # (compressed layers are decompressed in parallel instead)
+        elevation = open_array(folder_path, "elevation", mmap_mode="c")
         if elevation is not None:
-            logger.info(f"Loaded elevation from {elevation_path}")
+            logger.info(f"Loaded elevation from {folder_path}")
         else:
             logger.info("No elevation data found.")
 
-        cratons_path = os.path.join(folder_path, "cratons.npy")
-        cratons = np.load(cratons_path) if os.path.exists(cratons_path) else None
+        cratons = open_array(folder_path, "cratons", mmap_mode="c")
         if cratons is not None:
-            logger.info(f"Loaded craton map from {cratons_path}")
+            logger.info(f"Loaded craton map from {folder_path}")
         else:
             logger.info("No craton map found.")
 
@@ -128,4 +323,20 @@ class PlanetIO:
             elevation=elevation,
             cratons=cratons,
             biome_tags=biomes,
+            saved_folder=folder_path,
         )
+
+
+def _json_checksum(data) -> str:
+    """
+    Content checksum of JSON-serializable data, in the same form as mesh_format.array_checksum.
+    """
+    return f"blake2b:{hashlib.blake2b(json.dumps(data).encode('utf-8'), digest_size=16).hexdigest()}"
+
+
+def _is_mapped_from(array: np.ndarray, folder: str) -> bool:
+    """
+    True if the array is memory-mapped from a file inside the given folder.
+    """
+    filename = getattr(array, "filename", None)
+    return filename is not None and os.path.abspath(os.path.dirname(filename)) == os.path.abspath(folder)
@@ -0,0 +1,270 @@
+# planet_generator/io/topology_store.py
+
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional
+
+from config import ROOT_DIR
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.adjacency import (
+    FaceAdjacencyMap, CSRIndex,
+    build_vertex_face_index, build_vertex_vertex_index, build_face_ring_index
+)
+from logger.logger import LoggerFactory
+
+logger = LoggerFactory("TopologyStore").get_logger()
+
+# Bump whenever the layout or meaning of a stored array changes; old entries are then ignored.
+TOPOLOGY_FORMAT_VERSION = 3
+
+DEFAULT_TOPOLOGY_DIR = os.path.join(ROOT_DIR, "gamedata", "topology")
+
+TOPOLOGY_ARRAYS = (
+    "unit_vertices", "faces", "adjacency",
+    "vertex_face_offsets", "vertex_face_indices",
+    "vertex_vertex_offsets", "vertex_vertex_indices",
+    "face_ring_offsets", "face_ring_indices",
+)
+
+
+def topology_spec(subdivisions: Optional[int] = None, frequency: Optional[int] = None, layout: Optional[str] = None) -> dict:
+    """
+    Describes a mesh topology by how it is built. Radius is not part of it: it only scales positions.
+
+    :param subdivisions: Recursive subdivision level
+    :param frequency: Geodesic frequency; takes precedence over subdivisions when set
+    :param layout: Vertex numbering of a recursive mesh: None for the serial order, or "patch"
+                   for the per-base-face order of parallel generation
+    :return: Canonical spec dictionary, including the store format version
+    """
+    if frequency is not None:
+        spec = {"kind": "geodesic", "frequency": int(frequency)}
+    elif subdivisions is not None:
+        spec = {"kind": "icosphere", "subdivisions": int(subdivisions)}
+        if layout is not None:
+            if layout != "patch":
+                raise ValueError(f"Unknown icosphere vertex layout: {layout}")
+            spec["layout"] = layout
+    else:
+        raise ValueError("A topology needs either a subdivision level or a geodesic frequency")
+    spec["format_version"] = TOPOLOGY_FORMAT_VERSION
+    return spec
+
+
+def topology_key(spec: dict) -> str:
+    """
+    Content address of a topology spec: a readable prefix plus a hash of the canonical spec.
+    """
+    digest = hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+    size = spec.get("subdivisions", spec.get("frequency"))
+    return f"{spec['kind']}-{size}-{digest[:12]}"
+
+
+@dataclass
+class Topology:
+    """
+    Radius-independent mesh topology loaded from the store.
+    Arrays are memory-mapped read-only when loaded from disk.
+    """
+    key: str
+    spec: dict
+    unit_vertices: np.ndarray        # shape (n, 3), on the unit sphere
+    faces: np.ndarray                # shape (m, 3)
+    adjacency: np.ndarray            # shape (m, 3) - neighbor face across each edge, in edge order
+    vertex_face_offsets: np.ndarray  # shape (n + 1,) - CSR row offsets into vertex_face_indices
+    vertex_face_indices: np.ndarray  # shape (3m,) - faces around each vertex
+    vertex_vertex_offsets: np.ndarray  # shape (n + 1,)
+    vertex_vertex_indices: np.ndarray  # vertices sharing an edge with each vertex
+    face_ring_offsets: np.ndarray    # shape (m + 1,)
+    face_ring_indices: np.ndarray    # faces sharing a vertex with each face
+
+    @property
+    def subdivisions(self) -> Optional[int]:
+        return self.spec.get("subdivisions")
+
+    @property
+    def frequency(self) -> Optional[int]:
+        return self.spec.get("frequency")
+
+    def scaled_vertices(self, radius: float) -> np.ndarray:
+        """
+        Returns the vertices scaled to the given planet radius, as float32.
+        """
+        return (np.asarray(self.unit_vertices, dtype=np.float64) * radius).astype(np.float32)
+
+    @property
+    def vertex_faces(self) -> CSRIndex:
+        return CSRIndex(self.vertex_face_offsets, self.vertex_face_indices)
+
+    @property
+    def vertex_vertices(self) -> CSRIndex:
+        return CSRIndex(self.vertex_vertex_offsets, self.vertex_vertex_indices)
+
+    @property
+    def face_ring(self) -> CSRIndex:
+        return CSRIndex(self.face_ring_offsets, self.face_ring_indices)
+
+    def adjacency_map(self) -> FaceAdjacencyMap:
+        """
+        Returns a dictionary-style view of the face adjacency.
+        """
+        return FaceAdjacencyMap(self.adjacency)
+
+
+class TopologyStore:
+    """
+    Content-addressed cache of icosphere topologies shared by every planet.
+
+    Each entry is a folder of raw .npy arrays plus a manifest, keyed by the topology spec
+    (subdivision level or geodesic frequency, and format version). Entries are written once,
+    atomically, and are memory-mapped when loaded.
+    """
+
+    def __init__(self, root_dir: str = DEFAULT_TOPOLOGY_DIR):
+        self.root_dir = root_dir
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root_dir, key)
+
+    def contains(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self.path_for(key), "manifest.json"))
+
+    def get_or_build(
+        self,
+        subdivisions: Optional[int] = None,
+        frequency: Optional[int] = None,
+        workers: Optional[int] = None,
+        layout: Optional[str] = None
+    ) -> Topology:
+        """
+        Returns the topology for the given level or frequency, building and storing it on first use.
+
+        :param workers: Build recursive meshes in parallel with this many processes. Parallel
+                        builds use the patch vertex layout, which is stored under its own key
+                        (shared by every worker count, since the numbering does not depend on it).
+        :param layout: Vertex layout of a recursive mesh ("patch" or None); "patch" is implied by workers
+        """
+        if layout is None and workers and frequency is None:
+            layout = "patch"
+        spec = topology_spec(subdivisions, frequency, layout=layout)
+        key = topology_key(spec)
+        if not self.contains(key):
+            self._build(spec, key, workers)
+        return self.load(key)
+
+    def load(self, key: str, mmap_mode: Optional[str] = "r") -> Topology:
+        """
+        Loads a stored topology. Arrays are memory-mapped unless mmap_mode is None.
+        """
+        folder = self.path_for(key)
+        with open(os.path.join(folder, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest["spec"].get("format_version") != TOPOLOGY_FORMAT_VERSION:
+            raise ValueError(f"Topology {key} has format version {manifest['spec'].get('format_version')}, "
+                             f"expected {TOPOLOGY_FORMAT_VERSION}")
+
+        arrays = {
+            name: np.load(os.path.join(folder, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in TOPOLOGY_ARRAYS
+        }
+        logger.info(f"Loaded topology {key} from {folder}")
+        return Topology(key=key, spec=manifest["spec"], **arrays)
+
+    def load_or_rebuild(self, key: str, subdivisions: Optional[int] = None, frequency: Optional[int] = None) -> Topology:
+        """
+        Loads the topology a saved mesh refers to. If it is missing or unusable (e.g. an older
+        format version), the topology is rebuilt from the level or frequency in the vertex layout
+        of the key's spec, so vertex numbering (and any per-vertex data saved with the mesh) is
+        kept. A key whose spec cannot be recovered is refused rather than renumbered.
+        """
+        try:
+            topology = self.load(key) if self.contains(key) else None
+        except ValueError as e:
+            logger.warning(f"Stored topology is unusable: {e}")
+            topology = None
+        if topology is None:
+            layout = self._layout_of(key, subdivisions, frequency)
+            topology = self.get_or_build(subdivisions, frequency, layout=layout)
+        if topology.key != key:
+            logger.warning(f"Topology {key} not found; rebuilt as {topology.key}")
+        return topology
+
+    def _layout_of(self, key: str, subdivisions: Optional[int], frequency: Optional[int]) -> Optional[str]:
+        """
+        Returns the vertex layout a topology key was built with: from its stored manifest if one
+        is left (of any format version), otherwise by matching the key against the spec of every
+        layout and format version for the level or frequency.
+        """
+        manifest_path = os.path.join(self.path_for(key), "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)["spec"].get("layout")
+        layouts = (None,) if frequency is not None else (None, "patch")
+        for layout in layouts:
+            spec = topology_spec(subdivisions, frequency, layout=layout)
+            for version in range(1, TOPOLOGY_FORMAT_VERSION + 1):
+                if topology_key(dict(spec, format_version=version)) == key:
+                    return layout
+        raise ValueError(f"Topology {key} does not match any vertex layout of the saved level or frequency; "
+                         f"refusing to rebuild it with different vertex numbering")
+
+    def _build(self, spec: dict, key: str, workers: Optional[int] = None) -> None:
+        """
+        Generates a topology on the unit sphere and writes it to the store.
+        The entry is written to a temporary folder first and renamed into place.
+        """
+        logger.info(f"Building topology {key}...")
+        if spec.get("layout") == "patch":
+            workers = workers or 1
+        else:
+            workers = None
+        generator = IcosphereGenerator(
+            1.0, spec.get("subdivisions", 0), frequency=spec.get("frequency"), workers=workers
+        )
+        unit_vertices, faces = generator.generate()
+        adjacency = generator.face_adjacency()
+
+        # Vertex and face neighborhoods in compressed sparse row form
+        vertex_faces = build_vertex_face_index(faces, len(unit_vertices))
+        vertex_vertices = build_vertex_vertex_index(faces, len(unit_vertices))
+        face_ring = build_face_ring_index(faces, vertex_faces)
+
+        arrays = {
+            "unit_vertices": unit_vertices,
+            "faces": faces,
+            "adjacency": adjacency,
+            "vertex_face_offsets": vertex_faces.offsets,
+            "vertex_face_indices": vertex_faces.indices,
+            "vertex_vertex_offsets": vertex_vertices.offsets,
+            "vertex_vertex_indices": vertex_vertices.indices,
+            "face_ring_offsets": face_ring.offsets,
+            "face_ring_indices": face_ring.indices,
+        }
+
+        folder = self.path_for(key)
+        tmp_folder = f"{folder}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        os.makedirs(tmp_folder)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_folder, f"{name}.npy"), array)
+
+        manifest = {
+            "key": key,
+            "spec": spec,
+            "arrays": {name: {"dtype": str(a.dtype), "shape": list(a.shape)} for name, a in arrays.items()},
+        }
+        with open(os.path.join(tmp_folder, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        try:
+            os.rename(tmp_folder, folder)
+        except OSError:
+            # Another process stored the same topology first; its copy is identical.
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+            if not self.contains(key):
+                raise
+        logger.info(f"Stored topology {key} in {folder}")
@@ -4,5 +4,9 @@
 PLANET_CONFIG = {
     "planet_radius": 6371,          # Radius of the planet in kilometers (Earth-like)
     "subdivisions": 6,              # How many times to subdivide the icosahedron
+    "stream_subdivisions": 10,      # From this level on, the mesh is streamed to memory-mapped files
+    "memory_budget_mb": 8192,       # Generation requests estimated to need more memory than this are refused
+    "time_warning_seconds": 600,    # Warn before generations estimated to take longer than this
+    "save_codec": None,             # PlanetIO codec spec, e.g. "zlib-1" or "delta+shuffle+lzma-6"; None saves raw .npy
     "debug_wireframe": True,        # Whether to display the planet in wireframe or fully rendered
 }
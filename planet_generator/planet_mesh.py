@@ -1,21 +1,22 @@
 # planet_generator/planet_mesh.py
 
-from typing import List, Dict, Optional, Set
+from collections.abc import Mapping
+from typing import List, Dict, Optional, Set, Tuple, Union
 import numpy as np
-from dataclasses import dataclass
-
-
-@dataclass
-class FaceGeometry:
-    centers: np.ndarray      # shape (n, 3)
-    normals: np.ndarray      # shape (n, 3)
-    areas: np.ndarray        # shape (n,)
-    latitudes: np.ndarray    # shape (n,)
-    longitudes: np.ndarray   # shape (n,)
-    slopes: np.ndarray       # shape (n,)
-
 
 from logger.logger import LoggerFactory
+from planet_generator.geometry.face_geometry import FaceGeometry
+from planet_generator.geometry.hierarchy import FaceHierarchy
+from planet_generator.geometry.adjacency import (
+    build_face_adjacency_array, FaceAdjacencyMap, CSRIndex,
+    build_vertex_face_index, build_vertex_vertex_index, build_face_ring_index
+)
+from planet_generator.geometry.goldberg import GoldbergTiles, build_goldberg_tiles
+from planet_generator.geometry.neighborhood import NeighborhoodIndex, k_disks
+from planet_generator.geometry.operators import MeshOperators
+from planet_generator.geometry.locate import FaceLocator, lat_lon_to_unit
+from planet_generator.geometry.spatial_index import SpatialIndex
+from planet_generator.geometry.region import MeshRegion
 
 class PlanetMesh:
     """
@@ -26,28 +27,106 @@ class PlanetMesh:
         radius: float,
         vertices: np.ndarray,  # shape (n, 3)
         faces: np.ndarray,     # shape (m, 3)
-        face_geometry: FaceGeometry,
-        face_adjacency: Dict[int, Set[int]]
+        face_geometry: Optional[FaceGeometry],
+        face_adjacency: Union[np.ndarray, Dict[int, Set[int]], None],
+        subdivisions: Optional[int] = None,
+        frequency: Optional[int] = None,
+        topology_key: Optional[str] = None,
+        mesh_indexes: Optional[Dict[str, CSRIndex]] = None
     ):
         self.radius = radius
         self.vertices = vertices
         self.faces = faces
-        self.geometry = face_geometry
+
+        # Face geometry is evaluated lazily from this mesh; fields not given are computed on first use
+        self.geometry = face_geometry if face_geometry is not None else FaceGeometry()
+        self.geometry.bind(vertices, faces)
+
+        # Face adjacency as an (m, 3) integer array (int32 below 2^31 faces): column k is the neighbor across edge k
+        # (corner k to corner k+1). Dictionary-style adjacency from older callers is rebuilt.
+        if isinstance(face_adjacency, Mapping):
+            face_adjacency = build_face_adjacency_array(faces)
         self.adjacency = face_adjacency
 
+        # How the topology was built, and its key in the shared TopologyStore (if it came from there)
+        self.subdivisions = subdivisions
+        self.frequency = frequency
+        self.topology_key = topology_key
+
         # Initialize shared logger instance
         self.logger = LoggerFactory("PlanetMesh").get_logger()
 
-        # Optional cache: vertex-to-face map for spatial queries
-        self._vertex_to_faces: Optional[Dict[int, List[int]]] = None
+        # Cached CSR neighborhood indexes, built on first use unless provided (e.g. by the TopologyStore)
+        mesh_indexes = mesh_indexes or {}
+        self._vertex_faces: Optional[CSRIndex] = mesh_indexes.get("vertex_faces")
+        self._vertex_vertices: Optional[CSRIndex] = mesh_indexes.get("vertex_vertices")
+        self._face_ring: Optional[CSRIndex] = mesh_indexes.get("face_ring")
+
+        # Goldberg dual tiles, the neighborhood query index, differential operators and the
+        # point locator, built on first use (not saved)
+        self._tiles: Optional[GoldbergTiles] = None
+        self._neighborhoods: Optional[NeighborhoodIndex] = None
+        self._operators: Optional[MeshOperators] = None
+        self._locator: Optional[FaceLocator] = None
+
+        # Spatial index over face centers, built on first use (saved next to the planet by PlanetIO)
+        self._spatial_index: Optional[SpatialIndex] = None
+
+    @property
+    def hierarchy(self) -> FaceHierarchy:
+        """
+        Parent/child/ancestor queries between subdivision levels, derived by index arithmetic.
+        Only recursive icospheres have a hierarchy; geodesic grids are built in one pass.
+        """
+        if getattr(self, "frequency", None) is not None or getattr(self, "subdivisions", None) is None:
+            raise ValueError("Face hierarchy is only available for recursively subdivided meshes")
+        return FaceHierarchy(self.subdivisions)
+
+    @property
+    def adjacency_map(self) -> FaceAdjacencyMap:
+        """
+        Dictionary-style view of the adjacency array (face index -> set of neighbor faces),
+        for callers written against the old Dict[int, Set[int]] adjacency.
+        """
+        return FaceAdjacencyMap(self.adjacency)
+
+    def get_face_ring(self, center_index: int, k: int = 1) -> List[int]:
+        """
+        Returns the faces within k edge steps of a face: the face itself first, then by distance.
+        For many centers at once, use face_disks().
+        """
+        return self.face_disks([center_index], k).indices.tolist()
+
+    @property
+    def neighborhoods(self) -> NeighborhoodIndex:
+        """
+        Batched k-disk / k-ring queries over face edge adjacency (with cached ring templates).
+        """
+        if getattr(self, "_neighborhoods", None) is None:
+            if self.adjacency is None:
+                self.adjacency = build_face_adjacency_array(self.faces)
+            self._neighborhoods = NeighborhoodIndex(self.faces, self.adjacency)
+        return self._neighborhoods
+
+    def face_disks(self, centers, k: int, return_distances: bool = False):
+        """
+        Returns the faces within k edge steps of each center as a CSR index (row i for centers[i]),
+        nearest first. With return_distances, also returns each entry's step distance.
+        """
+        return self.neighborhoods.disks(centers, k, return_distances)
+
+    def face_rings(self, centers, k: int) -> CSRIndex:
+        """
+        Returns the faces at exactly k edge steps from each center as a CSR index.
+        """
+        return self.neighborhoods.rings(centers, k)
 
-    def get_face_ring(self, center_index: int) -> List[int]:
+    def tile_disks(self, tiles, k: int, return_distances: bool = False):
         """
-        Returns the 7-tile hex group centered on a given face index.
-        Includes the center face and its 6 neighbors.
+        Returns the Goldberg tiles within k steps of each given tile as a CSR index, nearest first.
+        A hexagon's k-disk holds 3k(k + 1) + 1 tiles.
         """
-        ring = [center_index] + list(self.adjacency.get(center_index, []))
-        return ring[:7]  # safeguard in case neighbors < 6
+        return k_disks(self.tiles.neighbors, tiles, k, return_distances)
 
     @staticmethod
     def get_pentagon_vertices() -> List[int]:
@@ -57,45 +136,167 @@ class PlanetMesh:
         """
         return list(range(12))
 
+    @property
+    def vertex_faces(self) -> CSRIndex:
+        """
+        Vertex -> faces index (CSR): the faces using each vertex, in ascending order.
+        """
+        if getattr(self, "_vertex_faces", None) is None:
+            self._vertex_faces = build_vertex_face_index(self.faces, len(self.vertices))
+        return self._vertex_faces
+
+    @property
+    def vertex_vertices(self) -> CSRIndex:
+        """
+        Vertex -> vertices index (CSR): the vertices sharing an edge with each vertex, ascending.
+        """
+        if getattr(self, "_vertex_vertices", None) is None:
+            self._vertex_vertices = build_vertex_vertex_index(self.faces, len(self.vertices))
+        return self._vertex_vertices
+
+    @property
+    def face_ring(self) -> CSRIndex:
+        """
+        Face ring index (CSR): the faces sharing at least one vertex with each face, ascending.
+        Use it for region growing and other traversals that spread across corners as well as edges.
+        """
+        if getattr(self, "_face_ring", None) is None:
+            self._face_ring = build_face_ring_index(self.faces, self.vertex_faces)
+        return self._face_ring
+
+    @property
+    def tiles(self) -> GoldbergTiles:
+        """
+        The Goldberg polyhedron dual to this mesh: one hex/pentagon tile per vertex,
+        with tile polygons and tile adjacency as CSR arrays.
+        """
+        if getattr(self, "_tiles", None) is None:
+            if self.adjacency is None:
+                self.adjacency = build_face_adjacency_array(self.faces)
+            self._tiles = build_goldberg_tiles(self.vertices, self.faces, self.adjacency, self.radius)
+        return self._tiles
+
+    def get_tile_ring(self, tile_index: int) -> List[int]:
+        """
+        Returns a Goldberg tile and its neighbors: 7 tiles around a hexagon, 6 around a pentagon.
+        """
+        return [tile_index] + self.tiles.neighbors.row(tile_index).tolist()
+
+    @property
+    def operators(self) -> MeshOperators:
+        """
+        Gradient, divergence and Laplacian operators for per-vertex and per-face fields,
+        as sparse matrices built on first use and cached with the mesh.
+        """
+        if getattr(self, "_operators", None) is None:
+            if self.adjacency is None:
+                self.adjacency = build_face_adjacency_array(self.faces)
+            self._operators = MeshOperators(self.vertices, self.faces, self.adjacency)
+        return self._operators
+
+    @property
+    def locator(self) -> FaceLocator:
+        """
+        Hierarchical point locator: finds the face under a lat/lon by descending the subdivision
+        levels, O(subdivisions) per point. Only recursive icospheres have the hierarchy it needs.
+        """
+        if getattr(self, "_locator", None) is None:
+            self._locator = FaceLocator(self.vertices, self.faces, self.hierarchy.subdivisions, self.adjacency)
+        return self._locator
+
+    def locate(self, lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the faces containing the given latitudes / longitudes (degrees, scalars or arrays),
+        and the barycentric coordinates of each point within its face, shape (n, 3).
+        Interpolate a per-vertex field with (field[faces[face_ids]] * barycentric).sum(axis=1).
+        """
+        return self.locator.locate(lat, lon)
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """
+        Cube-map grid index over the face centers, for nearest-face and great-circle radius queries.
+        """
+        if getattr(self, "_spatial_index", None) is None:
+            self._spatial_index = SpatialIndex.build(self.geometry.centers, radius=self.radius)
+        return self._spatial_index
+
+    def faces_within(self, lat, lon, distance, return_distances: bool = False):
+        """
+        Returns the faces whose centers lie within a great-circle distance (in radius units, e.g. km)
+        of each lat/lon, as a CSR index with one row per point, nearest first.
+        """
+        return self.spatial_index.query_radius(lat_lon_to_unit(lat, lon), distance, return_distances)
+
+    def nearest_faces(self, lat, lon, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the k faces with the nearest centers to each lat/lon, and their great-circle distances,
+        both shape (n, k). For the face containing a point, use locate().
+        """
+        return self.spatial_index.query_nearest(lat_lon_to_unit(lat, lon), k)
+
+    def region(self, face_ids) -> MeshRegion:
+        """
+        Extracts a compact submesh over the given faces (an index array, slice or range), with
+        local vertices, faces and adjacency (OUTSIDE across the boundary), and gather/scatter
+        of per-face and per-vertex layers between the planet and the region.
+        """
+        if self.adjacency is None:
+            self.adjacency = build_face_adjacency_array(self.faces)
+        return MeshRegion(self.vertices, self.faces, face_ids, self.adjacency)
+
+    def region_of(self, face: int, level: int) -> MeshRegion:
+        """
+        Returns the region covered by one face of a coarser subdivision level. Its faces are a
+        contiguous range, so per-face layers are gathered as views, without copying.
+        """
+        start, stop = self.hierarchy.descendant_range(face, level=level)
+        return self.region(range(start, stop))
+
     def build_vertex_face_map(self) -> Dict[int, List[int]]:
         """
         Constructs a mapping from vertex index to list of face indices sharing that vertex.
-        This is useful for locating pentagon face groups and enabling vertex-based queries.
+        Kept for dictionary-style callers; vertex_faces holds the same data as arrays.
         """
-        vertex_to_faces: Dict[int, List[int]] = {}
-        for face_index, face in enumerate(self.faces):
-            v1, v2, v3 = face[0], face[1], face[2]
-            for v in (v1, v2, v3):
-                if v not in vertex_to_faces:
-                    vertex_to_faces[v] = []
-                vertex_to_faces[v].append(face_index)
-        return vertex_to_faces
+        index = self.vertex_faces
+        return {
+            v: index.indices[start:end].tolist()
+            for v, (start, end) in enumerate(zip(index.offsets[:-1].tolist(), index.offsets[1:].tolist()))
+        }
 
     def get_faces_sharing_vertex(self, vertex_index: int) -> List[int]:
         """
         Returns the list of face indices that include the given vertex.
-        Requires calling build_vertex_face_map() first.
         """
-        if not hasattr(self, "_vertex_to_faces"):
-            self._vertex_to_faces = self.build_vertex_face_map()
-        return self._vertex_to_faces.get(vertex_index, [])
+        if not 0 <= vertex_index < len(self.vertex_faces):
+            return []
+        return self.vertex_faces.row(vertex_index).tolist()
 
     def verify_pentagon_vertices(self) -> bool:
         """
         Verifies that the 12 base icosahedron vertices are only part of 5 triangle faces each.
         Logs warnings for any that deviate from expected structure.
         """
-        if self._vertex_to_faces is None:
-            self._vertex_to_faces = self.build_vertex_face_map()
+        if getattr(self, "_vertex_faces", None) is not None:
+            face_counts = self._vertex_faces.counts()[:12]
+        else:
+            # Counting the 12 corners does not need the full index (large streamed meshes)
+            corners = np.asarray(self.faces).reshape(-1)
+            face_counts = np.bincount(corners[corners < 12], minlength=12)
 
         valid = True
-        for v in range(12):
-            face_count = len(self._vertex_to_faces.get(v, []))
-            if face_count != 5:
-                self.logger.warning(f"Vertex {v} is part of {face_count} faces, expected 5.")
-                valid = False
+        for v in np.flatnonzero(face_counts != 5):
+            self.logger.warning(f"Vertex {v} is part of {face_counts[v]} faces, expected 5.")
+            valid = False
         return valid
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Face geometry does not pickle its mesh; point it back at ours (unless topology is re-attached later)
+        geometry = self.__dict__.get("geometry")
+        if isinstance(geometry, FaceGeometry) and self.vertices is not None:
+            geometry.bind(self.vertices, self.faces)
+
     def save(self, filepath: str) -> None:
         """
         Saves the mesh object to a binary file using joblib.
@@ -118,10 +319,3 @@ class PlanetMesh:
             mesh = joblib.load(f)
         mesh.logger.info(f"PlanetMesh loaded from {filepath}")
         return mesh
-
-    # TODO: Add lat/lon spatial queries
-    # TODO: Add vertex-to-face index mapping for expansion
-    # TODO: Break PlanetMesh saving into folder-based format:
-    #       - Separate .npy/.npz files for vertices, faces, face_geometry
-    #       - Separate adjacency, metadata, and cache as needed
-    #       - Enable lazy loading of mesh subsets
@@ -0,0 +1,173 @@
+# planet_generator/planet_utils/codec_benchmark.py
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+from planet_generator.geometry.face_geometry import FACE_GEOMETRY_FIELDS
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.io.chunk_store import CodecSpec, read_chunked_array, write_chunked_array
+from planet_generator.io.mesh_format import mesh_arrays, open_array, write_array_atomic
+from planet_generator.io.planet_io import PlanetIO
+from planet_generator.planet_mesh import PlanetMesh
+from logger.logger import LoggerFactory
+
+logger = LoggerFactory("CodecBenchmark").get_logger()
+
+# Codec specs compared by default: plain levels for iteration speed vs archive size, and the
+# byte filters that help float and index arrays
+DEFAULT_BENCHMARK_CODECS = (
+    "none", "zlib-1", "zlib-6", "zlib-9", "lzma-0", "lzma-6", "bz2-9",
+    "shuffle+zlib-1", "delta+shuffle+zlib-1", "shuffle+lzma-6", "delta+shuffle+lzma-6",
+)
+
+# Raw .npy files (memory-mapped on load), the uncompressed baseline
+RAW_CODEC = "npy"
+
+# Saved per-face layers benchmarked alongside the mesh
+LAYER_NAMES = ("elevation", "cratons")
+
+
+def array_kind(name: str, array: np.ndarray) -> str:
+    """
+    Groups arrays by how they compress: integer mesh indices, float mesh geometry, or layers.
+    """
+    if name in LAYER_NAMES:
+        return "layer"
+    return "index" if np.issubdtype(array.dtype, np.integer) else "float"
+
+
+def reference_arrays(subdivisions: int = 7, radius: float = 6371.0, seed: int = 42) -> Dict[str, np.ndarray]:
+    """
+    Arrays of a reference planet: an icosphere mesh with every face geometry field, a smooth
+    float32 elevation layer and an int32 plate map, so results reflect realistic value structure.
+    """
+    generator = IcosphereGenerator(radius, subdivisions)
+    vertices, faces = generator.generate()
+    mesh = PlanetMesh(radius, vertices, faces, None, generator.face_adjacency(), subdivisions=subdivisions)
+    for name in FACE_GEOMETRY_FIELDS:
+        mesh.geometry.get(name)
+    arrays = mesh_arrays(mesh)
+
+    rng = np.random.default_rng(seed)
+    centers = mesh.geometry.centers / radius
+    waves = rng.normal(size=(8, 3)) * np.arange(1, 9)[:, None]
+    arrays["elevation"] = (np.sin(centers @ waves.T).sum(axis=1) * 1000.0).astype(np.float32)
+    plates = rng.normal(size=(12, 3))
+    arrays["cratons"] = np.argmax(centers @ plates.T, axis=1).astype(np.int32)
+    return arrays
+
+
+def planet_arrays(folder_path: str) -> Dict[str, np.ndarray]:
+    """
+    Arrays of a saved planet folder: its mesh arrays and per-face layers, read into memory.
+    """
+    arrays = {name: np.asarray(array) for name, array in mesh_arrays(PlanetIO.load_mesh(folder_path)).items()}
+    for name in LAYER_NAMES:
+        layer = open_array(folder_path, name)
+        if layer is not None:
+            arrays[name] = np.asarray(layer)
+    return arrays
+
+
+def benchmark_codecs(
+    arrays: Dict[str, np.ndarray],
+    codecs: Sequence[str] = DEFAULT_BENCHMARK_CODECS,
+    workers: Optional[int] = None
+) -> List[dict]:
+    """
+    Saves and reloads every array with every codec in a temporary folder, checking the round
+    trip. Returns one result per codec and array kind (plus "all"): raw and stored bytes,
+    compression ratio, and save / load throughput in MB/s of raw data.
+    """
+    results = []
+    folder = tempfile.mkdtemp(prefix="tvg-codec-benchmark-")
+    try:
+        for codec in (RAW_CODEC,) + tuple(str(CodecSpec.parse(c)) for c in codecs):
+            totals: Dict[str, List[float]] = {}
+            for name, array in arrays.items():
+                write_seconds, read_seconds, stored = _round_trip(folder, name, array, codec, workers)
+                for kind in (array_kind(name, array), "all"):
+                    total = totals.setdefault(kind, [0.0, 0.0, 0.0, 0.0])
+                    total[0] += array.nbytes
+                    total[1] += stored
+                    total[2] += write_seconds
+                    total[3] += read_seconds
+            for kind, (raw, stored, write_seconds, read_seconds) in totals.items():
+                results.append({
+                    "codec": codec,
+                    "kind": kind,
+                    "raw_bytes": int(raw),
+                    "stored_bytes": int(stored),
+                    "ratio": raw / max(stored, 1),
+                    "save_mb_s": raw / 1e6 / max(write_seconds, 1e-9),
+                    "load_mb_s": raw / 1e6 / max(read_seconds, 1e-9),
+                })
+            logger.info(f"Benchmarked {codec}")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return results
+
+
+def _round_trip(folder: str, name: str, array: np.ndarray, codec: str, workers: Optional[int]):
+    """
+    Saves and loads one array; returns (save seconds, load seconds, stored bytes).
+    """
+    if codec == RAW_CODEC:
+        path = os.path.join(folder, f"{name}.npy")
+        start = time.perf_counter()
+        write_array_atomic(path, array)
+        write_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = np.load(path)
+    else:
+        path = os.path.join(folder, f"{name}.chunks")
+        start = time.perf_counter()
+        write_chunked_array(path, array, codec, workers=workers)
+        write_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = read_chunked_array(path, workers=workers)
+    read_seconds = time.perf_counter() - start
+    if not np.array_equal(loaded, array):
+        raise AssertionError(f"{codec} did not round-trip {name}")
+    stored = os.path.getsize(path)
+    os.remove(path)
+    return write_seconds, read_seconds, stored
+
+
+def log_results(results: List[dict], log=logger) -> None:
+    """
+    Logs benchmark results as a table, grouped by array kind.
+    """
+    log.info(f"{'kind':<6} {'codec':<24} {'ratio':>7} {'save MB/s':>10} {'load MB/s':>10} {'stored MB':>10}")
+    for kind in ("float", "index", "layer", "all"):
+        for result in (r for r in results if r["kind"] == kind):
+            log.info(f"{kind:<6} {result['codec']:<24} {result['ratio']:>7.2f} {result['save_mb_s']:>10.1f} "
+                     f"{result['load_mb_s']:>10.1f} {result['stored_bytes'] / 1e6:>10.2f}")
+
+
+def main():
+    """
+    Benchmarks PlanetIO codecs on a reference planet (or a saved one) and logs MB/s and
+    compression ratio per array kind.
+    """
+    parser = argparse.ArgumentParser(description="TVG planet save codec benchmark")
+    parser.add_argument("--subdivisions", type=int, default=7, help="Subdivision level of the reference planet")
+    parser.add_argument("--planet", type=str, help="Benchmark the arrays of this saved planet folder instead")
+    parser.add_argument("--codecs", nargs="+", default=list(DEFAULT_BENCHMARK_CODECS),
+                        help="Codec specs to compare, e.g. zlib-1 lzma-6 delta+shuffle+zlib-1")
+    parser.add_argument("--workers", type=int, help="Compression threads (CPU count if omitted)")
+    args = parser.parse_args()
+
+    arrays = planet_arrays(args.planet) if args.planet else reference_arrays(args.subdivisions)
+    total = sum(array.nbytes for array in arrays.values())
+    logger.info(f"Benchmarking {len(arrays)} arrays ({total / 1e6:.1f} MB) with {len(args.codecs)} codecs")
+    log_results(benchmark_codecs(arrays, args.codecs, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# planet_generator/planet_utils/layer_stats.py
+
+import math
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+# Values read per chunk: 4M float64 values keep each chunk's temporaries around 32 MB
+DEFAULT_STATS_CHUNK = 1 << 22
+
+# Resolution of the histogram used to locate quantiles before refining them exactly
+QUANTILE_BINS = 1 << 16
+
+# Largest number of values gathered from the located bins for exact quantiles;
+# beyond it the quantile is interpolated within its bin
+MAX_QUANTILE_CANDIDATES = 1 << 22
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+@dataclass
+class LayerStats:
+    """
+    Summary of a per-face layer (areas, elevation, slope, ...). Moments are accumulated in
+    float64 with pairwise sums within a chunk and compensated (Kahan) sums across chunks,
+    and variances are merged with Chan's parallel update, so results do not drift with size.
+    With weights (e.g. face areas), mean, std and quantiles are weighted.
+    """
+    count: int                      # finite values
+    missing: int                    # NaN / inf values, skipped
+    total: float                    # plain sum of the values
+    minimum: float
+    maximum: float
+    mean: float
+    std: float                      # population standard deviation
+    weight_total: float             # sum of weights (count if unweighted)
+    histogram: np.ndarray           # weighted counts per bin
+    bin_edges: np.ndarray
+    quantiles: Dict[float, float] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, float]:
+        data = {
+            "count": self.count,
+            "missing": self.missing,
+            "total": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.mean,
+            "std": self.std,
+            "weight_total": self.weight_total,
+        }
+        data.update({f"q{q * 100:g}": value for q, value in self.quantiles.items()})
+        return data
+
+
+class _KahanSum:
+    """
+    Compensated running sum of float64 chunk totals.
+    """
+    def __init__(self):
+        self.total = 0.0
+        self._compensation = 0.0
+
+    def add(self, value: float) -> None:
+        y = value - self._compensation
+        t = self.total + y
+        self._compensation = (t - self.total) - y
+        self.total = t
+
+
+def layer_statistics(
+    values: np.ndarray,
+    weights: Optional[np.ndarray] = None,
+    quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    bins: int = 32,
+    value_range: Optional[Tuple[float, float]] = None,
+    chunk_size: int = DEFAULT_STATS_CHUNK
+) -> LayerStats:
+    """
+    Computes statistics of a per-face layer in chunks, so arrays of any size (including
+    memory-mapped ones) are streamed rather than loaded or converted whole.
+
+    Three passes: moments and range, then the histogram plus a fine histogram that locates
+    each quantile's bin, then a gather of just those bins' values to resolve quantiles exactly.
+
+    :param values: Per-face values, shape (m,)
+    :param weights: Optional per-face weights (e.g. face areas) for mean, std, histogram and quantiles
+    :param quantiles: Quantiles to compute, in [0, 1]
+    :param bins: Number of histogram bins
+    :param value_range: Histogram range; defaults to the data range
+    :param chunk_size: Values read per chunk
+    :return: LayerStats
+    """
+    n = len(values)
+    if weights is not None and len(weights) != n:
+        raise ValueError(f"Expected {n} weights, got {len(weights)}")
+
+    def chunks():
+        for start in range(0, n, chunk_size):
+            v = np.asarray(values[start:start + chunk_size], dtype=np.float64).reshape(-1)
+            w = None if weights is None else np.asarray(weights[start:start + chunk_size], dtype=np.float64)
+            finite = np.isfinite(v)
+            if not finite.all():
+                v = v[finite]
+                w = None if w is None else w[finite]
+            yield v, w, int(np.count_nonzero(~finite))
+
+    # Pass 1: counts, range and moments (Chan's parallel merge of per-chunk mean / M2)
+    count, missing = 0, 0
+    total, weight_sum = _KahanSum(), _KahanSum()
+    minimum, maximum = math.inf, -math.inf
+    mean, m2 = 0.0, 0.0
+    for v, w, skipped in chunks():
+        missing += skipped
+        if len(v) == 0:
+            continue
+        count += len(v)
+        total.add(float(np.sum(v)))
+        minimum = min(minimum, float(v.min()))
+        maximum = max(maximum, float(v.max()))
+        w_chunk = float(len(v)) if w is None else float(np.sum(w))
+        if w_chunk <= 0:
+            continue
+        mean_chunk = float(np.sum(v) / len(v)) if w is None else float(np.sum(w * v) / w_chunk)
+        deviation = v - mean_chunk
+        m2_chunk = float(np.sum(deviation * deviation)) if w is None else float(np.sum(w * deviation * deviation))
+        merged = weight_sum.total + w_chunk
+        delta = mean_chunk - mean
+        mean += delta * w_chunk / merged
+        m2 += m2_chunk + delta * delta * weight_sum.total * w_chunk / merged
+        weight_sum.add(w_chunk)
+
+    if count == 0:
+        return LayerStats(count=0, missing=missing, total=0.0, minimum=math.nan, maximum=math.nan,
+                          mean=math.nan, std=math.nan, weight_total=0.0,
+                          histogram=np.zeros(bins), bin_edges=np.linspace(0.0, 1.0, bins + 1),
+                          quantiles={q: math.nan for q in quantiles})
+
+    # Pass 2: the requested histogram, and a fine one over the data range to locate quantiles
+    low, high = value_range if value_range is not None else (minimum, maximum)
+    if high <= low:
+        high = low + 1.0
+    bin_edges = np.linspace(low, high, bins + 1)
+    histogram = np.zeros(bins)
+    fine_high = maximum if maximum > minimum else minimum + 1.0
+    fine_edges = np.linspace(minimum, fine_high, QUANTILE_BINS + 1)
+    fine = np.zeros(QUANTILE_BINS)
+    for v, w, _ in chunks():
+        histogram += np.histogram(v, bins=bin_edges, weights=w)[0]
+        fine += np.histogram(v, bins=fine_edges, weights=w)[0]
+
+    # Pass 3: gather the values of each quantile's bin and resolve it exactly
+    quantile_values = {}
+    if quantiles:
+        cumulative = np.cumsum(fine)
+        targets = np.asarray(quantiles, dtype=np.float64) * cumulative[-1]
+        located = np.minimum(np.searchsorted(cumulative, targets), QUANTILE_BINS - 1)
+        below = np.where(located > 0, cumulative[located - 1], 0.0)
+        gathered = _gather_bins(chunks(), fine_edges, np.unique(located))
+        for q, target, b, before in zip(quantiles, targets, located, below):
+            quantile_values[q] = _resolve_quantile(gathered, b, target - before, fine, fine_edges)
+
+    # With no positive weight there is nothing to average (the running mean was never updated)
+    has_weight = weight_sum.total > 0
+    std = math.sqrt(max(m2, 0.0) / weight_sum.total) if has_weight else math.nan
+    return LayerStats(
+        count=count,
+        missing=missing,
+        total=total.total,
+        minimum=minimum,
+        maximum=maximum,
+        mean=mean if has_weight else math.nan,
+        std=std,
+        weight_total=weight_sum.total,
+        histogram=histogram,
+        bin_edges=bin_edges,
+        quantiles=quantile_values,
+    )
+
+
+def _gather_bins(chunks, edges: np.ndarray, wanted: np.ndarray):
+    """
+    Collects (values, weights) falling in the wanted fine bins, or None if there are too many.
+    """
+    collected = {int(b): ([], []) for b in wanted}
+    size = 0
+    for v, w, _ in chunks:
+        index = np.clip(np.searchsorted(edges, v, side="right") - 1, 0, len(edges) - 2)
+        mask = np.isin(index, wanted)
+        if not mask.any():
+            continue
+        size += int(np.count_nonzero(mask))
+        if size > MAX_QUANTILE_CANDIDATES:
+            return None
+        for b in np.unique(index[mask]):
+            selected = index == b
+            collected[int(b)][0].append(v[selected])
+            collected[int(b)][1].append(np.ones(int(selected.sum())) if w is None else w[selected])
+    return {b: (np.concatenate(vs), np.concatenate(ws)) for b, (vs, ws) in collected.items() if vs}
+
+
+def _resolve_quantile(gathered, b: int, remaining: float, fine: np.ndarray, edges: np.ndarray) -> float:
+    """
+    Smallest value whose cumulative weight reaches the target, within fine bin b.
+    Falls back to linear interpolation inside the bin when its values were not gathered.
+    """
+    if gathered is not None and b in gathered:
+        v, w = gathered[b]
+        order = np.argsort(v, kind="stable")
+        cumulative = np.cumsum(w[order])
+        position = min(int(np.searchsorted(cumulative, remaining)), len(v) - 1)
+        return float(v[order][position])
+    fraction = remaining / fine[b] if fine[b] > 0 else 0.0
+    return float(edges[b] + fraction * (edges[b + 1] - edges[b]))
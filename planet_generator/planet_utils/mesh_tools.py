@@ -3,6 +3,157 @@
 import math
 import numpy as np
 import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from planet_generator.planet_utils.layer_stats import LayerStats, layer_statistics
+
+
+@dataclass
+class MeshReport:
+    """
+    Result of validate_mesh(): one count per integrity check, zero meaning the check passed.
+    """
+    vertices: int
+    faces: int
+    edges: int
+    euler_characteristic: int               # V - E + F, 2 for a closed sphere
+    off_sphere_vertices: int                # farther than epsilon from the expected radius
+    max_radius_error: float
+    boundary_edges: int                     # edges with only one face
+    non_manifold_edges: int                 # edges shared by more than two faces
+    inconsistent_edges: int                 # edges whose two faces traverse it in the same direction
+    inward_faces: int                       # faces whose normal points toward the planet center
+    degenerate_faces: int                   # repeated corners or zero area
+    valence_5_vertices: int                 # 12 on an icosphere (the pentagon caps)
+    irregular_vertices: int                 # valence other than 5 or 6
+    examples: Dict[str, List[int]] = field(default_factory=dict)  # first offending indices per check
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems()
+
+    def problems(self) -> List[str]:
+        """
+        Human-readable description of every failed check.
+        """
+        checks = [
+            (self.off_sphere_vertices, f"{self.off_sphere_vertices:,} vertices are off-sphere "
+                                       f"(max error {self.max_radius_error:,.3g})"),
+            (self.euler_characteristic != 2, f"Euler characteristic is {self.euler_characteristic}, expected 2"),
+            (self.boundary_edges, f"{self.boundary_edges:,} edges belong to only one face"),
+            (self.non_manifold_edges, f"{self.non_manifold_edges:,} edges are shared by more than two faces"),
+            (self.inconsistent_edges, f"{self.inconsistent_edges:,} edges have inconsistent winding"),
+            (self.inward_faces, f"{self.inward_faces:,} faces point inward"),
+            (self.degenerate_faces, f"{self.degenerate_faces:,} faces are degenerate"),
+            (self.valence_5_vertices != 12, f"{self.valence_5_vertices:,} valence-5 vertices, expected 12"),
+            (self.irregular_vertices, f"{self.irregular_vertices:,} vertices have a valence other than 5 or 6"),
+        ]
+        return [message for failed, message in checks if failed]
+
+    def log(self, logger: logging.Logger) -> None:
+        problems = self.problems()
+        if not problems:
+            logger.info(f"Mesh validated: {self.vertices:,} vertices, {self.edges:,} edges, {self.faces:,} faces, "
+                        f"max radius error {self.max_radius_error:,.3g}.")
+            return
+        for message in problems:
+            logger.warning(f"Mesh check failed: {message}")
+        for check, indices in self.examples.items():
+            logger.warning(f"  first {check}: {indices}")
+
+
+def validate_mesh(
+    vertices: np.ndarray,  # shape (n, 3)
+    faces: np.ndarray,     # shape (m, 3)
+    expected_radius: float,
+    epsilon: float,
+    logger: Optional[logging.Logger] = None,
+    max_output: int = 5
+) -> MeshReport:
+    """
+    Checks a closed sphere mesh in bulk array passes: vertex radius tolerance, Euler characteristic,
+    manifold edges (every edge shared by exactly two faces), consistent and outward winding,
+    degenerate faces, and valence (12 valence-5 vertices, the rest valence 6).
+
+    Every edge is encoded once per face as a single integer holding its undirected key and its
+    direction, so one sort groups both faces of each edge and tells whether they agree.
+
+    :param vertices: Nx3 vertex positions
+    :param faces: Mx3 triangle vertex indices, counter-clockwise seen from outside
+    :param expected_radius: Target radius
+    :param epsilon: Acceptable distance error
+    :param logger: Optional logger to report the result to
+    :param max_output: Offending indices kept per failed check
+    :return: MeshReport
+    """
+    n_vertices = len(vertices)
+    faces = np.asarray(faces, dtype=np.int64)
+    corners = [np.asarray(vertices[faces[:, k]], dtype=np.float64) for k in range(3)]
+
+    # Radius tolerance
+    v = np.asarray(vertices, dtype=np.float64)
+    radius_error = np.abs(np.sqrt(np.einsum("ij,ij->i", v, v)) - expected_radius)
+    off_sphere = np.flatnonzero(radius_error > epsilon)
+
+    # Degenerate and inward-facing faces
+    cross = np.cross(corners[1] - corners[0], corners[2] - corners[0])
+    repeated = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 2] == faces[:, 0])
+    degenerate = np.flatnonzero(repeated | ~np.any(cross, axis=1))
+    inward = np.flatnonzero(np.einsum("ij,ij->i", cross, corners[0] + corners[1] + corners[2]) < 0)
+
+    # Edges: key = undirected edge * 2 + (1 if traversed low -> high)
+    starts = faces.reshape(-1)
+    ends = faces[:, [1, 2, 0]].reshape(-1)
+    low, high = np.minimum(starts, ends), np.maximum(starts, ends)
+    keys = np.sort((low * n_vertices + high) * 2 + (starts < ends))
+    edge_keys = keys >> 1
+    new_edge = np.concatenate([[True], edge_keys[1:] != edge_keys[:-1]])
+    first = np.flatnonzero(new_edge)
+    uses = np.diff(np.append(first, len(keys)))
+    forward = np.add.reduceat(keys & 1, first)
+    n_edges = len(first)
+    boundary = uses == 1
+    non_manifold = uses > 2
+    inconsistent = (uses == 2) & (forward != 1)
+
+    # Valence: faces around each vertex (equal to edges around it on a closed manifold)
+    valence = np.bincount(starts, minlength=n_vertices)
+    irregular = np.flatnonzero((valence != 5) & (valence != 6))
+
+    def edge_examples(mask):
+        return [tuple(divmod(int(k), n_vertices)) for k in edge_keys[first[mask][:max_output]]]
+
+    report = MeshReport(
+        vertices=n_vertices,
+        faces=len(faces),
+        edges=n_edges,
+        euler_characteristic=int(n_vertices - n_edges + len(faces)),
+        off_sphere_vertices=len(off_sphere),
+        max_radius_error=float(radius_error.max(initial=0.0)),
+        boundary_edges=int(boundary.sum()),
+        non_manifold_edges=int(non_manifold.sum()),
+        inconsistent_edges=int(inconsistent.sum()),
+        inward_faces=len(inward),
+        degenerate_faces=len(degenerate),
+        valence_5_vertices=int(np.count_nonzero(valence == 5)),
+        irregular_vertices=len(irregular),
+    )
+    examples = {
+        "off-sphere vertices": off_sphere[:max_output].tolist(),
+        "boundary edges": edge_examples(boundary),
+        "non-manifold edges": edge_examples(non_manifold),
+        "inconsistent edges": edge_examples(inconsistent),
+        "inward faces": inward[:max_output].tolist(),
+        "degenerate faces": degenerate[:max_output].tolist(),
+        "irregular vertices": irregular[:max_output].tolist(),
+    }
+    report.examples = {check: indices for check, indices in examples.items() if indices}
+
+    if logger is not None:
+        report.log(logger)
+    return report
+
 
 def validate_vertex_distances(
     vertices: np.ndarray,  # shape (n, 3)
@@ -13,6 +164,7 @@ def validate_vertex_distances(
 ) -> None:
     """
     Validates that all vertices lie on a sphere of the given radius.
+    Kept for callers that only check the radius; validate_mesh() runs every check.
 
     :param vertices: List of 3D points
     :param expected_radius: Target radius
@@ -20,20 +172,16 @@ def validate_vertex_distances(
     :param logger: Logger instance
     :param max_output: Max number of individual logs to emit
     """
-    off_count = 0
-    for i, v in enumerate(vertices):
-        dist = math.sqrt(v[0]**2 + v[1]**2 + v[2]**2)
-        if abs(dist - expected_radius) > epsilon:
-            off_count += 1
-            if off_count <= max_output:
-                logger.warning(f"Vertex {i} is off-sphere: distance={dist:,.3f} (expected {expected_radius})")
-        elif i < max_output:
-            logger.debug(f"Vertex {i} lies on sphere: distance={dist:,.3f}")
-
-    if off_count == 0:
+    v = np.asarray(vertices, dtype=np.float64)
+    dist = np.sqrt(np.einsum("ij,ij->i", v, v))
+    off = np.flatnonzero(np.abs(dist - expected_radius) > epsilon)
+    for i in off[:max_output]:
+        logger.warning(f"Vertex {i} is off-sphere: distance={dist[i]:,.3f} (expected {expected_radius})")
+
+    if len(off) == 0:
         logger.info("All vertices lie within expected distance tolerance.")
     else:
-        logger.warning(f"{off_count} vertices were off-sphere (>{epsilon:,.3g} tolerance).")
+        logger.warning(f"{len(off)} vertices were off-sphere (>{epsilon:,.3g} tolerance).")
 
 def summarize_mesh_geometry(
     radius: float,
@@ -42,15 +190,17 @@ def summarize_mesh_geometry(
 ) -> dict[str, float]:
     """
     Logs a summary of the planet's geometry based on face areas and global shape.
+    Areas are streamed in chunks with float64 accumulation, so memory-mapped arrays work too.
 
     :param radius: Radius of the planet (assumed spherical)
     :param areas: List of per-face areas
     :param logger: Logger instance
     """
-    num_faces = len(areas)
-    total_area = sum(areas)
-    average_area = total_area / num_faces if num_faces > 0 else 0.0
-    stddev_area = math.sqrt(sum((a - average_area) ** 2 for a in areas) / num_faces) if num_faces > 0 else 0.0
+    stats = layer_statistics(areas, quantiles=())
+    num_faces = stats.count
+    total_area = stats.total
+    average_area = stats.mean if num_faces > 0 else 0.0
+    stddev_area = stats.std if num_faces > 0 else 0.0
 
     circumference = 2 * math.pi * radius
     sphere_area = 4 * math.pi * radius * radius
@@ -66,6 +216,7 @@ def summarize_mesh_geometry(
     logger.info(f"Calculated mesh surface area: {total_area:,.2f} km²")
     logger.info(f"Average triangle face area: {average_area:,.6f} km²")
     logger.info(f"Face area standard deviation: {stddev_area:,.6f} km²")
+    logger.info(f"Face area range: {stats.minimum:,.6f} - {stats.maximum:,.6f} km²")
     logger.info(f"Approx. standard hex-tile area: {avg_hex_area:,.2f} km²")
     logger.info(f"Approx. 5-triangle pentagon tile area: {avg_pentagon_area:,.2f} km²")
     logger.info("--------------------------------\n")
@@ -77,11 +228,40 @@ def summarize_mesh_geometry(
         "mesh_area_km2": total_area,
         "average_face_area_km2": average_area,
         "stddev_face_area_km2": stddev_area,
+        "min_face_area_km2": stats.minimum,
+        "max_face_area_km2": stats.maximum,
         "hex_tile_area_km2": avg_hex_area,
         "pent_tile_area_km2": avg_pentagon_area,
         "num_faces": num_faces
     }
 
+def summarize_layer(
+    name: str,
+    values: np.ndarray,
+    logger: logging.Logger,
+    weights: Optional[np.ndarray] = None,
+    unit: str = ""
+) -> LayerStats:
+    """
+    Logs min/max/mean/std and quantiles of any per-face layer (elevation, slope, ...).
+    Pass face areas as weights for area-weighted mean, std and quantiles.
+
+    :param name: Layer name for the log
+    :param values: Per-face values (may be memory-mapped)
+    :param logger: Logger instance
+    :param weights: Optional per-face weights
+    :param unit: Unit suffix for the log
+    """
+    stats = layer_statistics(values, weights)
+    suffix = f" {unit}" if unit else ""
+    weighting = " (area-weighted)" if weights is not None else ""
+    logger.info(f"--- {name} statistics{weighting} ---")
+    logger.info(f"Faces: {stats.count:,} ({stats.missing:,} missing)")
+    logger.info(f"Range: {stats.minimum:,.4f} - {stats.maximum:,.4f}{suffix}")
+    logger.info(f"Mean: {stats.mean:,.4f}{suffix}, standard deviation: {stats.std:,.4f}{suffix}")
+    logger.info("Quantiles: " + ", ".join(f"{q:.0%} {v:,.4f}" for q, v in stats.quantiles.items()))
+    return stats
+
 def estimate_optimal_subdivision(
     radius_km: float,
     target_hex_area_km2: float = 40000.0,
@@ -124,3 +304,39 @@ def estimate_optimal_subdivision(
             break  # Good enough match
 
     return best_level
+
+def estimate_optimal_frequency(
+    radius_km: float,
+    target_hex_area_km2: float = 40000.0,
+    min_hex_area_km2: float = 10000.0,
+    max_frequency: int = 4096
+) -> int:
+    """
+    Estimate the geodesic frequency (edge splits per base edge) for a given radius that
+    produces hex-tile areas close to the target without dropping below minimum.
+
+    Unlike subdivision levels, any frequency can be built directly, so this can land
+    between the power-of-two levels suggested by estimate_optimal_subdivision.
+    It uses the same approximation, with num triangles: 20 * n²
+
+    :param radius_km: Planet radius in kilometers
+    :param target_hex_area_km2: Desired hex-tile area
+    :param min_hex_area_km2: Minimum acceptable hex-tile area
+    :param max_frequency: Max allowed frequency to consider
+    :return: Optimal geodesic frequency
+    """
+    sphere_area = 4 * math.pi * radius_km ** 2
+
+    def hex_area(frequency: int) -> float:
+        num_hexes = (20 * frequency ** 2 - 12) / 6
+        return sphere_area / num_hexes if num_hexes > 0 else sphere_area
+
+    # Smallest frequency whose hexes are no larger than the target
+    frequency = math.ceil(math.sqrt((6 * sphere_area / target_hex_area_km2 + 12) / 20))
+    frequency = min(max(frequency, 1), max_frequency)
+
+    # Back off one step if that overshoots the minimum tile size
+    if frequency > 1 and hex_area(frequency) < min_hex_area_km2:
+        frequency -= 1
+
+    return frequency
@@ -0,0 +1,381 @@
+# planet_generator/planet_utils/resource_planner.py
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import subprocess
+import numpy as np
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, List, Sequence, Tuple
+
+from config import ROOT_DIR
+from planet_generator.planet_config import PLANET_CONFIG
+from planet_generator.geometry.adjacency import index_dtype
+from planet_generator.io.planet_catalog import PLANETS_DIR, PlanetCatalog
+from logger.logger import LoggerFactory
+
+logger = LoggerFactory("ResourcePlanner").get_logger()
+
+BENCHMARK_PATH = os.path.join(ROOT_DIR, "gamedata", "benchmarks", "generation_runs.jsonl")
+
+# Stages of generate_planet, in order
+PIPELINE_STAGES = ("mesh", "adjacency", "face_geometry", "save")
+STREAMED_STAGES = ("stream", "save")
+
+# Uncalibrated defaults, measured on a development machine (seconds per face, per stage)
+DEFAULT_SECONDS_PER_FACE = {
+    "memory": {"mesh": 1.2e-5, "adjacency": 2.0e-6, "face_geometry": 2.1e-5, "save": 1.7e-5},
+    "streamed": {"stream": 7.0e-7, "save": 0.0},
+}
+
+# Peak resident memory = base + bytes_per_face * faces (per chunk face when streaming)
+DEFAULT_BASE_RSS_BYTES = 64 * 1024 ** 2
+DEFAULT_RSS_BYTES_PER_FACE = {"memory": 1100.0, "streamed": 450.0}
+
+# Saved per planet besides the shared topology: radius-scaled vertices (half a vertex per face,
+# 12 bytes each) and the face areas evaluated during generation (float32)
+SAVED_MESH_BYTES_PER_FACE = 10.0
+
+# Requests above this fraction of the memory budget get a warning
+WARN_FRACTION = 0.8
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Returns the peak resident set size of this process so far, or None if it can't be read.
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return int(counters.PeakWorkingSetSize)
+    return None
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if abs(n) < 1024 or unit == "TB":
+            return f"{n:,.1f} {unit}"
+        n /= 1024
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 120:
+        return f"{seconds:,.1f} s"
+    if seconds < 7200:
+        return f"{seconds / 60:,.1f} min"
+    return f"{seconds / 3600:,.1f} h"
+
+
+def mesh_counts(subdivisions: Optional[int] = None, frequency: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Returns (vertex count, face count) of an icosphere or geodesic grid.
+    """
+    n = frequency if frequency is not None else 2 ** subdivisions
+    return 10 * n * n + 2, 20 * n * n
+
+
+@dataclass
+class ResourceEstimate:
+    """
+    Predicted cost of a planet generation run, and whether it fits the memory budget.
+    """
+    vertices: int
+    faces: int
+    mode: str                               # "memory" or "streamed"
+    array_bytes: Dict[str, int]             # size of each output array
+    peak_rss_bytes: int
+    disk_bytes: int
+    stage_seconds: Dict[str, float]
+    memory_budget_bytes: int
+    calibrated_runs: int                    # benchmark runs the time and memory models were fitted on
+    status: str = "ok"                      # "ok", "warn", or "refuse"
+    messages: List[str] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.stage_seconds.values())
+
+    def summary(self) -> Dict[str, str]:
+        """
+        Human-readable estimate, keyed for display in the geometry panel or the log.
+        """
+        data = {
+            "estimated_vertices": f"{self.vertices:,}",
+            "estimated_peak_memory": format_bytes(self.peak_rss_bytes),
+            "memory_budget": format_bytes(self.memory_budget_bytes),
+            "estimated_disk": format_bytes(self.disk_bytes),
+            "estimated_time": format_seconds(self.total_seconds),
+            "generation_mode": self.mode,
+            "estimate_status": self.status.upper() if self.calibrated_runs else f"{self.status.upper()} (uncalibrated)",
+        }
+        return data
+
+
+def load_benchmark_runs(path: str = BENCHMARK_PATH) -> List[dict]:
+    """
+    Loads recorded generation runs (one JSON object per line). Unreadable lines are skipped.
+    """
+    if not os.path.exists(path):
+        return []
+    runs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                runs.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return runs
+
+
+def record_benchmark_run(
+    mode: str,
+    faces: int,
+    stage_seconds: Dict[str, float],
+    peak_rss: Optional[int],
+    base_rss: Optional[int],
+    chunk_faces: Optional[int] = None,
+    path: str = BENCHMARK_PATH
+) -> None:
+    """
+    Appends a finished generation run to the benchmark log used to calibrate estimates.
+
+    :param peak_rss: Peak RSS of the run's process, in bytes
+    :param base_rss: RSS before generation started (after imports), in bytes
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    run = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "mode": mode,
+        "faces": int(faces),
+        "chunk_faces": chunk_faces,
+        "stage_seconds": {name: round(float(t), 6) for name, t in stage_seconds.items()},
+        "peak_rss_bytes": peak_rss,
+        "base_rss_bytes": base_rss,
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run) + "\n")
+
+
+def _fit_seconds_per_face(runs: List[dict], stage: str) -> Optional[float]:
+    """
+    Time per face of a stage over all recorded runs; the ratio of sums weights large runs most.
+    """
+    samples = [(run["faces"], run["stage_seconds"][stage]) for run in runs if stage in run.get("stage_seconds", {})]
+    total_faces = sum(faces for faces, _ in samples)
+    if total_faces == 0:
+        return None
+    return sum(seconds for _, seconds in samples) / total_faces
+
+
+def _fit_peak_rss(runs: List[dict], size_key: str) -> Optional[Tuple[float, float]]:
+    """
+    Fits peak RSS = base + per_face * size over recorded runs.
+
+    Each run records the process RSS before generation started, so the per-face cost is the
+    growth above that base; taking the ratio of sums lets the largest runs dominate, instead of
+    small runs where interpreter and import overhead swamp the mesh.
+    """
+    samples = [(run[size_key], run["base_rss_bytes"], run["peak_rss_bytes"]) for run in runs
+               if run.get(size_key) and run.get("peak_rss_bytes") and run.get("base_rss_bytes")]
+    if not samples:
+        return None
+    bases = sorted(base for _, base, _ in samples)
+    base = bases[len(bases) // 2]
+    per_face = sum(max(peak - run_base, 0) for _, run_base, peak in samples) / sum(size for size, _, _ in samples)
+    return base, per_face
+
+
+def estimate_generation(
+    subdivisions: Optional[int] = None,
+    frequency: Optional[int] = None,
+    stages: Sequence[str] = PIPELINE_STAGES,
+    stream: Optional[bool] = None,
+    chunk_faces: Optional[int] = None,
+    memory_budget_mb: Optional[float] = None,
+    output_dir: str = ROOT_DIR,
+    benchmark_path: str = BENCHMARK_PATH
+) -> ResourceEstimate:
+    """
+    Predicts the cost of generating a planet before anything is allocated.
+
+    Counts and array sizes are exact. Wall time and peak memory come from per-stage linear
+    models fitted to the runs recorded on this machine (see record_benchmark_run), falling
+    back to development-machine defaults until runs have been recorded.
+
+    :param subdivisions: Recursive subdivision level
+    :param frequency: Geodesic frequency; takes precedence over subdivisions when set
+    :param stages: Pipeline stages to include in the time estimate
+    :param stream: Force streaming on or off; by default follows PLANET_CONFIG["stream_subdivisions"]
+    :param chunk_faces: Faces per chunk when streaming
+    :param memory_budget_mb: Memory budget; defaults to PLANET_CONFIG["memory_budget_mb"]
+    :param output_dir: Directory whose free disk space is checked
+    :param benchmark_path: Benchmark log used for calibration
+    :return: A ResourceEstimate with status "ok", "warn" or "refuse"
+    """
+    n_vertices, n_faces = mesh_counts(subdivisions, frequency)
+    if stream is None:
+        stream = frequency is None and subdivisions >= PLANET_CONFIG.get("stream_subdivisions", 10)
+    mode = "streamed" if stream else "memory"
+    # Vertex and face ids are int32 until they pass 2^31 - 1, then int64
+    vertex_index_bytes = np.dtype(index_dtype(n_vertices - 1)).itemsize
+    face_index_bytes = np.dtype(index_dtype(n_faces - 1)).itemsize
+
+    array_bytes = {
+        "vertices": n_vertices * 12,
+        "faces": n_faces * 3 * vertex_index_bytes,
+        "adjacency": n_faces * 3 * face_index_bytes,
+        # Streaming writes every field (centers, normals: 3 x float32, plus 4 float32 scalars);
+        # in memory, generation only evaluates areas
+        "face_geometry": n_faces * (40 if stream else 4),
+    }
+    if not stream:
+        array_bytes["vertex_face_map"] = (n_vertices + 1) * 8 + n_faces * 3 * face_index_bytes
+
+    runs = [run for run in load_benchmark_runs(benchmark_path) if run.get("mode") == mode]
+
+    # Time per stage
+    if stream:
+        from planet_generator.io.mesh_stream import DEFAULT_MAX_CHUNK_FACES
+        chunk_faces = min(chunk_faces or DEFAULT_MAX_CHUNK_FACES, n_faces)
+        # Streaming builds the mesh, its adjacency and its face geometry in a single stage
+        stages = STREAMED_STAGES
+    stage_seconds = {}
+    for stage in stages:
+        per_face = _fit_seconds_per_face(runs, stage)
+        if per_face is None:
+            per_face = DEFAULT_SECONDS_PER_FACE[mode].get(stage, 0.0)
+        stage_seconds[stage] = per_face * n_faces
+
+    # Peak memory grows with the whole mesh in memory, and with the chunk size when streaming
+    size = chunk_faces if stream else n_faces
+    fit = _fit_peak_rss(runs, "chunk_faces" if stream else "faces")
+    base, per_face = fit if fit is not None else (DEFAULT_BASE_RSS_BYTES, DEFAULT_RSS_BYTES_PER_FACE[mode])
+    peak_rss = int(base + per_face * size)
+
+    if stream:
+        disk_bytes = sum(array_bytes.values())
+    else:
+        topology_bytes = array_bytes["vertices"] + array_bytes["faces"] + array_bytes["adjacency"] + array_bytes["vertex_face_map"]
+        disk_bytes = int(topology_bytes + SAVED_MESH_BYTES_PER_FACE * n_faces)
+
+    if memory_budget_mb is None:
+        memory_budget_mb = PLANET_CONFIG.get("memory_budget_mb", 8192)
+    budget = int(memory_budget_mb * 1024 ** 2)
+    estimate = ResourceEstimate(
+        vertices=n_vertices,
+        faces=n_faces,
+        mode=mode,
+        array_bytes=array_bytes,
+        peak_rss_bytes=peak_rss,
+        disk_bytes=disk_bytes,
+        stage_seconds=stage_seconds,
+        memory_budget_bytes=budget,
+        calibrated_runs=len(runs),
+    )
+
+    if peak_rss > budget:
+        estimate.status = "refuse"
+        estimate.messages.append(f"Estimated peak memory {format_bytes(peak_rss)} exceeds the budget of {format_bytes(budget)}.")
+    elif peak_rss > WARN_FRACTION * budget:
+        estimate.status = "warn"
+        estimate.messages.append(f"Estimated peak memory {format_bytes(peak_rss)} is close to the budget of {format_bytes(budget)}.")
+
+    free_disk = shutil.disk_usage(output_dir).free if os.path.exists(output_dir) else None
+    if free_disk is not None and disk_bytes > free_disk:
+        estimate.status = "refuse"
+        estimate.messages.append(f"Estimated disk footprint {format_bytes(disk_bytes)} exceeds the {format_bytes(free_disk)} free.")
+
+    warn_seconds = PLANET_CONFIG.get("time_warning_seconds", 600)
+    if estimate.total_seconds > warn_seconds and estimate.status == "ok":
+        estimate.status = "warn"
+        estimate.messages.append(f"Generation is expected to take about {format_seconds(estimate.total_seconds)}.")
+    return estimate
+
+
+def log_estimate(estimate: ResourceEstimate, log=logger) -> None:
+    """
+    Logs an estimate, with its warnings at the matching level.
+    """
+    log.info(f"Resource estimate ({estimate.mode}): {estimate.vertices:,} vertices, {estimate.faces:,} faces")
+    for name, n in estimate.array_bytes.items():
+        log.info(f"  {name}: {format_bytes(n)}")
+    log.info(f"  peak memory: {format_bytes(estimate.peak_rss_bytes)} (budget {format_bytes(estimate.memory_budget_bytes)})")
+    log.info(f"  disk: {format_bytes(estimate.disk_bytes)}")
+    for stage, seconds in estimate.stage_seconds.items():
+        log.info(f"  {stage}: {format_seconds(seconds)}")
+    if not estimate.calibrated_runs:
+        log.info("  (uncalibrated: no benchmark runs recorded on this machine yet)")
+    for message in estimate.messages:
+        if estimate.status == "refuse":
+            log.error(message)
+        else:
+            log.warning(message)
+
+
+def calibrate(levels: Sequence[int] = (3, 4, 5, 6)) -> None:
+    """
+    Records benchmark runs by generating small planets in fresh processes,
+    so each run's peak memory is measured on its own.
+    """
+    for level in levels:
+        name = f"_calibration_{level}"
+        logger.info(f"Calibration run: subdivision level {level}")
+        subprocess.run(
+            [sys.executable, "-m", "planet_generator.generate_planet", "--subdivisions", str(level),
+             "--name", name, "--force"],
+            cwd=ROOT_DIR, check=True
+        )
+        shutil.rmtree(os.path.join(PLANETS_DIR, name), ignore_errors=True)
+        PlanetCatalog().remove(name)
+
+
+def main():
+    """
+    Prints the resource estimate for a subdivision level or frequency, or records calibration runs.
+    """
+    parser = argparse.ArgumentParser(description="TVG planet generation resource planner")
+    parser.add_argument("--subdivisions", type=int, help="Icosphere subdivision level")
+    parser.add_argument("--frequency", type=int, help="Geodesic frequency")
+    parser.add_argument("--stream", action="store_true", help="Estimate streaming generation")
+    parser.add_argument("--calibrate", action="store_true", help="Record benchmark runs at small subdivision levels")
+    args = parser.parse_args()
+
+    if args.calibrate:
+        calibrate()
+    subdivisions = args.subdivisions if args.subdivisions is not None else PLANET_CONFIG.get("subdivisions")
+    log_estimate(estimate_generation(subdivisions, args.frequency, stream=args.stream or None))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# /planet_generator/tests/test_chunk_store.py
+
+import os
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.io.chunk_store import ChunkedArray, CodecSpec, default_chunk_rows, write_chunked_array
+from planet_generator.io.mesh_format import MESH_DIR, open_mesh_folder, verify_mesh_folder
+from planet_generator.io.planet_io import Planet, PlanetIO
+from planet_generator.planet_mesh import PlanetMesh
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib", "lzma", "bz2"])
+def test_random_access_decompresses_only_covered_chunks(tmp_path, codec):
+    values = np.cumsum(np.random.default_rng(3).normal(size=(5000, 2)), axis=0).astype(np.float32)
+    path = str(tmp_path / "layer.chunks")
+    header = write_chunked_array(path, values, codec=codec, chunk_rows=256)
+    assert header["chunks"] == 20
+
+    chunked = ChunkedArray(path)
+    assert chunked.shape == values.shape and chunked.dtype == values.dtype
+    np.testing.assert_array_equal(np.asarray(chunked), values)
+    np.testing.assert_array_equal(chunked[300:700], values[300:700])
+    np.testing.assert_array_equal(chunked[4990:], values[4990:])
+    np.testing.assert_array_equal(chunked[::7, 1], values[::7, 1])
+    np.testing.assert_array_equal(chunked[-1], values[-1])
+    rows = [4999, 3, 3, 1024]
+    np.testing.assert_array_equal(chunked[rows], values[rows])
+
+    # Only the chunks holding the requested rows are read
+    loaded = []
+    original = chunked._load_chunks
+    chunked._load_chunks = lambda chunks, workers=None: (loaded.extend(chunks), original(chunks, workers))[1]
+    chunked[300:700]
+    chunked[rows]
+    assert loaded == [1, 2, 0, 4, 19]
+
+
+def test_codec_specs():
+    assert CodecSpec.parse("zlib") == CodecSpec("zlib", 6)
+    assert str(CodecSpec.parse("Delta+Shuffle+LZMA-9")) == "delta+shuffle+lzma-9"
+    assert str(CodecSpec.parse("none")) == "none"
+    for spec in ("zstd-3", "zlib-12", "bz2-0", "rle+zlib-1"):
+        with pytest.raises(ValueError):
+            CodecSpec.parse(spec)
+
+
+@pytest.mark.parametrize("spec", ["shuffle+zlib-1", "delta+zlib-1", "delta+shuffle+lzma-0", "shuffle+delta+none"])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32, np.int8])
+def test_filters_round_trip_exactly(tmp_path, spec, dtype):
+    values = (np.random.default_rng(5).normal(size=(1000, 3)) * 100).astype(dtype)
+    values[7] = np.iinfo(dtype).min if np.issubdtype(dtype, np.integer) else -np.inf
+    path = str(tmp_path / "values.chunks")
+    write_chunked_array(path, values, spec, chunk_rows=64)
+    chunked = ChunkedArray(path)
+    assert str(chunked.spec) == spec
+    np.testing.assert_array_equal(np.asarray(chunked), values)
+    np.testing.assert_array_equal(chunked[[999, 7, 70]], values[[999, 7, 70]])
+
+
+def test_default_chunks_follow_the_face_hierarchy():
+    assert default_chunk_rows(4) == 4 ** 9
+    assert default_chunk_rows(12) == 4 ** 8
+
+
+def test_compressed_planet_round_trip(tmp_path):
+    generator = IcosphereGenerator(100.0, 3)
+    vertices, faces = generator.generate()
+    mesh = PlanetMesh(100.0, vertices, faces, None, generator.face_adjacency(), subdivisions=3)
+    mesh.geometry.areas
+    elevation = np.linspace(-1.0, 1.0, len(faces)).astype(np.float32)
+    folder = str(tmp_path / "planet")
+    PlanetIO.save(Planet(name="test", seed=1, mesh=mesh, elevation=elevation), folder, codec="shuffle+zlib-1")
+
+    assert sorted(os.listdir(os.path.join(folder, MESH_DIR))) == [
+        "adjacency.chunks", "areas.chunks", "faces.chunks", "manifest.json", "vertices.chunks"]
+    assert verify_mesh_folder(folder) == []
+    planet = PlanetIO.load(folder)
+    np.testing.assert_array_equal(planet.mesh.faces, faces)
+    np.testing.assert_array_equal(planet.mesh.geometry.areas, mesh.geometry.areas)
+    np.testing.assert_array_equal(planet.elevation, elevation)
+
+    # A region reads its rows straight from the compressed layer
+    layer = PlanetIO.open_layer(folder, "elevation")
+    assert isinstance(layer, ChunkedArray)
+    region = mesh.region_of(5, level=1)
+    np.testing.assert_array_equal(region.gather(layer), elevation[region.face_ids])
+    scattered = mesh.region([1, 700, 1200])
+    np.testing.assert_array_equal(scattered.gather(layer), elevation[[1, 700, 1200]])
+
+    # Saving raw again replaces the compressed files
+    PlanetIO.save(planet, folder)
+    assert not os.path.exists(os.path.join(folder, "elevation.chunks"))
+    assert isinstance(open_mesh_folder(folder).vertices, np.memmap)
@@ -0,0 +1,16 @@
+# /planet_generator/tests/test_codec_benchmark.py
+
+from planet_generator.planet_utils.codec_benchmark import benchmark_codecs, reference_arrays
+
+
+def test_benchmark_reports_ratio_and_throughput_per_kind():
+    arrays = reference_arrays(subdivisions=3)
+    assert {"vertices", "faces", "adjacency", "areas", "elevation", "cratons"} <= set(arrays)
+
+    results = benchmark_codecs(arrays, ["zlib-1", "shuffle+lzma-0"])
+    assert {r["codec"] for r in results} == {"npy", "zlib-1", "shuffle+lzma-0"}
+    assert {r["kind"] for r in results} == {"float", "index", "layer", "all"}
+    by_key = {(r["codec"], r["kind"]): r for r in results}
+    assert by_key["zlib-1", "index"]["ratio"] > 1.5
+    assert by_key["npy", "all"]["raw_bytes"] == sum(a.nbytes for a in arrays.values())
+    assert all(r["save_mb_s"] > 0 and r["load_mb_s"] > 0 for r in results)
@@ -0,0 +1,117 @@
+# /planet_generator/tests/test_face_adjacency.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.adjacency import (
+    build_face_adjacency_array, build_face_ring_index, build_vertex_face_index, build_vertex_vertex_index,
+    _csr_from_pairs, face_adjacency_from_twins, index_dtype
+)
+
+
+@pytest.mark.parametrize("subdivisions", range(9))
+def test_subdivision_adjacency_matches_edge_matching(subdivisions):
+    """
+    Adjacency carried through subdivision must equal the generic sort-based edge match.
+    """
+    generator = IcosphereGenerator(1.0, subdivisions)
+    _, faces = generator.generate()
+
+    adjacency = generator.face_adjacency()
+
+    assert adjacency.dtype == np.int32
+    assert adjacency.shape == (20 * 4 ** subdivisions, 3)
+    np.testing.assert_array_equal(adjacency, build_face_adjacency_array(faces))
+
+    # The neighbor in column k contains both ends of edge k, and lists this face back
+    neighbor_faces = faces[adjacency]
+    starts, ends = faces, faces[:, [1, 2, 0]]
+    assert np.all((neighbor_faces == starts[:, :, None]).any(axis=2))
+    assert np.all((neighbor_faces == ends[:, :, None]).any(axis=2))
+    assert np.all((adjacency[adjacency] == np.arange(len(faces))[:, None, None]).any(axis=2))
+
+
+@pytest.mark.parametrize("subdivisions", [0, 1, 4])
+def test_parallel_layout_adjacency_matches_edge_matching(subdivisions):
+    """
+    Patch-generated meshes keep the serial face order, so the propagated adjacency still applies.
+    """
+    generator = IcosphereGenerator(1.0, subdivisions, workers=1)
+    _, faces = generator.generate()
+
+    np.testing.assert_array_equal(generator.face_adjacency(), build_face_adjacency_array(faces))
+
+
+@pytest.mark.parametrize("frequency", [1, 3, 7])
+def test_geodesic_adjacency_matches_edge_matching(frequency):
+    generator = IcosphereGenerator(1.0, frequency=frequency)
+    _, faces = generator.generate()
+
+    np.testing.assert_array_equal(generator.face_adjacency(), build_face_adjacency_array(faces))
+
+
+def _loop_indexes(faces, n_vertices):
+    """
+    Reference: vertex -> faces, vertex -> vertices and face ring built with a per-face loop.
+    """
+    vertex_faces = [set() for _ in range(n_vertices)]
+    vertex_vertices = [set() for _ in range(n_vertices)]
+    for face, corners in enumerate(faces.tolist()):
+        for k in range(3):
+            vertex_faces[corners[k]].add(face)
+            vertex_vertices[corners[k]].update((corners[k - 1], corners[(k + 1) % 3]))
+    face_ring = []
+    for face, corners in enumerate(faces.tolist()):
+        face_ring.append(set().union(*(vertex_faces[v] for v in corners)) - {face})
+    return [sorted(s) for s in vertex_faces], [sorted(s) for s in vertex_vertices], [sorted(s) for s in face_ring]
+
+
+@pytest.mark.parametrize("subdivisions", [0, 2])
+def test_csr_indexes_match_per_face_loop(subdivisions):
+    vertices, faces = IcosphereGenerator(1.0, subdivisions).generate()
+    n_vertices = len(vertices)
+    vertex_faces = build_vertex_face_index(faces, n_vertices)
+    vertex_vertices = build_vertex_vertex_index(faces, n_vertices)
+    face_ring = build_face_ring_index(faces, vertex_faces)
+
+    expected_vertex_faces, expected_vertex_vertices, expected_face_ring = _loop_indexes(faces, n_vertices)
+    assert [vertex_faces.row(v).tolist() for v in range(n_vertices)] == expected_vertex_faces
+    assert [vertex_vertices.row(v).tolist() for v in range(n_vertices)] == expected_vertex_vertices
+    assert [face_ring.row(f).tolist() for f in range(len(faces))] == expected_face_ring
+
+    # The 12 icosahedron corners have valence 5, every other vertex 6; a face touching a corner
+    # misses one face of its 12-face ring (three on the bare icosahedron)
+    valence = vertex_faces.counts()
+    assert np.count_nonzero(valence == 5) == 12 and np.all(valence[12:] == 6)
+    np.testing.assert_array_equal(vertex_vertices.counts(), valence)
+    corner_faces = np.isin(faces, np.arange(12)).any(axis=1)
+    ring_sizes = face_ring.counts()
+    assert np.all(ring_sizes[corner_faces] == (9 if subdivisions == 0 else 11))
+    assert np.all(ring_sizes[~corner_faces] == 12)
+
+
+def test_csr_indexes_on_an_open_mesh():
+    faces = np.array([[0, 1, 2], [0, 2, 3], [4, 5, 6]])
+    vertex_faces = build_vertex_face_index(faces, 8)
+    expected = _loop_indexes(faces, 8)
+    assert [vertex_faces.row(v).tolist() for v in range(8)] == expected[0]
+    assert [build_vertex_vertex_index(faces, 8).row(v).tolist() for v in range(8)] == expected[1]
+    assert [build_face_ring_index(faces, vertex_faces).row(f).tolist() for f in range(3)] == expected[2]
+
+
+def test_indices_widen_past_int32():
+    assert index_dtype(2 ** 31 - 1) == np.int32 and index_dtype(2 ** 31) == np.int64
+
+    # A slice of the twin table of a mesh with more than 2^31 faces keeps its face ids intact
+    twins = np.array([[3 * 2 ** 32 + 1, 5, 3 * (2 ** 31 - 1)]], dtype=np.int64)
+    adjacency = face_adjacency_from_twins(twins)
+    assert adjacency.dtype == np.int64
+    np.testing.assert_array_equal(adjacency, [[2 ** 32, 1, 2 ** 31 - 1]])
+    assert face_adjacency_from_twins(np.array([[5, 9, 3 * (2 ** 31 - 1)]], dtype=np.int64)).dtype == np.int32
+
+    # CSR rows keep values past 2^31 (e.g. the faces around a vertex of such a mesh)
+    wide = _csr_from_pairs(np.array([0, 0, 1]), np.array([2 ** 31, 1, 2 ** 32]), 2)
+    assert wide.indices.dtype == np.int64
+    assert wide.row(0).tolist() == [1, 2 ** 31] and wide.row(1).tolist() == [2 ** 32]
+    assert _csr_from_pairs(np.array([0, 1]), np.array([2 ** 31 - 1, 0]), 2).indices.dtype == np.int32
@@ -0,0 +1,136 @@
+# /planet_generator/tests/test_face_geometry.py
+
+import math
+import pickle
+import numpy as np
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.face_geometry import (
+    FaceGeometry, compute_face_geometry, FACE_GEOMETRY_FIELDS
+)
+
+
+def _reference_face(v1, v2, v3):
+    """
+    Reference: one face at a time, as the original per-face loop computed it.
+    """
+    center = (v1 + v2 + v3) / 3
+    cross = np.cross(v2 - v1, v3 - v1)
+    length = math.sqrt(float(cross @ cross))
+    normal = cross / length
+    r = math.sqrt(float(center @ center))
+    slope = math.degrees(math.acos(max(-1.0, min(1.0, float(center @ normal) / r))))
+    lat = math.degrees(math.asin(center[2] / r))
+    lon = math.degrees(math.atan2(center[1], center[0]))
+    return center, normal, 0.5 * length, lat, lon, slope
+
+
+def _mesh(subdivisions=3, radius=6371.0):
+    vertices, faces = IcosphereGenerator(radius, subdivisions).generate()
+    return vertices.astype(np.float64), faces
+
+
+def test_matches_per_face_reference():
+    vertices, faces = _mesh()
+    geometry = compute_face_geometry(vertices, faces, chunk_faces=100)
+
+    for face in range(0, len(faces), 37):
+        expected = _reference_face(*vertices[faces[face]])
+        for name, value in zip(FACE_GEOMETRY_FIELDS, expected):
+            np.testing.assert_allclose(getattr(geometry, name)[face], value, rtol=1e-6, atol=1e-4)
+
+
+def test_partial_update_in_place():
+    vertices, faces = _mesh()
+    geometry = compute_face_geometry(vertices, faces)
+    before = {name: getattr(geometry, name).copy() for name in FACE_GEOMETRY_FIELDS}
+
+    # Raise one vertex; only the faces around it change
+    vertices[100] *= 1.01
+    touched = np.flatnonzero((faces == 100).any(axis=1))
+    updated = compute_face_geometry(vertices, faces, face_indices=touched, geometry=geometry)
+    full = compute_face_geometry(vertices, faces)
+
+    assert updated is geometry
+    untouched = np.setdiff1d(np.arange(len(faces)), touched)
+    for name in FACE_GEOMETRY_FIELDS:
+        np.testing.assert_array_equal(getattr(geometry, name), getattr(full, name))
+        np.testing.assert_array_equal(getattr(geometry, name)[untouched], before[name][untouched])
+    assert not np.array_equal(geometry.slopes[touched], before["slopes"][touched])
+
+    subset = compute_face_geometry(vertices, faces, face_indices=touched[::-1])
+    np.testing.assert_array_equal(subset.areas, full.areas[touched[::-1]])
+
+
+def test_lazy_fields(tmp_path):
+    vertices, faces = _mesh()
+    full = compute_face_geometry(vertices, faces)
+    geometry = FaceGeometry(vertices=vertices, faces=faces)
+
+    assert geometry.loaded_fields() == ()
+    np.testing.assert_array_equal(geometry.slopes, full.slopes)
+    assert geometry.loaded_fields() == ("slopes",)
+
+    assert geometry.drop() == full.slopes.nbytes
+    assert geometry.loaded_fields() == ()
+
+    # Rebuildable fields are not pickled; persisted ones are memory-mapped on access
+    geometry.areas
+    restored = pickle.loads(pickle.dumps(geometry))
+    assert restored.loaded_fields() == ()
+    restored.bind(vertices, faces)
+    np.testing.assert_array_equal(restored.areas, full.areas)
+
+    np.save(tmp_path / "normals.npy", full.normals)
+    persisted = FaceGeometry(sources={"normals": str(tmp_path / "normals.npy")})
+    assert isinstance(persisted.normals, np.memmap)
+    np.testing.assert_array_equal(persisted.normals, full.normals)
+
+
+def test_partial_update_on_reloaded_mesh(tmp_path):
+    from planet_generator.io.planet_io import Planet, PlanetIO
+    from planet_generator.planet_mesh import PlanetMesh
+
+    generator = IcosphereGenerator(6371.0, 3)
+    vertices, faces = generator.generate()
+    mesh = PlanetMesh(6371.0, vertices, faces, None, generator.face_adjacency(), subdivisions=3)
+    for name in FACE_GEOMETRY_FIELDS:
+        mesh.geometry.get(name)
+    folder = str(tmp_path / "planet")
+    PlanetIO.save(Planet(name="test", seed=1, mesh=mesh), folder)
+
+    # Persisted fields come back as read-only memory maps; the update materializes and pins them
+    reloaded = PlanetIO.load_mesh(folder)
+    geometry = reloaded.geometry
+    assert isinstance(geometry.areas, np.memmap) and not geometry.areas.flags.writeable
+    moved = np.array(reloaded.vertices)
+    moved[100] *= 1.01
+    touched = np.flatnonzero((faces == 100).any(axis=1))
+    compute_face_geometry(moved, faces, face_indices=touched, geometry=geometry)
+
+    full = compute_face_geometry(moved.astype(np.float64), faces)
+    for name in FACE_GEOMETRY_FIELDS:
+        assert geometry.is_pinned(name)
+        np.testing.assert_allclose(geometry.get(name), full.get(name), rtol=1e-6, atol=1e-3)
+    assert geometry.drop() == 0
+    np.testing.assert_allclose(geometry.slopes[touched], full.slopes[touched], rtol=1e-6, atol=1e-3)
+
+
+def test_set_fields_are_pinned():
+    vertices, faces = _mesh()
+    geometry = FaceGeometry(vertices=vertices, faces=faces)
+    edited = geometry.areas * 2
+    geometry.set("areas", edited)
+    slope_bytes = geometry.slopes.nbytes
+
+    # drop() and trim() only release the computed field; the edit survives
+    assert geometry.drop() == slope_bytes
+    geometry.slopes
+    assert geometry.trim(0) == slope_bytes
+    assert geometry.loaded_fields() == ("areas",)
+    np.testing.assert_array_equal(geometry.areas, edited)
+
+    # The edit is pickled even though the mesh could recompute it
+    restored = pickle.loads(pickle.dumps(geometry))
+    assert restored.is_pinned("areas")
+    np.testing.assert_array_equal(restored.areas, edited)
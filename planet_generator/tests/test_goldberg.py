@@ -0,0 +1,37 @@
+# /planet_generator/tests/test_goldberg.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.goldberg import build_goldberg_tiles
+
+
+@pytest.mark.parametrize("subdivisions", [0, 1, 4])
+def test_goldberg_tiles(subdivisions):
+    """
+    One tile per vertex: 12 pentagons, hexagons elsewhere, counter-clockwise polygons,
+    and neighbors that are the tiles across each polygon edge.
+    """
+    generator = IcosphereGenerator(1.0, subdivisions)
+    vertices, faces = generator.generate()
+    tiles = build_goldberg_tiles(vertices, faces, generator.face_adjacency(), 1.0)
+
+    sides = tiles.sides()
+    assert len(tiles) == len(vertices)
+    assert np.all(sides[:12] == 5)
+    assert np.all(sides[12:] == 6)
+    assert tiles.areas.sum() == pytest.approx(4 * np.pi, rel=0.1)
+
+    for tile in range(len(tiles)):
+        corners = tiles.polygon(tile).astype(np.float64)
+        center = vertices[tile]
+        edges = np.cross(corners - center, np.roll(corners, -1, axis=0) - center)
+        assert np.all(edges @ center > 0)
+
+        polygon_faces = tiles.polygons.row(tile)
+        neighbors = tiles.neighbors.row(tile)
+        for i, neighbor in enumerate(neighbors):
+            shared = set(faces[polygon_faces[i]]) & set(faces[polygon_faces[(i + 1) % len(neighbors)]])
+            assert shared == {tile, neighbor}
+            assert tile in tiles.neighbors.row(neighbor)
@@ -0,0 +1,53 @@
+# /planet_generator/tests/test_hierarchy.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.hierarchy import FaceHierarchy
+
+
+def test_scalar_and_sequence_queries():
+    hierarchy = FaceHierarchy(3)
+    assert hierarchy.face_count(3) == 1280
+
+    parent = hierarchy.parent(1279)
+    assert parent == 319 and type(parent) is int
+    assert type(hierarchy.parent(np.int64(7))) is int
+    np.testing.assert_array_equal(hierarchy.parent([0, 5, 1279]), [0, 1, 319])
+
+    ancestor = hierarchy.ancestor(1279, 0)
+    assert ancestor == 19 and type(ancestor) is int
+    np.testing.assert_array_equal(hierarchy.ancestor([64, 1279], 1), [4, 79])
+    np.testing.assert_array_equal(hierarchy.ancestor(np.array([64, 1279]), 3), [64, 1279])
+
+    start, stop = hierarchy.descendant_range(19, level=0)
+    assert (start, stop) == (1216, 1280) and type(start) is int
+    starts, stops = hierarchy.descendant_range([0, 1], level=2)
+    np.testing.assert_array_equal(starts, [0, 4])
+    np.testing.assert_array_equal(stops, [4, 8])
+
+
+def test_children_default_to_the_level_above_the_mesh():
+    hierarchy = FaceHierarchy(3)
+    np.testing.assert_array_equal(hierarchy.children(319), [1276, 1277, 1278, 1279])
+    np.testing.assert_array_equal(hierarchy.children([0, 2], level=0), [[0, 1, 2, 3], [8, 9, 10, 11]])
+    with pytest.raises(ValueError):
+        hierarchy.children(0, level=3)
+    with pytest.raises(ValueError):
+        FaceHierarchy(0).children(0)
+
+    # Children and parents invert each other at every level
+    for level in range(3):
+        faces = np.arange(hierarchy.face_count(level))
+        np.testing.assert_array_equal(hierarchy.parent(hierarchy.children(faces, level), level + 1),
+                                      np.repeat(faces[:, None], 4, axis=1))
+
+
+def test_invalid_levels():
+    hierarchy = FaceHierarchy(2)
+    with pytest.raises(ValueError):
+        hierarchy.parent(0, level=0)
+    with pytest.raises(ValueError):
+        hierarchy.ancestor(0, 3)
+    with pytest.raises(ValueError):
+        FaceHierarchy(-1)
@@ -0,0 +1,80 @@
+# /planet_generator/tests/test_icosphere.py
+
+import math
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+
+
+def _recursive_reference(radius, subdivisions):
+    """
+    Reference: the original list-and-dictionary construction, one midpoint at a time.
+    """
+    def normalize(v):
+        x, y, z = v
+        length = math.sqrt(x * x + y * y + z * z)
+        return (x / length * radius, y / length * radius, z / length * radius)
+
+    phi = (1 + math.sqrt(5)) / 2
+    vertices = [normalize(v) for v in [
+        (-1, phi, 0), (1, phi, 0), (-1, -phi, 0), (1, -phi, 0),
+        (0, -1, phi), (0, 1, phi), (0, -1, -phi), (0, 1, -phi),
+        (phi, 0, -1), (phi, 0, 1), (-phi, 0, -1), (-phi, 0, 1),
+    ]]
+    faces = [
+        (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+        (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+        (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+        (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)
+    ]
+    for _ in range(subdivisions):
+        cache = {}
+
+        def midpoint(i, j):
+            key = tuple(sorted((i, j)))
+            if key not in cache:
+                a, b = vertices[i], vertices[j]
+                vertices.append(normalize(((a[0] + b[0]) / 2, (a[1] + b[1]) / 2, (a[2] + b[2]) / 2)))
+                cache[key] = len(vertices) - 1
+            return cache[key]
+
+        children = []
+        for i1, i2, i3 in faces:
+            a, b, c = midpoint(i1, i2), midpoint(i2, i3), midpoint(i3, i1)
+            children.extend([(i1, a, c), (i2, b, a), (i3, c, b), (a, b, c)])
+        faces = children
+    vertices = [normalize(v) for v in vertices]
+    return np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.int32)
+
+
+@pytest.mark.parametrize("subdivisions", [0, 1, 2, 3, 4, 5])
+@pytest.mark.parametrize("radius", [1.0, 6371.0])
+def test_matches_recursive_construction_bit_for_bit(radius, subdivisions):
+    vertices, faces = IcosphereGenerator(radius, subdivisions).generate()
+    expected_vertices, expected_faces = _recursive_reference(radius, subdivisions)
+    assert vertices.dtype == np.float32 and faces.dtype == np.int32
+    assert np.array_equal(vertices, expected_vertices)
+    assert np.array_equal(faces, expected_faces)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize("subdivisions", [0, 1, 3, 4])
+def test_parallel_patches_match_serial_generation(workers, subdivisions):
+    serial = IcosphereGenerator(6371.0, subdivisions)
+    serial_vertices, serial_faces = serial.generate()
+    parallel = IcosphereGenerator(6371.0, subdivisions, workers=workers)
+    vertices, faces = parallel.generate()
+    assert vertices.shape == serial_vertices.shape and faces.dtype == np.int32
+
+    # Same positions, numbered differently: permutation[i] is the patch-layout id of serial vertex i
+    serial_order = np.lexsort(serial_vertices.T)
+    order = np.lexsort(vertices.T)
+    np.testing.assert_array_equal(vertices[order], serial_vertices[serial_order])
+    permutation = np.empty(len(order), dtype=np.int64)
+    permutation[serial_order] = order
+    assert len(np.unique(permutation)) == len(permutation)
+
+    # Same faces in the same hierarchical order, corner for corner, and the same adjacency
+    np.testing.assert_array_equal(faces, permutation[serial_faces])
+    np.testing.assert_array_equal(parallel.face_adjacency(), serial.face_adjacency())
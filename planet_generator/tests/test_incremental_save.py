@@ -0,0 +1,86 @@
+# /planet_generator/tests/test_incremental_save.py
+
+import os
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.io.mesh_format import MESH_DIR
+from planet_generator.io.planet_io import Planet, PlanetIO
+from planet_generator.planet_mesh import PlanetMesh
+
+
+def _planet():
+    generator = IcosphereGenerator(100.0, 3)
+    vertices, faces = generator.generate()
+    mesh = PlanetMesh(100.0, vertices, faces, None, generator.face_adjacency(), subdivisions=3)
+    return Planet(name="test", seed=1, mesh=mesh,
+                  elevation=np.linspace(0.0, 1.0, len(faces)),
+                  cratons=np.arange(len(faces), dtype=np.int32) % 7,
+                  biome_tags=["ocean", "desert"])
+
+
+def _mtimes(folder):
+    paths = [os.path.join(root, name) for root, _, names in os.walk(folder) for name in names]
+    return {os.path.relpath(path, folder): os.stat(path).st_mtime_ns for path in paths}
+
+
+@pytest.mark.parametrize("codec", [None, "zlib-1"])
+def test_only_changed_layers_are_rewritten(tmp_path, codec):
+    folder = str(tmp_path / "planet")
+    PlanetIO.save(_planet(), folder, codec=codec)
+    planet = PlanetIO.load(folder)
+    assert planet.saved_folder == folder and not planet.dirty
+    before = _mtimes(folder)
+
+    # A save with nothing changed touches no file
+    PlanetIO.save(planet, folder, codec=codec)
+    assert _mtimes(folder) == before
+
+    # Assigning a layer marks it dirty: only it (and the metadata holding its checksum) is written
+    planet.cratons = np.asarray(planet.cratons) + 1
+    assert planet.dirty == {"cratons"}
+    PlanetIO.save(planet, folder, codec=codec)
+    changed = {path for path, mtime in _mtimes(folder).items() if before.get(path) != mtime}
+    assert changed == {"cratons.npy" if codec is None else "cratons.chunks", "metadata.json"}
+    assert not planet.dirty
+
+    # In-place edits are flagged explicitly
+    planet.elevation = np.array(planet.elevation)
+    PlanetIO.save(planet, folder, codec=codec)
+    planet.elevation[:10] = -5.0
+    planet.mark_dirty("elevation")
+    PlanetIO.save(planet, folder, codec=codec)
+    reloaded = PlanetIO.load(folder)
+    np.testing.assert_array_equal(reloaded.elevation, planet.elevation)
+    np.testing.assert_array_equal(reloaded.cratons, planet.cratons)
+    assert reloaded.biome_tags == ["ocean", "desert"]
+
+
+def test_unflagged_edits_and_new_planet_objects(tmp_path):
+    folder = str(tmp_path / "planet")
+    PlanetIO.save(_planet(), folder)
+    vertices_path = os.path.join(folder, MESH_DIR, "vertices.npy")
+    mesh_time = os.stat(vertices_path).st_mtime_ns
+
+    # A fresh Planet with the same content is compared by checksum and nothing is rewritten
+    planet = _planet()
+    elevation_time = os.stat(os.path.join(folder, "elevation.npy")).st_mtime_ns
+    PlanetIO.save(planet, folder)
+    assert os.stat(os.path.join(folder, "elevation.npy")).st_mtime_ns == elevation_time
+    assert os.stat(vertices_path).st_mtime_ns == mesh_time
+
+    # An in-place edit without mark_dirty is only caught by verify=True
+    planet.elevation[0] = 42.0
+    PlanetIO.save(planet, folder)
+    assert PlanetIO.load(folder).elevation[0] == 0.0
+    PlanetIO.save(planet, folder, verify=True)
+    assert PlanetIO.load(folder).elevation[0] == 42.0
+
+    # Dropped layers are removed rather than left to be loaded with the next mesh
+    planet.cratons = None
+    planet.biome_tags = None
+    PlanetIO.save(planet, folder)
+    loaded = PlanetIO.load(folder)
+    assert loaded.cratons is None and loaded.biome_tags is None
+    assert not os.path.exists(os.path.join(folder, "cratons.npy"))
@@ -0,0 +1,52 @@
+# /planet_generator/tests/test_layer_stats.py
+
+import math
+import numpy as np
+
+from planet_generator.planet_utils.layer_stats import layer_statistics
+
+QUANTILES = (0.0, 0.1, 0.5, 0.9, 1.0)
+
+
+def test_matches_float64_reference():
+    rng = np.random.default_rng(0)
+    values = rng.normal(1e4, 1.0, 200_000).astype(np.float32)
+    values[::97] = np.nan
+    finite = values[np.isfinite(values)].astype(np.float64)
+
+    stats = layer_statistics(values, quantiles=QUANTILES, chunk_size=10_000)
+
+    assert stats.count == len(finite) and stats.missing == len(values) - len(finite)
+    assert math.isclose(stats.total, math.fsum(finite), rel_tol=1e-15)
+    assert math.isclose(stats.mean, finite.mean(), rel_tol=1e-14)
+    assert math.isclose(stats.std, finite.std(), rel_tol=1e-9)
+    assert (stats.minimum, stats.maximum) == (finite.min(), finite.max())
+    assert stats.histogram.sum() == len(finite)
+    for q in QUANTILES:
+        assert stats.quantiles[q] == np.quantile(finite, q, method="inverted_cdf")
+
+
+def test_weighted_quantiles(tmp_path):
+    rng = np.random.default_rng(1)
+    values = rng.gamma(2.0, 3.0, 50_000)
+    weights = rng.random(50_000)
+    np.save(tmp_path / "values.npy", values)
+    mapped = np.load(tmp_path / "values.npy", mmap_mode="r")
+
+    stats = layer_statistics(mapped, weights, quantiles=QUANTILES, chunk_size=7_000)
+
+    mean = np.sum(weights * values) / weights.sum()
+    assert math.isclose(stats.mean, mean, rel_tol=1e-12)
+    assert math.isclose(stats.std, math.sqrt(np.sum(weights * (values - mean) ** 2) / weights.sum()), rel_tol=1e-9)
+    order = np.argsort(values)
+    cumulative = np.cumsum(weights[order])
+    for q in QUANTILES:
+        expected = values[order][min(np.searchsorted(cumulative, q * cumulative[-1]), len(values) - 1)]
+        assert stats.quantiles[q] == expected
+
+
+def test_zero_weights_have_no_mean():
+    values = np.array([1.0, 2.0, np.nan, 4.0])
+    stats = layer_statistics(values, np.zeros(4), quantiles=())
+    assert stats.count == 3 and stats.total == 7.0 and stats.weight_total == 0.0
+    assert math.isnan(stats.mean) and math.isnan(stats.std)
@@ -0,0 +1,51 @@
+# /planet_generator/tests/test_locate.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.face_geometry import compute_face_geometry
+from planet_generator.geometry.locate import FaceLocator, lat_lon_to_unit
+from planet_generator.planet_mesh import PlanetMesh
+
+
+@pytest.mark.parametrize("subdivisions", [0, 1, 4])
+def test_matches_brute_force(subdivisions):
+    """
+    The descent finds the face whose three edge planes the point is inside of.
+    """
+    generator = IcosphereGenerator(3.0, subdivisions)
+    vertices, faces = generator.generate()
+    locator = FaceLocator(vertices, faces, subdivisions, generator.face_adjacency(), chunk_points=500)
+    points = np.random.default_rng(0).normal(size=(5000, 3))
+
+    located, barycentric = locator.locate_points(points)
+
+    corners = vertices.astype(np.float64)[faces]
+    planes = np.cross(corners, np.roll(corners, -1, axis=1))
+    expected = np.argmax(np.einsum("fkc,pc->pfk", planes, points).min(axis=2), axis=1)
+    np.testing.assert_array_equal(located, expected)
+    np.testing.assert_allclose(barycentric.sum(axis=1), 1.0)
+    assert barycentric.min() >= 0
+
+
+def test_planet_mesh_locate():
+    generator = IcosphereGenerator(6371.0, 3)
+    vertices, faces = generator.generate()
+    geometry = compute_face_geometry(vertices, faces)
+    mesh = PlanetMesh(6371.0, vertices, faces, geometry, generator.face_adjacency(), subdivisions=3)
+
+    # Every face center lies in its own face, a third of the way to each corner
+    located, barycentric = mesh.locate(geometry.latitudes, geometry.longitudes)
+    np.testing.assert_array_equal(located, np.arange(len(faces)))
+    np.testing.assert_allclose(barycentric, 1 / 3, atol=1e-4)
+
+    # Barycentric interpolation reproduces a linear field at the point's projection on the face
+    face, weights = mesh.locate(12.5, -40.0)
+    point = lat_lon_to_unit(12.5, -40.0)[0]
+    projected = (vertices[faces[face[0]]] * weights[0][:, None]).sum(axis=0)
+    np.testing.assert_allclose(projected / np.linalg.norm(projected), point, atol=1e-6)
+
+    geodesic = PlanetMesh(1.0, vertices, faces, None, None, frequency=8)
+    with pytest.raises(ValueError):
+        geodesic.locate(0.0, 0.0)
@@ -0,0 +1,62 @@
+# /planet_generator/tests/test_mesh_format.py
+
+import os
+import numpy as np
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.io.mesh_format import MESH_DIR, open_mesh_folder, save_mesh_folder, verify_mesh_folder
+from planet_generator.io.planet_io import Planet, PlanetIO
+from planet_generator.io.topology_store import TopologyStore
+from planet_generator.planet_mesh import PlanetMesh
+
+
+def _mesh(subdivisions=3, radius=500.0):
+    generator = IcosphereGenerator(radius, subdivisions)
+    vertices, faces = generator.generate()
+    return PlanetMesh(radius, vertices, faces, None, generator.face_adjacency(), subdivisions=subdivisions)
+
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    mesh = _mesh()
+    mesh.geometry.areas  # evaluated fields are saved; the others stay lazy
+    save_mesh_folder(mesh, str(tmp_path))
+
+    loaded = open_mesh_folder(str(tmp_path))
+    for name in ("vertices", "faces", "adjacency"):
+        assert isinstance(getattr(loaded, name), np.memmap)
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(mesh, name))
+    assert loaded.geometry.is_persisted("areas") and not loaded.geometry.is_persisted("normals")
+    assert isinstance(loaded.geometry.areas, np.memmap)
+    np.testing.assert_array_equal(loaded.geometry.normals, mesh.geometry.normals)
+    assert loaded.subdivisions == 3 and loaded.radius == 500.0
+    assert verify_mesh_folder(str(tmp_path)) == []
+
+    # Re-saving a mapped mesh leaves its files alone
+    vertices_path = os.path.join(tmp_path, MESH_DIR, "vertices.npy")
+    before = os.stat(vertices_path).st_mtime_ns
+    save_mesh_folder(loaded, str(tmp_path))
+    assert os.stat(vertices_path).st_mtime_ns == before
+
+    # Corruption is caught by the checksums
+    data = np.load(vertices_path, mmap_mode="r+")
+    data[0, 0] += 1.0
+    data.flush()
+    del data
+    assert verify_mesh_folder(str(tmp_path)) == ["vertices"]
+
+
+def test_planet_with_shared_topology(tmp_path):
+    store = TopologyStore(str(tmp_path / "topology"))
+    topology = store.get_or_build(2)
+    mesh = PlanetMesh(100.0, topology.scaled_vertices(100.0), topology.faces, None, topology.adjacency,
+                      subdivisions=2, topology_key=topology.key)
+    planet_folder = str(tmp_path / "planet")
+    PlanetIO.save(Planet(name="test", seed=1, mesh=mesh, elevation=np.arange(len(topology.faces), dtype=np.float32)),
+                  planet_folder)
+
+    # Faces and adjacency stay in the store; only planet-specific arrays are written
+    assert sorted(os.listdir(os.path.join(planet_folder, MESH_DIR))) == ["manifest.json", "vertices.npy"]
+    loaded = PlanetIO.load_mesh(planet_folder, topology_store=store)
+    assert loaded.topology_key == topology.key
+    np.testing.assert_array_equal(loaded.faces, topology.faces)
+    np.testing.assert_array_equal(loaded.vertices, mesh.vertices)
@@ -0,0 +1,57 @@
+# /planet_generator/tests/test_mesh_stream.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.face_geometry import FACE_GEOMETRY_FIELDS, compute_face_geometry
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.io.mesh_format import open_mesh_folder
+from planet_generator.io import mesh_stream
+from planet_generator.io.mesh_stream import open_streamed_mesh, stream_planet_mesh, streamed_index_dtypes
+
+
+@pytest.mark.parametrize("max_chunk_faces", [16, 4 ** 10])
+def test_streamed_mesh_equals_in_memory_generation(tmp_path, max_chunk_faces):
+    folder = str(tmp_path)
+    stream_planet_mesh(folder, 6371.0, 3, max_chunk_faces=max_chunk_faces)
+    mesh = open_streamed_mesh(folder)
+
+    # Streaming uses the patch layout, so it matches patch generation array for array
+    generator = IcosphereGenerator(6371.0, 3, workers=1)
+    vertices, faces = generator.generate()
+    np.testing.assert_array_equal(mesh.vertices, vertices)
+    np.testing.assert_array_equal(mesh.faces, faces)
+    np.testing.assert_array_equal(mesh.adjacency, generator.face_adjacency())
+    assert isinstance(mesh.adjacency, np.memmap)
+
+    geometry = compute_face_geometry(vertices, faces)
+    for name in FACE_GEOMETRY_FIELDS:
+        np.testing.assert_array_equal(mesh.geometry.get(name), geometry.get(name))
+
+    reopened = open_mesh_folder(folder)
+    np.testing.assert_array_equal(reopened.adjacency, mesh.adjacency)
+
+
+def test_patch_adjacency_concatenates_to_the_full_table():
+    generator = IcosphereGenerator(1.0, 4)
+    generator.generate()
+    rows = list(generator.iter_patch_adjacency(2))
+    assert len(rows) == 320 and rows[0].shape == (16, 3)
+    np.testing.assert_array_equal(np.concatenate(rows), generator.face_adjacency())
+
+
+def test_index_dtypes_widen_with_the_mesh(tmp_path, monkeypatch):
+    assert streamed_index_dtypes(13) == {"faces": np.int32, "adjacency": np.int32}
+    # 20 * 4^14 faces and 10 * 4^14 + 2 vertices both pass 2^31
+    assert streamed_index_dtypes(14) == {"faces": np.int64, "adjacency": np.int64}
+
+    # With counts that need int64, the files are created wide and filled without wrapping
+    monkeypatch.setattr(mesh_stream, "streamed_index_dtypes", lambda subdivisions: {
+        "faces": np.int64, "adjacency": np.int64})
+    folder = str(tmp_path)
+    stream_planet_mesh(folder, 1.0, 2, max_chunk_faces=16)
+    mesh = open_streamed_mesh(folder)
+    assert mesh.faces.dtype == np.int64 and mesh.adjacency.dtype == np.int64
+    generator = IcosphereGenerator(1.0, 2, workers=1)
+    generator.generate()
+    np.testing.assert_array_equal(mesh.adjacency, generator.face_adjacency())
@@ -0,0 +1,38 @@
+# /planet_generator/tests/test_mesh_tools.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.planet_utils.mesh_tools import validate_mesh
+
+
+@pytest.mark.parametrize("subdivisions, frequency", [(0, None), (4, None), (None, 5)])
+def test_validate_clean_mesh(subdivisions, frequency):
+    vertices, faces = IcosphereGenerator(6371.0, subdivisions or 0, frequency=frequency).generate()
+    report = validate_mesh(vertices, faces, 6371.0, 1e-3)
+
+    assert report.ok, report.problems()
+    assert report.euler_characteristic == 2
+    assert report.edges == 3 * len(faces) // 2
+    assert report.valence_5_vertices == 12
+
+
+def test_validate_broken_mesh():
+    vertices, faces = IcosphereGenerator(6371.0, 2).generate()
+    vertices = vertices.copy()
+    faces = faces.copy()
+    vertices[3] *= 1.01                 # off-sphere
+    faces[5] = faces[5, [0, 2, 1]]      # flipped
+    faces[7, 1] = faces[7, 0]           # degenerate
+
+    report = validate_mesh(vertices, faces[:-1], 6371.0, 1e-3)
+
+    assert not report.ok
+    assert report.off_sphere_vertices == 1
+    assert report.examples["off-sphere vertices"] == [3]
+    assert report.inward_faces == 1 and report.examples["inward faces"] == [5]
+    assert report.degenerate_faces == 1 and report.examples["degenerate faces"] == [7]
+    assert report.inconsistent_edges > 0
+    assert report.boundary_edges > 0
+    assert report.euler_characteristic != 2
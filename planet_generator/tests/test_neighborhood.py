@@ -0,0 +1,68 @@
+# /planet_generator/tests/test_neighborhood.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.goldberg import build_goldberg_tiles
+from planet_generator.geometry.neighborhood import NeighborhoodIndex, k_disks, k_rings
+
+
+def _bfs_distances(neighbors, center, k):
+    """
+    Reference: plain breadth-first search from one cell, as a {cell: distance} dict.
+    """
+    distances = {center: 0}
+    frontier = [center]
+    for distance in range(1, k + 1):
+        next_frontier = []
+        for cell in frontier:
+            for neighbor in neighbors[cell]:
+                neighbor = int(neighbor)
+                if neighbor >= 0 and neighbor not in distances:
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+
+@pytest.mark.parametrize("subdivisions, k", [(1, 2), (3, 1), (3, 4), (4, 6)])
+def test_face_disks_match_bfs(subdivisions, k):
+    """
+    Template replay and frontier expansion both reproduce per-face BFS, nearest first.
+    """
+    generator = IcosphereGenerator(1.0, subdivisions)
+    _, faces = generator.generate()
+    adjacency = generator.face_adjacency()
+    index = NeighborhoodIndex(faces, adjacency)
+    centers = np.arange(len(faces))
+
+    disks, distances = index.disks(centers, k, return_distances=True)
+    rings = index.rings(centers, k)
+    frontier = k_disks(adjacency, centers, k)
+    np.testing.assert_array_equal(disks.offsets, frontier.offsets)
+    np.testing.assert_array_equal(disks.indices, frontier.indices)
+
+    for center in centers[::7]:
+        expected = _bfs_distances(adjacency, int(center), k)
+        row = slice(disks.offsets[center], disks.offsets[center + 1])
+        assert list(zip(disks.indices[row].tolist(), distances[row].tolist())) == \
+            sorted(expected.items(), key=lambda item: (item[1], item[0]))
+        assert rings.row(center).tolist() == sorted(f for f, d in expected.items() if d == k)
+
+
+def test_tile_disks_are_hexagonal():
+    """
+    On Goldberg tiles, a hexagon far from the pentagons has 3k(k + 1) + 1 tiles in its k-disk.
+    """
+    generator = IcosphereGenerator(1.0, 4)
+    vertices, faces = generator.generate()
+    tiles = build_goldberg_tiles(vertices, faces, generator.face_adjacency(), 1.0)
+
+    disks = k_disks(tiles.neighbors, np.arange(len(tiles)), 3)
+    counts = disks.counts()
+    assert counts.max() == 3 * 3 * 4 + 1
+    assert np.all(counts[:12] < counts.max())
+    rows = [tiles.neighbors.row(tile) for tile in range(len(tiles))]
+    expected = sorted(t for t, d in _bfs_distances(rows, 100, 2).items() if d == 2)
+    assert k_rings(tiles.neighbors, [100], 2).row(0).tolist() == expected
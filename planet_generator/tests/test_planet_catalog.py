@@ -0,0 +1,80 @@
+# /planet_generator/tests/test_planet_catalog.py
+
+import os
+import json
+import shutil
+import sqlite3
+import time
+import numpy as np
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.io.planet_catalog import CATALOG_FILE, PlanetCatalog
+from planet_generator.io.planet_io import Planet, PlanetIO
+from planet_generator.planet_mesh import PlanetMesh
+
+
+def _save(directory, name, seed, subdivisions=2):
+    generator = IcosphereGenerator(1000.0, subdivisions)
+    vertices, faces = generator.generate()
+    mesh = PlanetMesh(1000.0, vertices, faces, None, generator.face_adjacency(), subdivisions=subdivisions)
+    elevation = mesh.geometry.centers[:, 2].astype(np.float32)
+    PlanetIO.save(Planet(name=name, seed=seed, mesh=mesh, elevation=elevation), os.path.join(directory, name))
+
+
+def test_saves_are_cataloged_and_queryable(tmp_path):
+    directory = str(tmp_path)
+    _save(directory, "Arrakis", 7, subdivisions=3)
+    _save(directory, "Caladan", 3)
+    _save(directory, "Giedi", 5)
+    catalog = PlanetCatalog(directory)
+    assert os.path.exists(os.path.join(directory, CATALOG_FILE))
+
+    assert [e.name for e in catalog.list()] == ["Giedi", "Caladan", "Arrakis"]
+    assert catalog.most_recent().path == os.path.join(directory, "Giedi")
+    assert [e.name for e in catalog.list("seed", descending=False)] == ["Caladan", "Giedi", "Arrakis"]
+    assert [e.name for e in catalog.list(name="ADA")] == ["Caladan"]
+    assert [e.name for e in catalog.list(min_faces=1000)] == ["Arrakis"]
+
+    entry = catalog.get("Arrakis")
+    assert (entry.seed, entry.radius, entry.subdivisions, entry.face_count) == (7, 1000.0, 3, 1280)
+    assert entry.disk_bytes > 0 and entry.data_bytes > 0
+    assert entry.thumbnail.startswith(b"\x89PNG") and catalog.list()[0].thumbnail is None
+
+
+def test_repair_and_rebuild(tmp_path):
+    directory = str(tmp_path)
+    for name, seed in (("A", 1), ("B", 2), ("C", 3)):
+        _save(directory, name, seed)
+    catalog = PlanetCatalog(directory)
+
+    # Folders removed, edited or copied in outside the game
+    shutil.rmtree(os.path.join(directory, "A"))
+    metadata_path = os.path.join(directory, "B", "metadata.json")
+    with open(metadata_path, "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+    metadata["seed"] = 99
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f)
+    os.utime(metadata_path, (time.time() + 5, time.time() + 5))
+    shutil.copytree(os.path.join(directory, "C"), os.path.join(directory, "D"))
+
+    assert catalog.repair() == (1, 1, 1)
+    assert catalog.get("B").seed == 99
+    assert sorted(e.folder for e in catalog.list()) == ["B", "C", "D"]
+    assert catalog.repair() == (0, 0, 0)
+
+    os.remove(catalog.path)
+    assert catalog.rebuild() == 3 and len(catalog.list()) == 3
+
+
+def test_listing_thousands(tmp_path):
+    catalog = PlanetCatalog(str(tmp_path))
+    catalog.list()
+    with sqlite3.connect(catalog.path) as conn:
+        conn.executemany("INSERT INTO planets (folder, name, seed, face_count, saved_time, thumbnail) "
+                         "VALUES (?, ?, ?, ?, ?, ?)",
+                         [(f"p{i}", f"Planet {i}", i, 20 * 4 ** (i % 8), float(i), b"\0" * 2000) for i in range(5000)])
+    entries = catalog.list()
+    assert len(entries) == 5000 and entries[0].folder == "p4999"
+    expected = sum(1 for i in range(5000) if "Planet 12" in f"Planet {i}" and i % 8 <= 3)
+    assert len(catalog.list(name="Planet 12", max_faces=20 * 4 ** 3)) == expected
@@ -0,0 +1,59 @@
+# /planet_generator/tests/test_region.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.operators import MeshOperators
+from planet_generator.geometry.region import OUTSIDE
+from planet_generator.planet_mesh import PlanetMesh
+
+
+@pytest.fixture(scope="module")
+def mesh():
+    generator = IcosphereGenerator(6371.0, 4)
+    vertices, faces = generator.generate()
+    return PlanetMesh(6371.0, vertices, faces, None, generator.face_adjacency(), subdivisions=4)
+
+
+def test_region_topology(mesh):
+    face_ids = mesh.faces_within(30.0, 60.0, 1500.0).indices
+    region = mesh.region(face_ids[::-1])
+
+    np.testing.assert_array_equal(region.face_ids, np.sort(face_ids))
+    np.testing.assert_array_equal(region.vertex_ids[region.faces], mesh.faces[region.face_ids])
+    np.testing.assert_array_equal(region.vertices, mesh.vertices[region.vertex_ids])
+
+    # Interior edges map to local neighbors, boundary edges keep the global face across them
+    global_neighbors = mesh.adjacency[region.face_ids]
+    inside = region.adjacency != OUTSIDE
+    np.testing.assert_array_equal(region.face_ids[region.adjacency[inside]], global_neighbors[inside])
+    np.testing.assert_array_equal(region.outer_adjacency[~inside], global_neighbors[~inside])
+    assert not np.isin(region.outer_adjacency[~inside], region.face_ids).any()
+    assert 0 < len(region.boundary_faces) < len(region)
+
+    # The local mesh works with the regular tools: a constant field is harmonic
+    operators = MeshOperators(region.vertices, region.faces, region.adjacency)
+    np.testing.assert_allclose(operators.laplacian(np.ones(len(region))), 0.0, atol=1e-9)
+    np.testing.assert_allclose(region.geometry.areas, mesh.geometry.areas[region.face_ids], rtol=1e-6)
+
+
+def test_gather_and_scatter(mesh):
+    elevation = np.arange(len(mesh.faces), dtype=np.float64)
+
+    # A coarse face's descendants are contiguous: gathers are views into the planet layer
+    region = mesh.region_of(7, level=1)
+    assert region.is_contiguous and len(region) == 4 ** 3
+    view = region.gather(elevation)
+    assert np.shares_memory(view, elevation)
+    view += 1.0
+    assert elevation[region.face_ids[0]] == region.face_ids[0] + 1
+
+    scattered = mesh.region([5, 900, 3])
+    values = scattered.gather(elevation) * 2
+    scattered.scatter(elevation, values)
+    np.testing.assert_array_equal(elevation[[3, 5, 900]], [6.0, 10.0, 1800.0])
+
+    heights = np.zeros(len(mesh.vertices))
+    scattered.scatter_vertices(heights, np.ones(len(scattered.vertex_ids)))
+    assert heights.sum() == len(np.unique(mesh.faces[[3, 5, 900]]))
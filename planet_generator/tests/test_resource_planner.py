@@ -0,0 +1,89 @@
+# /planet_generator/tests/test_resource_planner.py
+
+import collections
+import pytest
+
+from planet_generator.planet_utils import resource_planner
+from planet_generator.planet_utils.resource_planner import (
+    DEFAULT_BASE_RSS_BYTES, DEFAULT_RSS_BYTES_PER_FACE, DEFAULT_SECONDS_PER_FACE, PIPELINE_STAGES,
+    estimate_generation, mesh_counts, record_benchmark_run
+)
+
+MB = 1024 ** 2
+
+
+def _estimate(tmp_path, **kwargs):
+    kwargs.setdefault("benchmark_path", str(tmp_path / "runs.jsonl"))
+    return estimate_generation(output_dir=str(tmp_path), **kwargs)
+
+
+def test_default_model_without_recorded_runs(tmp_path):
+    estimate = _estimate(tmp_path, subdivisions=5, stream=False)
+    n_vertices, n_faces = mesh_counts(5)
+    assert (estimate.vertices, estimate.faces) == (n_vertices, n_faces) == (10242, 20480)
+    assert estimate.calibrated_runs == 0 and estimate.mode == "memory"
+    assert estimate.stage_seconds == pytest.approx(
+        {stage: DEFAULT_SECONDS_PER_FACE["memory"][stage] * n_faces for stage in PIPELINE_STAGES})
+    assert estimate.peak_rss_bytes == int(DEFAULT_BASE_RSS_BYTES + DEFAULT_RSS_BYTES_PER_FACE["memory"] * n_faces)
+    assert estimate.status == "ok" and estimate.summary()["estimate_status"] == "OK (uncalibrated)"
+
+    streamed = _estimate(tmp_path, subdivisions=5, stream=True, chunk_faces=1024)
+    assert streamed.mode == "streamed" and set(streamed.stage_seconds) == {"stream", "save"}
+    assert streamed.peak_rss_bytes == int(DEFAULT_BASE_RSS_BYTES + DEFAULT_RSS_BYTES_PER_FACE["streamed"] * 1024)
+    # Streaming writes adjacency.npy too, and the disk estimate is the sum of every array written
+    assert streamed.array_bytes["adjacency"] == estimate.array_bytes["adjacency"] == 12 * n_faces
+    assert streamed.disk_bytes == sum(streamed.array_bytes.values())
+
+
+def test_index_arrays_widen_past_int32(tmp_path):
+    # At level 14 face and vertex ids pass 2^31, so faces and adjacency take 8 bytes per entry
+    estimate = _estimate(tmp_path, subdivisions=14, stream=True)
+    n_vertices, n_faces = mesh_counts(14)
+    assert estimate.array_bytes["faces"] == estimate.array_bytes["adjacency"] == 24 * n_faces
+    assert estimate.disk_bytes == 12 * n_vertices + (24 + 24 + 40) * n_faces
+    assert _estimate(tmp_path, subdivisions=13, stream=True).array_bytes["adjacency"] == 12 * mesh_counts(13)[1]
+
+
+def test_fitted_model_from_recorded_runs(tmp_path):
+    path = str(tmp_path / "benchmarks" / "generation_runs.jsonl")
+    record_benchmark_run("memory", 1000, {"mesh": 1.0, "save": 0.5}, 110 * MB + 2_000_000, 110 * MB, path=path)
+    record_benchmark_run("memory", 3000, {"mesh": 3.0, "save": 1.5}, 90 * MB + 6_000_000, 90 * MB, path=path)
+    record_benchmark_run("memory", 5000, {"mesh": 5.0}, None, None, path=path)
+    record_benchmark_run("streamed", 10 ** 6, {"stream": 1000.0}, 10 ** 12, 10 ** 6, chunk_faces=4096, path=path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    estimate = _estimate(tmp_path, subdivisions=4, stream=False, benchmark_path=path)
+    n_faces = mesh_counts(4)[1]
+    assert estimate.calibrated_runs == 3
+    # Ratio of sums per stage; stages without runs keep their defaults
+    assert estimate.stage_seconds["mesh"] == pytest.approx(1e-3 * n_faces)
+    assert estimate.stage_seconds["save"] == pytest.approx(0.5e-3 * n_faces)
+    assert estimate.stage_seconds["adjacency"] == pytest.approx(DEFAULT_SECONDS_PER_FACE["memory"]["adjacency"] * n_faces)
+    # Median base plus growth per face; runs without memory figures are left out of the fit
+    assert estimate.peak_rss_bytes == int(110 * MB + 2000 * n_faces)
+    assert estimate.summary()["estimate_status"] == "OK"
+
+    streamed = _estimate(tmp_path, subdivisions=4, stream=True, chunk_faces=4096, benchmark_path=path)
+    assert streamed.calibrated_runs == 1
+    assert streamed.stage_seconds["stream"] == pytest.approx(1e-3 * n_faces)
+
+
+def test_status_classification(tmp_path, monkeypatch):
+    peak = _estimate(tmp_path, subdivisions=5, stream=False).peak_rss_bytes
+    assert _estimate(tmp_path, subdivisions=5, stream=False, memory_budget_mb=2 * peak / MB).status == "ok"
+
+    warn = _estimate(tmp_path, subdivisions=5, stream=False, memory_budget_mb=1.1 * peak / MB)
+    assert warn.status == "warn" and "close to the budget" in warn.messages[0]
+
+    refuse = _estimate(tmp_path, subdivisions=5, stream=False, memory_budget_mb=0.9 * peak / MB)
+    assert refuse.status == "refuse" and "exceeds the budget" in refuse.messages[0]
+
+    # Long runs warn; a full disk refuses
+    monkeypatch.setitem(resource_planner.PLANET_CONFIG, "time_warning_seconds", 0.5)
+    slow = _estimate(tmp_path, subdivisions=5, stream=False)
+    assert slow.status == "warn" and "expected to take" in slow.messages[0]
+    usage = collections.namedtuple("usage", "total used free")
+    monkeypatch.setattr(resource_planner.shutil, "disk_usage", lambda path: usage(0, 0, 1000))
+    full = _estimate(tmp_path, subdivisions=5, stream=False)
+    assert full.status == "refuse" and "free" in full.messages[-1]
@@ -0,0 +1,61 @@
+# /planet_generator/tests/test_spatial_index.py
+
+import numpy as np
+import pytest
+
+from planet_generator.geometry.icosphere import IcosphereGenerator
+from planet_generator.geometry.face_geometry import compute_face_geometry
+from planet_generator.geometry.spatial_index import SpatialIndex
+
+RADIUS = 6371.0
+
+
+@pytest.fixture(scope="module")
+def centers():
+    vertices, faces = IcosphereGenerator(RADIUS, 4).generate()
+    return compute_face_geometry(vertices, faces).centers
+
+
+def _great_circle(queries, centers):
+    """
+    Reference: great-circle distances from every query to every center, shape (n, m).
+    """
+    q = queries / np.linalg.norm(queries, axis=1)[:, None]
+    c = centers.astype(np.float64)
+    c /= np.linalg.norm(c, axis=1)[:, None]
+    return RADIUS * np.arctan2(np.linalg.norm(np.cross(q[:, None], c[None]), axis=2), q @ c.T)
+
+
+@pytest.mark.parametrize("distance", [50.0, 800.0, 7000.0, 30000.0])
+def test_radius_matches_brute_force(centers, distance):
+    index = SpatialIndex.build(centers, radius=RADIUS)
+    queries = np.random.default_rng(0).normal(size=(200, 3))
+    found, distances = index.query_radius(queries, distance, return_distances=True)
+    reference = _great_circle(queries, centers)
+
+    for i in range(len(queries)):
+        row = slice(found.offsets[i], found.offsets[i + 1])
+        assert set(found.indices[row].tolist()) == set(np.flatnonzero(reference[i] <= distance).tolist())
+        np.testing.assert_allclose(distances[row], reference[i][found.indices[row]], atol=1e-2)
+        assert np.all(np.diff(distances[row]) >= 0)
+
+
+def test_nearest_matches_brute_force(centers):
+    index = SpatialIndex.build(centers, radius=RADIUS)
+    queries = np.random.default_rng(1).normal(size=(300, 3))
+    ids, distances = index.query_nearest(queries, 6)
+    reference = np.sort(_great_circle(queries, centers), axis=1)[:, :6]
+    np.testing.assert_allclose(distances, reference, atol=1e-2)
+
+
+def test_subset_and_memory_mapped_copy(centers, tmp_path):
+    coast = np.arange(0, len(centers), 5)
+    index = SpatialIndex.build(centers[coast], ids=coast, radius=RADIUS)
+    queries = np.random.default_rng(2).normal(size=(50, 3))
+    ids, _ = index.query_nearest(queries)
+    assert np.all(ids % 5 == 0)
+
+    index.save(str(tmp_path / "index"))
+    loaded = SpatialIndex.load(str(tmp_path / "index"))
+    assert isinstance(loaded.points, np.memmap)
+    np.testing.assert_array_equal(loaded.query_nearest(queries)[0], ids)
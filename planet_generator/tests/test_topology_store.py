@@ -0,0 +1,73 @@
+# /planet_generator/tests/test_topology_store.py
+
+import os
+import shutil
+import numpy as np
+import pytest
+
+from planet_generator.io import topology_store
+from planet_generator.io.topology_store import TopologyStore, topology_key, topology_spec
+
+
+def test_keys_are_stable():
+    # Saved meshes refer to these keys; a change here orphans every stored topology
+    assert topology_key(topology_spec(2)) == "icosphere-2-6089b4f390d2"
+    assert topology_key(topology_spec(2, layout="patch")) == "icosphere-2-748cfb8c905d"
+    assert topology_key(topology_spec(frequency=5)) == "geodesic-5-4f571afbd632"
+    spec = topology_spec(2)
+    assert topology_key(dict(reversed(list(spec.items())))) == topology_key(spec)
+    assert topology_key(topology_spec(frequency=5, subdivisions=2)) == topology_key(topology_spec(frequency=5))
+
+
+def test_builds_once_and_writes_atomically(tmp_path, monkeypatch):
+    store = TopologyStore(str(tmp_path))
+    topology = store.get_or_build(2)
+    assert os.listdir(str(tmp_path)) == [topology.key]
+    assert isinstance(topology.faces, np.memmap) and len(topology.faces) == 320
+
+    # A stale temporary folder from a crashed build is replaced, never loaded
+    patch_key = topology_key(topology_spec(2, layout="patch"))
+    os.makedirs(os.path.join(str(tmp_path), f"{patch_key}.tmp-{os.getpid()}", "junk"))
+    assert not store.contains(patch_key)
+
+    # Another process renaming its copy into place first wins; ours is discarded
+    rename = os.rename
+
+    def lose_race(source, target):
+        shutil.copytree(source, target)
+        raise OSError("Directory not empty")
+
+    monkeypatch.setattr(os, "rename", lose_race)
+    patch = store.get_or_build(2, workers=1)
+    monkeypatch.setattr(os, "rename", rename)
+    assert patch.key == patch_key and patch.spec["layout"] == "patch"
+    assert sorted(os.listdir(str(tmp_path))) == sorted([topology.key, patch_key])
+    assert store.get_or_build(2, workers=3).key == patch_key
+
+
+@pytest.mark.parametrize("layout", [None, "patch"])
+def test_rebuilds_in_the_saved_layout_after_a_version_bump(tmp_path, monkeypatch, layout):
+    store = TopologyStore(str(tmp_path))
+    monkeypatch.setattr(topology_store, "TOPOLOGY_FORMAT_VERSION", topology_store.TOPOLOGY_FORMAT_VERSION - 1)
+    old = store.get_or_build(2, layout=layout)
+    monkeypatch.undo()
+
+    # The old entry no longer loads; the rebuild keeps the vertex numbering it was saved with
+    with pytest.raises(ValueError):
+        store.load(old.key)
+    rebuilt = store.load_or_rebuild(old.key, subdivisions=2)
+    assert rebuilt.key == topology_key(topology_spec(2, layout=layout)) != old.key
+    np.testing.assert_array_equal(rebuilt.unit_vertices, old.unit_vertices)
+    np.testing.assert_array_equal(rebuilt.faces, old.faces)
+
+    # Without the old folder, the layout is recovered from the key itself
+    shutil.rmtree(store.path_for(old.key))
+    shutil.rmtree(store.path_for(rebuilt.key))
+    assert store.load_or_rebuild(old.key, subdivisions=2).spec.get("layout") == layout
+
+
+def test_refuses_keys_of_another_mesh(tmp_path):
+    store = TopologyStore(str(tmp_path))
+    with pytest.raises(ValueError):
+        store.load_or_rebuild(topology_key(topology_spec(3, layout="patch")), subdivisions=2)
+    assert os.listdir(str(tmp_path)) == []
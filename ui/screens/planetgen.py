@@ -3,12 +3,15 @@
 import os
 import json
 import time
+import sqlite3
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy, QFrame
 )
 from PySide6.QtCore import Qt
 from logger.logger import LoggerFactory
+from planet_generator.io.planet_catalog import PlanetCatalog
 from planet_generator.planet_utils.mesh_tools import estimate_optimal_subdivision, summarize_mesh_geometry
+from planet_generator.planet_utils.resource_planner import estimate_generation
 from ui.widgets.planetgen_control_panel import PlanetGenControlPanel
 from ui.widgets.planetgen_geometry_panel import PlanetGenGeometryPanel
 from ui.widgets.planet_preview_widget import PlanetPreviewWidget
@@ -18,15 +21,25 @@ logger = LoggerFactory("planetgen_screen").get_logger()
 
 
 def find_most_recent_planet_folder():
-    base_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "gamedata", "planets")
-    if not os.path.exists(base_dir):
+    """
+    Returns the folder of the most recently saved planet, from the planet catalog (built from
+    the planet folders the first time), or None if there are no saved planets.
+    """
+    catalog = PlanetCatalog()
+    if not os.path.exists(catalog.directory):
         return None
-    subdirs = [
-        os.path.join(base_dir, name) for name in os.listdir(base_dir)
-        if os.path.isdir(os.path.join(base_dir, name))
-    ]
-    subdirs = sorted(subdirs, key=lambda d: os.path.getmtime(os.path.join(d, "metadata.json")) if os.path.exists(os.path.join(d, "metadata.json")) else 0, reverse=True)
-    return subdirs[0] if subdirs else None
+    try:
+        if not catalog.exists():
+            catalog.repair()
+        entry = catalog.most_recent()
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning(f"Could not read the planet catalog: {e}")
+        return None
+    if entry is not None and not os.path.isdir(entry.path):
+        # Deleted outside the game: resync once and retry
+        catalog.repair()
+        entry = catalog.most_recent()
+    return entry.path if entry else None
 
 
 def load_most_recent_metadata(folder):
@@ -83,8 +96,7 @@ class PlanetGenScreen(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         recent_folder = find_most_recent_planet_folder()
-        mesh_path = os.path.join(recent_folder, "mesh.joblib") if recent_folder else ""
-        self.planet_preview = PlanetPreviewWidget(mesh_path)
+        self.planet_preview = PlanetPreviewWidget(recent_folder or "")
         layout.addWidget(self.planet_preview)
         self.planet_preview.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
@@ -182,6 +194,9 @@ class PlanetGenScreen(QWidget):
             "suggested_subdiv_level": optimal_level
         }
 
+        # Predicted memory, disk and time for generating at this level
+        summary_data.update(estimate_generation(subdivisions).summary())
+
         self.summary_panel.update_summary(summary_data)
 
         # Reposition floating summary panel
@@ -198,16 +213,17 @@ class PlanetGenScreen(QWidget):
         self.title_label.setText(f"Planet Preview: {name}")
                 # Wait for the new mesh file to appear (max 2 sec)
         planet_name = self.control_panel.name_input.text()
-        base_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "gamedata", "planets")
-        mesh_path = os.path.join(base_dir, planet_name, "mesh.joblib")
+        # metadata.json exists once a save completed
+        planet_folder = os.path.join(PlanetCatalog().directory, planet_name)
+        metadata_path = os.path.join(planet_folder, "metadata.json")
 
         wait_time = 0
-        while not os.path.exists(mesh_path) and wait_time < 2.0:
+        while not os.path.exists(metadata_path) and wait_time < 2.0:
             time.sleep(0.1)
             wait_time += 0.1
 
-        if os.path.exists(mesh_path):
-            self.planet_preview.set_mesh_path(mesh_path)
+        if os.path.exists(metadata_path):
+            self.planet_preview.set_planet_folder(planet_folder)
             self.planet_preview.reload_mesh()
         else:
-            logger.warning(f"Mesh file not found after generation: {mesh_path}")
+            logger.warning(f"Planet not found after generation: {planet_folder}")
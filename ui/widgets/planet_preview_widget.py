@@ -4,25 +4,25 @@ from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from OpenGL.GL import *
 from OpenGL.GLU import gluPerspective
 import numpy as np
-import joblib
 import os
 
 
 from logger.logger import LoggerFactory
+from planet_generator.io.planet_io import PlanetIO
 
 class PlanetPreviewWidget(QOpenGLWidget):
     """
     OpenGL widget to preview a generated planet mesh.
-    Loads from joblib .mesh format and renders as triangle mesh.
+    Loads the mesh of a saved planet folder and renders as triangle mesh.
     """
 
-    def __init__(self, mesh_path, parent=None):
+    def __init__(self, planet_folder, parent=None):
         """
-        Initializes the planet preview widget with a mesh file path.
+        Initializes the planet preview widget with a saved planet folder ("" for none yet).
         """
         super().__init__(parent)
         self.mesh_ready = False
-        self.mesh_path = mesh_path
+        self.planet_folder = planet_folder
         self.vertices = None
         self.faces = None
         self.wireframe_mode = False
@@ -63,12 +63,12 @@ class PlanetPreviewWidget(QOpenGLWidget):
         self.draw_planet()
 
     def load_mesh(self):
-        """Loads the mesh from a .mesh file using joblib."""
-        if not os.path.exists(self.mesh_path):
-            self.logger.warning(f"Mesh file not found: {self.mesh_path}")
+        """Loads the mesh of the planet folder, including shared topology."""
+        if not self.planet_folder or not os.path.exists(os.path.join(self.planet_folder, "metadata.json")):
+            self.logger.warning(f"No saved planet in: {self.planet_folder}")
             return
 
-        mesh = joblib.load(self.mesh_path)
+        mesh = PlanetIO.load_mesh(self.planet_folder)
         self.vertices = mesh.vertices  # shape (n, 3), np.ndarray
         self.faces = mesh.faces       # shape (m, 3), np.ndarray
         self.logger.info(f"Loaded mesh with {len(self.vertices)} vertices and {len(self.faces)} faces")
@@ -86,11 +86,11 @@ class PlanetPreviewWidget(QOpenGLWidget):
                 glVertex3f(float(v[0]), float(v[1]), float(v[2]))
         glEnd()
 
-    def set_mesh_path(self, new_path: str):
+    def set_planet_folder(self, planet_folder: str):
         """
-        Updates the internal mesh path before reloading.
+        Updates the planet folder before reloading.
         """
-        self.mesh_path = new_path
+        self.planet_folder = planet_folder
 
     def reload_mesh(self):
         self.load_mesh()
@@ -2,12 +2,13 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QLabel,
-    QFormLayout, QDoubleSpinBox, QSpinBox, QCheckBox, QFrame, QLineEdit
+    QFormLayout, QDoubleSpinBox, QSpinBox, QCheckBox, QFrame, QLineEdit, QMessageBox
 )
 from PySide6.QtCore import Qt, Signal
 from logger.logger import LoggerFactory
 from planet_generator.planet_config import PLANET_CONFIG
 from planet_generator.planet_utils.mesh_tools import estimate_optimal_subdivision
+from planet_generator.planet_utils.resource_planner import estimate_generation, log_estimate
 import subprocess
 import sys
 import os
@@ -159,6 +160,20 @@ class PlanetGenControlPanel(QWidget):
         )
         script_path = os.path.normpath(script_path)
 
+        # Preflight: refuse requests that would exhaust memory, confirm slow or borderline ones
+        estimate = estimate_generation(subdivisions)
+        log_estimate(estimate, logger)
+        if estimate.status == "refuse":
+            QMessageBox.critical(self, "Planet Too Large", "\n".join(estimate.messages))
+            return
+        if estimate.status == "warn":
+            answer = QMessageBox.question(
+                self, "Large Planet", "\n".join(estimate.messages) + "\n\nGenerate anyway?"
+            )
+            if answer != QMessageBox.Yes:
+                logger.info("Planet generation cancelled after resource warning.")
+                return
+
         logger.info(f"Running planet generator script with name={name}, seed={seed}, radius={radius}, subdivisions={subdivisions}")
 
         try:
@@ -44,11 +44,11 @@ class PlanetGenGeometryPanel(QWidget):
         content = "\n".join(lines)
         self.textbox.setText(content)
 
-        # Resize textbox height to match number of lines (up to 8)
+        # Resize textbox height to match number of lines (up to 16)
         font_metrics = self.textbox.fontMetrics()
         line_height = font_metrics.lineSpacing()
         line_count = content.count("\n") + 1
-        max_lines = 8
+        max_lines = 16
 
         height = min(line_count, max_lines) * line_height + 12
         self.textbox.setMinimumHeight(height)